@@ -1,6 +1,7 @@
 ﻿import asyncio
 import copy
 import functools
+from collections import OrderedDict
 import sqlite3
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -50,6 +51,21 @@ INACTIVITY_DECAY_DEFAULT_DAYS = 7
 INACTIVITY_DECAY_DEFAULT_AMOUNT = 10.0
 INACTIVITY_DECAY_DEFAULT_FLOOR = DEFAULT_START_ELO
 INACTIVITY_DECAY_SWEEP_SECONDS = 600
+HISTORY_MAX_PAGES = 10
+PROFILE_PAGE_SIZE = 5
+THREAD_DELETE_CONCURRENCY = 5
+CONFIG_CACHE_MAX_ENTRIES = 256
+
+
+@functools.lru_cache(maxsize=2048)
+def _fmt_started(recorded_at: str) -> Optional[str]:
+    try:
+        started = datetime.fromisoformat(recorded_at)
+    except ValueError:
+        return None
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=timezone.utc)
+    return started.astimezone(TZ).strftime("%m/%d/%Y %H:%M")
 
 
 async def category_autocomplete(interaction: discord.Interaction, current: str):
@@ -130,6 +146,16 @@ async def override_active_match_autocomplete(interaction: discord.Interaction, c
         return []
     return await cog.override_active_match_autocomplete(interaction, current)
 
+
+def _mod_check():
+    async def predicate(interaction: discord.Interaction) -> bool:
+        cog = interaction.client.get_cog("LeaderboardCog")
+        if cog is None or not isinstance(interaction.user, discord.Member) or not cog.has_mod_permissions(interaction.user):
+            raise app_commands.CheckFailure("You do not have permission.")
+        return True
+
+    return app_commands.check(predicate)
+
 class LeaderboardCog(commands.Cog):
     leaderboard = app_commands.Group(name="leaderboard", description="Leaderboard commands", guild_only=True)
 
@@ -153,6 +179,8 @@ class LeaderboardCog(commands.Cog):
         self.bans = {}
         self.decay_state = {}
         self._last_decay_sweep = None
+        self._config_gen = 0
+        self._cfg_cache: "OrderedDict[Tuple[int, str], Tuple[int, Dict[str, Any]]]" = OrderedDict()
         self.load_all()
 
     def cog_unload(self):
@@ -166,6 +194,7 @@ class LeaderboardCog(commands.Cog):
             self._config_save_task.cancel()
             self._config_save_task = None
         self._config_save_pending = False
+        self.storage.close()
 
     def load_all(self):
         if not hasattr(self, "_config_save_task"):
@@ -173,6 +202,7 @@ class LeaderboardCog(commands.Cog):
             self._config_save_pending = False
         if not hasattr(self, "_active_fight_save_tasks"):
             self._active_fight_save_tasks = {}
+        self._bump_config_gen()
         snapshot = self.storage.load_all()
         self.guild_configs = snapshot["guild_configs"]
         self.players_data = snapshot["players"]
@@ -364,7 +394,7 @@ class LeaderboardCog(commands.Cog):
                 continue
             for category, entry in list(active_map.items()):
                 if not isinstance(entry, dict):
-                    active_map[category] = {"matches": {}, "deletions": []}
+                    active_map[category] = {"matches": {}, "deletions": [], "thread_to_match": {}}
                     changed_any = True
                     continue
                 matches = entry.get("matches")
@@ -389,7 +419,10 @@ class LeaderboardCog(commands.Cog):
                 if not isinstance(deletions, list):
                     deletions = []
                     changed_any = True
-                active_map[category] = {"matches": matches, "deletions": deletions}
+                thread_to_match = {
+                    payload["thread_id"]: match_id for match_id, payload in matches.items() if payload.get("thread_id")
+                }
+                active_map[category] = {"matches": matches, "deletions": deletions, "thread_to_match": thread_to_match}
         if changed_any:
             self._schedule_config_save()
 
@@ -398,6 +431,18 @@ class LeaderboardCog(commands.Cog):
             raise app_commands.CheckFailure("Server-only commands")
         return True
 
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        if not isinstance(error, app_commands.CheckFailure):
+            return
+        message = str(error) or "You do not have permission."
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+        except Exception:
+            logger.debug("Failed to report check failure for command %s", getattr(interaction.command, "name", None))
+
     def parse_time(self, s: str) -> Optional[float]:
         try:
             s = s.strip()
@@ -966,8 +1011,26 @@ class LeaderboardCog(commands.Cog):
         else:
             current_dt = current_dt.astimezone(timezone.utc)
 
+        def worker() -> Dict[int, datetime]:
+            activity: Dict[int, datetime] = {}
+            for row in self.storage.iter_match_history(gid, category):
+                token = self._outcome_token(str(row.get("result") or ""))
+                if token is None:
+                    continue
+                try:
+                    uid = int(row.get("user_id"))
+                except Exception:
+                    continue
+                row_dt = self._parse_recorded_datetime(row.get("date"))
+                if row_dt is None:
+                    continue
+                previous = activity.get(uid)
+                if previous is None or row_dt > previous:
+                    activity[uid] = row_dt
+            return activity
+
         try:
-            rows = await asyncio.to_thread(self.storage.load_match_history, gid, category)
+            last_activity = await asyncio.to_thread(worker)
         except Exception as exc:
             if self._is_database_corruption_error(exc):
                 logger.error(
@@ -976,23 +1039,9 @@ class LeaderboardCog(commands.Cog):
                     category,
                     exc,
                 )
+                await asyncio.to_thread(self.storage.repair_match_indexes)
                 return {"changed_players": 0, "total_decay": 0.0, "eligible_players": 0}
             raise
-        last_activity: Dict[int, datetime] = {}
-        for row in rows:
-            token = self._outcome_token(str(row.get("result") or ""))
-            if token is None:
-                continue
-            try:
-                uid = int(row.get("user_id"))
-            except Exception:
-                continue
-            row_dt = self._parse_recorded_datetime(row.get("date"))
-            if row_dt is None:
-                continue
-            previous = last_activity.get(uid)
-            if previous is None or row_dt > previous:
-                last_activity[uid] = row_dt
 
         gid_s = str(gid)
         safe_cat = normalize_category(category)
@@ -1048,6 +1097,22 @@ class LeaderboardCog(commands.Cog):
             "eligible_players": eligible_players,
         }
 
+    def _bump_config_gen(self) -> None:
+        self._config_gen = getattr(self, "_config_gen", 0) + 1
+
+    def _cached_config(self, key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+        cached = self._cfg_cache.get(key)
+        if cached is None or cached[0] != self._config_gen:
+            return None
+        self._cfg_cache.move_to_end(key)
+        return cached[1]
+
+    def _store_cached_config(self, key: Tuple[int, str], value: Dict[str, Any]) -> None:
+        self._cfg_cache[key] = (self._config_gen, value)
+        self._cfg_cache.move_to_end(key)
+        while len(self._cfg_cache) > CONFIG_CACHE_MAX_ENTRIES:
+            self._cfg_cache.popitem(last=False)
+
     def get_gconfig(self, gid: int):
         return self.guild_configs.get(str(gid), {})
 
@@ -1061,9 +1126,19 @@ class LeaderboardCog(commands.Cog):
             self.guild_configs[gid_s].setdefault("category_modes", {})
 
     def get_leaderboard_config(self, gid: int, category: str) -> Dict[str, Any]:
+        safe = normalize_category(category)
+        key = (gid, safe)
+        cached = self._cached_config(key)
+        if cached is not None:
+            return cached
+        board = self._load_leaderboard_config(gid, category, safe)
+        if board:
+            self._store_cached_config(key, board)
+        return board
+
+    def _load_leaderboard_config(self, gid: int, category: str, safe: str) -> Dict[str, Any]:
         gid_s = str(gid)
         data = self.guild_configs.get(gid_s, {})
-        safe = normalize_category(category)
         boards = data.get("leaderboards", {})
         board = boards.get(safe)
         if board:
@@ -1185,10 +1260,11 @@ class LeaderboardCog(commands.Cog):
         cat_map = self.active_fights.setdefault(gid_s, {})
         bucket = cat_map.get(category)
         if not isinstance(bucket, dict):
-            bucket = {"matches": {}, "deletions": []}
+            bucket = {"matches": {}, "deletions": [], "thread_to_match": {}}
             cat_map[category] = bucket
         bucket.setdefault("matches", {})
         bucket.setdefault("deletions", [])
+        bucket.setdefault("thread_to_match", {})
         return bucket
 
     def get_match(self, gid: int, category: str, match_id: str) -> Optional[Dict[str, Any]]:
@@ -1214,7 +1290,10 @@ class LeaderboardCog(commands.Cog):
     async def delete_match(self, gid: int, category: str, match_id: str):
         bucket = self.get_active_bucket(gid, category)
         if match_id in bucket["matches"]:
-            bucket["matches"].pop(match_id)
+            match = bucket["matches"].pop(match_id)
+            thread_id = match.get("thread_id")
+            if thread_id and bucket["thread_to_match"].get(thread_id) == match_id:
+                bucket["thread_to_match"].pop(thread_id, None)
             await self.save_active_fights_for(gid)
 
     def find_active_match_for(self, gid: int, user_id: int, exclude: Optional[str] = None) -> Optional[Tuple[str, str, Dict[str, Any]]]:
@@ -1332,10 +1411,12 @@ class LeaderboardCog(commands.Cog):
     def find_match_by_thread(self, gid: int, thread_id: int) -> Optional[Tuple[str, str, Dict[str, Any]]]:
         cat_map = self.active_fights.get(str(gid), {})
         for category, bucket in cat_map.items():
-            matches = bucket.get("matches", {})
-            for match_id, data in matches.items():
-                if data.get("thread_id") == thread_id:
-                    return category, match_id, data
+            match_id = bucket.get("thread_to_match", {}).get(thread_id)
+            if match_id is None:
+                continue
+            data = bucket.get("matches", {}).get(match_id)
+            if data and data.get("thread_id") == thread_id:
+                return category, match_id, data
         return None
 
     def find_match_between(self, gid: int, category: str, player_a: int, player_b: int) -> Optional[Tuple[str, Dict[str, Any]]]:
@@ -1428,18 +1509,18 @@ class LeaderboardCog(commands.Cog):
         return entry["label"] if entry else "Speedrun"
 
     def user_snapshot_name_for(self, gid: int, uid: int):
-        meta = self.players_meta.get(str(gid), {})
-        if str(uid) in meta and "name" in meta[str(uid)]:
-            return meta[str(uid)]["name"]
+        entry = self.players_meta.get(str(gid), {}).get(uid)
+        if entry and "name" in entry:
+            return entry["name"]
         u = self.client.get_user(uid)
         if u:
             return u.display_name
         return f"User {uid}"
 
     def user_snapshot_avatar_for(self, gid: int, uid: int):
-        meta = self.players_meta.get(str(gid), {})
-        if str(uid) in meta and "avatar" in meta[str(uid)]:
-            return meta[str(uid)]["avatar"]
+        entry = self.players_meta.get(str(gid), {}).get(uid)
+        if entry and "avatar" in entry:
+            return entry["avatar"]
         u = self.client.get_user(uid)
         if u and u.avatar:
             return u.avatar.url
@@ -1703,6 +1784,7 @@ class LeaderboardCog(commands.Cog):
         match.pop("thread_message_id", None)
         bucket = self.get_active_bucket(guild.id, category)
         bucket["matches"][match_id] = match
+        bucket["thread_to_match"][thread.id] = match_id
         await self.save_active_fights_for(guild.id)
         return thread
 
@@ -1964,7 +2046,7 @@ class LeaderboardCog(commands.Cog):
         bucket["matches"][match_id] = match
         await self.save_active_fights_for(guild_id)
         gid_s = str(guild_id)
-        self.players_meta.setdefault(gid_s, {})[str(interaction.user.id)] = {
+        self.players_meta.setdefault(gid_s, {})[interaction.user.id] = {
             "name": interaction.user.display_name,
             "avatar": interaction.user.avatar.url if interaction.user.avatar else None,
         }
@@ -2143,7 +2225,7 @@ class LeaderboardCog(commands.Cog):
         bucket["matches"][match_id] = match
         await self.save_active_fights_for(guild.id)
         gid_s = str(guild.id)
-        self.players_meta.setdefault(gid_s, {})[str(interaction.user.id)] = {
+        self.players_meta.setdefault(gid_s, {})[interaction.user.id] = {
             "name": interaction.user.display_name,
             "avatar": interaction.user.avatar.url if interaction.user.avatar else None,
         }
@@ -2291,8 +2373,8 @@ class LeaderboardCog(commands.Cog):
         loser_name = loser_member.display_name if isinstance(loser_member, discord.Member) else getattr(loser_member, "name", f"User {loser_id}")
         winner_avatar = winner_member.display_avatar.url if winner_member and getattr(winner_member, "display_avatar", None) else None
         loser_avatar = loser_member.display_avatar.url if loser_member and getattr(loser_member, "display_avatar", None) else None
-        self.players_meta.setdefault(str(guild.id), {})[str(winner_id)] = {"name": winner_name, "avatar": winner_avatar}
-        self.players_meta.setdefault(str(guild.id), {})[str(loser_id)] = {"name": loser_name, "avatar": loser_avatar}
+        self.players_meta.setdefault(str(guild.id), {})[winner_id] = {"name": winner_name, "avatar": winner_avatar}
+        self.players_meta.setdefault(str(guild.id), {})[loser_id] = {"name": loser_name, "avatar": loser_avatar}
         await self.persist_player_meta(guild.id)
         self.players_data[str(guild.id)][safe_cat] = players
         await self.update_leaderboard_message_for(guild.id, category)
@@ -2588,9 +2670,15 @@ class LeaderboardCog(commands.Cog):
         return await asyncio.to_thread(worker)
 
     def get_profile_bio(self, gid: int, user_id: int) -> Optional[str]:
-        return self.bios.get(str(gid), {}).get(GLOBAL_BIO_KEY, {}).get(str(user_id))
+        return self.bios.get(str(gid), {}).get(GLOBAL_BIO_KEY, {}).get(user_id)
 
-    async def build_profile_content(self, gid: int, category: str, member: discord.abc.User) -> Tuple[discord.Embed, List[List[str]]]:
+    async def build_profile_content(
+        self,
+        gid: int,
+        category: str,
+        member: discord.abc.User,
+        page_index: int = 0,
+    ) -> Tuple[discord.Embed, List[str], int, int]:
         players = self.load_players_for(gid, category)
         stats = players.get(member.id, {"elo": DEFAULT_START_ELO, "wins": 0, "losses": 0})
         rank_info = self.get_player_rank(gid, category, member.id)
@@ -2608,34 +2696,41 @@ class LeaderboardCog(commands.Cog):
         bio = self.get_profile_bio(gid, member.id)
         if not bio:
             safe_current = normalize_category(category)
-            bio = self.bios.get(str(gid), {}).get(safe_current, {}).get(str(member.id))
+            bio = self.bios.get(str(gid), {}).get(safe_current, {}).get(member.id)
         if bio:
             embed.add_field(name="Bio", value=bio, inline=False)
         lines: List[str] = []
         latest_delta: Optional[float] = None
+        total_pages = 0
+
+        def worker() -> Tuple[int, int, List[Dict[str, Any]], List[Dict[str, Any]]]:
+            total = self.storage.count_member_matches(gid, category, member.id)
+            page_count = -(-total // PROFILE_PAGE_SIZE)
+            index = max(0, min(page_index, page_count - 1))
+            rows = self.storage.load_member_match_page(
+                gid, category, member.id, PROFILE_PAGE_SIZE, index * PROFILE_PAGE_SIZE
+            )
+            latest = rows[:1] if index == 0 else self.storage.load_member_match_page(gid, category, member.id, 1)
+            return page_count, index, rows, latest
+
         try:
-            rows = await asyncio.to_thread(self.storage.load_match_history, gid, category)
-            entries: List[Tuple[datetime, str, float]] = []
+            total_pages, page_index, rows, latest = await asyncio.to_thread(worker)
             for row in rows:
                 formatted = self.format_match_entry(gid, category, row, perspective_id=member.id)
                 if formatted:
-                    recorded_at, label = formatted
-                    try:
-                        delta_value = float(row.get("elo_change", "0"))
-                    except (TypeError, ValueError):
-                        delta_value = 0.0
-                    entries.append((recorded_at, label, delta_value))
-            entries.sort(key=lambda item: item[0], reverse=True)
-            if entries:
-                latest_delta = entries[0][2]
-            lines = [item[1] for item in entries]
+                    lines.append(formatted[1])
+            if latest:
+                try:
+                    latest_delta = float(latest[0].get("elo_change", "0"))
+                except (TypeError, ValueError):
+                    latest_delta = 0.0
         except Exception:
+            page_index = 0
             logger.debug("Failed reading match history for profile in guild %s board %s", gid, category)
         if latest_delta is not None and abs(latest_delta) > 0.0001 and len(embed.fields) > 0:
             elo_with_delta = f"{stats['elo']:.1f} ({self.format_elo_delta(latest_delta)})"
             embed.set_field_at(0, name="Elo", value=elo_with_delta, inline=True)
-        pages = chunk_list(lines, 5) if lines else []
-        return embed, pages
+        return embed, lines, page_index, total_pages
 
     @leaderboard.command(name="iwon")
     @app_commands.describe(result="Your completion time or score")
@@ -3202,11 +3297,11 @@ class LeaderboardCog(commands.Cog):
             -elo_delta,
         )
 
-        self.players_meta.setdefault(gid_s, {})[str(winner.id)] = {
+        self.players_meta.setdefault(gid_s, {})[winner.id] = {
             "name": winner.display_name,
             "avatar": winner.avatar.url if winner.avatar else None,
         }
-        self.players_meta.setdefault(gid_s, {})[str(loser.id)] = {
+        self.players_meta.setdefault(gid_s, {})[loser.id] = {
             "name": loser.display_name,
             "avatar": loser.avatar.url if loser.avatar else None,
         }
@@ -3613,6 +3708,7 @@ class LeaderboardCog(commands.Cog):
         legacy_categories = config_entry.setdefault("categories", [])
         config_entry["categories"] = [entry for entry in legacy_categories if entry.lower() != name.lower()]
         config_entry.setdefault("category_modes", {}).pop(safe, None)
+        self._bump_config_gen()
         await asyncio.to_thread(self.storage.save_guild_configs, copy.deepcopy(self.guild_configs))
         await asyncio.to_thread(self.storage.delete_category, gid, name)
         await interaction.followup.send(f"Removed {name} from this server.", ephemeral=True)
@@ -3635,6 +3731,7 @@ class LeaderboardCog(commands.Cog):
     )
     @app_commands.autocomplete(category=category_autocomplete)
     @app_commands.choices(mode=MODE_TYPE_CHOICES)
+    @_mod_check()
     async def editboard(
         self,
         interaction: discord.Interaction,
@@ -3656,8 +3753,6 @@ class LeaderboardCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         board_cfg = self.get_leaderboard_config(gid, category)
         if not board_cfg:
@@ -3712,6 +3807,7 @@ class LeaderboardCog(commands.Cog):
                         break
                 if not replaced:
                     legacy_categories.append(new_name_clean)
+                self._bump_config_gen()
                 await asyncio.to_thread(self.storage.save_guild_configs, copy.deepcopy(self.guild_configs))
                 current_name = new_name_clean
                 board_cfg = board_data
@@ -3833,12 +3929,11 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="challenge-timeout")
     @app_commands.describe(category="Leaderboard name", enabled="Whether pending direct challenges expire automatically")
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def challenge_timeout(self, interaction: discord.Interaction, category: str, enabled: bool):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         board_cfg = self.get_leaderboard_config(gid, category)
         if not board_cfg:
@@ -3854,12 +3949,11 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="anti-farm")
     @app_commands.describe(category="Leaderboard name", enabled="Whether anti-farm challenge rotation rules are enforced")
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def anti_farm(self, interaction: discord.Interaction, category: str, enabled: bool):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         board_cfg = self.get_leaderboard_config(gid, category)
         if not board_cfg:
@@ -3882,6 +3976,7 @@ class LeaderboardCog(commands.Cog):
         apply_now="Apply current decay settings immediately",
     )
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def inactivity_decay(
         self,
         interaction: discord.Interaction,
@@ -3895,8 +3990,6 @@ class LeaderboardCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         board_cfg = self.get_leaderboard_config(gid, category)
         if not board_cfg:
@@ -4020,7 +4113,7 @@ class LeaderboardCog(commands.Cog):
                     await self.ensure_match_thread(guild, category, m, message)
                 await self.refresh_match_message(gid, category, mid)
                 gid_s = str(gid)
-                self.players_meta.setdefault(gid_s, {})[str(interaction.user.id)] = {
+                self.players_meta.setdefault(gid_s, {})[interaction.user.id] = {
                     "name": interaction.user.display_name,
                     "avatar": interaction.user.avatar.url if interaction.user.avatar else None,
                 }
@@ -4063,7 +4156,7 @@ class LeaderboardCog(commands.Cog):
             self.client.add_view(view, message_id=message.id)
         except Exception:
             logger.debug("Failed to register view for match %s in guild %s", match_id, gid)
-        self.players_meta.setdefault(str(gid), {})[str(interaction.user.id)] = {
+        self.players_meta.setdefault(str(gid), {})[interaction.user.id] = {
             "name": interaction.user.display_name,
             "avatar": interaction.user.avatar.url if interaction.user.avatar else None,
         }
@@ -4166,11 +4259,11 @@ class LeaderboardCog(commands.Cog):
             self.client.add_view(view, message_id=message.id)
         except Exception:
             logger.debug("Failed to register view for match %s in guild %s", match_id, gid)
-        self.players_meta.setdefault(str(gid), {})[str(interaction.user.id)] = {
+        self.players_meta.setdefault(str(gid), {})[interaction.user.id] = {
             "name": interaction.user.display_name,
             "avatar": interaction.user.avatar.url if interaction.user.avatar else None,
         }
-        self.players_meta.setdefault(str(gid), {})[str(opponent.id)] = {
+        self.players_meta.setdefault(str(gid), {})[opponent.id] = {
             "name": opponent.display_name,
             "avatar": opponent.avatar.url if opponent.avatar else None,
         }
@@ -4187,6 +4280,7 @@ class LeaderboardCog(commands.Cog):
     )
     @app_commands.choices(action=PLAYER_BAN_ACTION_CHOICES, scope=PLAYER_BAN_SCOPE_CHOICES)
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def player_ban(
         self,
         interaction: discord.Interaction,
@@ -4199,8 +4293,6 @@ class LeaderboardCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
 
         action_key = str(action.value).strip().lower()
         scope_key = str(scope.value).strip().lower()
@@ -4388,12 +4480,11 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="removeplayer")
     @app_commands.describe(category="Leaderboard name", player="Player to remove")
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def removeplayer(self, interaction: discord.Interaction, category: str, player: discord.Member):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         board_cfg = self.get_leaderboard_config(gid, category)
         if not board_cfg:
@@ -4414,12 +4505,11 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="purge-threads")
     @app_commands.describe(category="Optional leaderboard name to target; omit to scan all")
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def purge_threads(self, interaction: discord.Interaction, category: Optional[str] = None):
         await interaction.response.defer(ephemeral=True)
         if interaction.guild is None:
             return await interaction.followup.send("Server-only command.", ephemeral=True)
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         gid = interaction.guild.id
         gid_s = str(gid)
         cat_map_all = self.active_fights.get(gid_s, {})
@@ -4467,6 +4557,7 @@ class LeaderboardCog(commands.Cog):
                     missing_threads.append(f"{cat_key}:{match_id}")
                 match["thread_id"] = None
                 matches[match_id] = match
+                cat_map.get("thread_to_match", {}).pop(thread_id, None)
                 updated_deletions = [entry for entry in updated_deletions if entry.get("thread_id") != thread_id]
             cat_map["matches"] = matches
             cat_map["deletions"] = updated_deletions
@@ -4504,12 +4595,13 @@ class LeaderboardCog(commands.Cog):
         if not boards:
             return await interaction.followup.send("No leaderboards configured.", ephemeral=True)
         initial_board = await self.most_active_board(gid, boards, target.id)
-        embed, pages = await self.build_profile_content(gid, initial_board, target)
-        history = "\n".join(pages[0]) if pages else "No matches recorded."
+        embed, lines, _, total_pages = await self.build_profile_content(gid, initial_board, target)
+        history = "\n".join(lines) if lines else "No matches recorded."
         embed.description = history
-        embed.set_footer(text=f"Page 1/{max(len(pages), 1)}")
+        embed.set_footer(text=f"Page 1/{max(total_pages, 1)}")
         view = ProfileView(self, gid, target, boards, initial_board)
-        view.pages = pages
+        view.page_lines = lines
+        view.total_pages = total_pages
         view.page_index = 0
         view.update_select_defaults()
         view._sync_buttons()
@@ -4528,7 +4620,7 @@ class LeaderboardCog(commands.Cog):
             boards.extend(self.list_leaderboards(gid))
             for name in self.storage.list_categories(gid):
                 boards.append(name)
-        boards = [name for name in dict.fromkeys(board for board in boards if board)]
+        boards = list(dict.fromkeys(board for board in boards if board))
         if not boards:
             return await interaction.followup.send("No categories available.", ephemeral=True)
         player_id = None
@@ -4537,7 +4629,8 @@ class LeaderboardCog(commands.Cog):
                 player_id = int(player)
             except Exception:
                 return await interaction.followup.send("Invalid player selection.", ephemeral=True)
-        entries: List[Tuple[datetime, str]] = []
+        candidates: List[Tuple[datetime, str, Dict[str, Any]]] = []
+        fallback_dt = datetime.now(timezone.utc)
         for board_name in boards:
             try:
                 rows = await asyncio.to_thread(self.storage.load_match_history, gid, board_name)
@@ -4554,13 +4647,17 @@ class LeaderboardCog(commands.Cog):
                     continue
                 if player_id is not None and player_id not in {winner_id, loser_id}:
                     continue
-                formatted = self.format_match_entry(gid, board_name, row, perspective_id=None, include_category=True)
-                if formatted:
-                    entries.append(formatted)
-        if not entries:
+                recorded_at = self._parse_recorded_datetime(row.get("date")) or fallback_dt
+                candidates.append((recorded_at, board_name, row))
+        if not candidates:
             return await interaction.followup.send("No matches found for the selected filters.", ephemeral=True)
-        entries.sort(key=lambda item: item[0], reverse=True)
-        lines = [item[1] for item in entries]
+        # Only the newest entries are ever shown, so sort on the cheap key and format just those.
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        lines: List[str] = []
+        for _, board_name, row in candidates[: HISTORY_MAX_PAGES * 10]:
+            formatted = self.format_match_entry(gid, board_name, row, perspective_id=None, include_category=True)
+            if formatted:
+                lines.append(formatted[1])
         pages = chunk_list(lines, 10)
         header_parts = []
         if category:
@@ -4569,11 +4666,14 @@ class LeaderboardCog(commands.Cog):
             member = interaction.guild.get_member(player_id) or self.client.get_user(player_id)
             header_parts.append(f"Player filter: {member.display_name if member else self.user_snapshot_name_for(gid, player_id)}")
         header_text = "\n".join(header_parts) if header_parts else None
+        footer_note = f"{len(candidates)} matches"
+        if len(candidates) > len(lines):
+            footer_note = f"{footer_note} (showing latest {len(lines)})"
         view = PagedListView(
             title="Server Match History",
             pages=pages,
             color=discord.Color.blue(),
-            footer_note=f"{len(entries)} matches",
+            footer_note=footer_note,
             header=header_text,
         )
         await interaction.followup.send(embed=view.create_embed(), view=view, ephemeral=True)
@@ -4604,7 +4704,7 @@ class LeaderboardCog(commands.Cog):
         else:
             boards.extend(self.list_leaderboards(gid))
             boards.extend(self.storage.list_categories(gid))
-        boards = [name for name in dict.fromkeys(board for board in boards if board)]
+        boards = list(dict.fromkeys(board for board in boards if board))
         if not boards:
             return await interaction.followup.send("No leaderboards configured.", ephemeral=True)
 
@@ -4710,6 +4810,8 @@ class LeaderboardCog(commands.Cog):
                 board_prefix = f"[{board_name}] " if not category else ""
                 line = f"{stamp} - {board_prefix}{winner_name} defeated {loser_name} ({detail})"
                 rows_by_board.append((when_dt, line, winner_id, loser_id, winner_delta, loser_delta))
+        if board_errors:
+            await asyncio.to_thread(self.storage.repair_match_indexes)
         if not rows_by_board:
             if board_errors:
                 return await interaction.followup.send(
@@ -4759,7 +4861,7 @@ class LeaderboardCog(commands.Cog):
         else:
             boards = self.list_leaderboards(gid)
             boards.extend(self.storage.list_categories(gid))
-            boards = [name for name in dict.fromkeys(board for board in boards if board)]
+            boards = list(dict.fromkeys(board for board in boards if board))
         if not boards:
             return await interaction.followup.send("No leaderboards configured.", ephemeral=True)
 
@@ -4903,13 +5005,13 @@ class LeaderboardCog(commands.Cog):
             return await interaction.followup.send("Bio must be <=100 chars.", ephemeral=True)
         gid = interaction.guild.id
         gid_s = str(gid)
-        self.bios.setdefault(gid_s, {}).setdefault(GLOBAL_BIO_KEY, {})[str(interaction.user.id)] = bio
-        bios_snapshot = copy.deepcopy(self.bios[gid_s][GLOBAL_BIO_KEY])
+        self.bios.setdefault(gid_s, {}).setdefault(GLOBAL_BIO_KEY, {})[interaction.user.id] = bio
         await asyncio.to_thread(
-            self.storage.save_bios,
+            self.storage.save_bio,
             gid,
             GLOBAL_BIO_KEY,
-            bios_snapshot,
+            interaction.user.id,
+            bio,
         )
         await interaction.followup.send("Bio updated.", ephemeral=True)
 
@@ -4941,14 +5043,9 @@ class LeaderboardCog(commands.Cog):
                 return await interaction.followup.send("Member not found.", ephemeral=True)
             fights_data = [data for data in fights_data if member_obj.id in {data[0], data[1]}]
         fights_lines = []
+        now_text = datetime.now(timezone.utc).astimezone(TZ).strftime("%m/%d/%Y %H:%M")
         for challenger_id, opponent_id, recorded_at, status in fights_data:
-            try:
-                started = datetime.fromisoformat(recorded_at) if recorded_at else datetime.now(timezone.utc)
-                if started.tzinfo is None:
-                    started = started.replace(tzinfo=timezone.utc)
-            except Exception:
-                started = datetime.now(timezone.utc)
-            start_time = started.astimezone(TZ).strftime("%m/%d/%Y %H:%M")
+            start_time = (_fmt_started(recorded_at) if isinstance(recorded_at, str) and recorded_at else None) or now_text
             challenger = guild.get_member(challenger_id) or self.client.get_user(challenger_id)
             challenger_label = challenger.display_name if isinstance(challenger, discord.Member) else getattr(challenger, "name", self.user_snapshot_name_for(gid, challenger_id))
             if opponent_id:
@@ -4975,20 +5072,18 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="cancelfight")
     @app_commands.describe(category="Category", player1="Player 1", player2="Player 2")
     @app_commands.autocomplete(category=category_autocomplete)
+    @_mod_check()
     async def cancelfight(self, interaction: discord.Interaction, category: str, player1: discord.Member, player2: discord.Member):
         await interaction.response.defer()
         gid = interaction.guild.id
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         bucket = self.get_active_bucket(gid, category)
         matches = bucket.get("matches", {})
-        target_ids = {player1.id, player2.id}
+        a, b = player1.id, player2.id
         cancelled_any = False
         for match_id, data in list(matches.items()):
-            participants = {data.get("challenger_id"), data.get("opponent_id")}
-            if None in participants:
-                participants.discard(None)
-            if participants == target_ids:
+            cid = data.get("challenger_id")
+            oid = data.get("opponent_id")
+            if (cid == a and oid == b) or (cid == b and oid == a) or (a == b and cid == a and oid is None):
                 reason = f"Cancelled by moderator {interaction.user.display_name}."
                 cancelled = await self._cancel_match_with_embed_update(gid, category, match_id, reason=reason)
                 cancelled_any = cancelled_any or cancelled
@@ -5017,11 +5112,10 @@ class LeaderboardCog(commands.Cog):
     @leaderboard.command(name="readd")
     @app_commands.describe(category="Category", player="Player to re-add")
     @app_commands.autocomplete(category=category_autocomplete, player=removed_player_autocomplete)
+    @_mod_check()
     async def readd(self, interaction: discord.Interaction, category: str, player: str):
         await interaction.response.defer()
         gid = interaction.guild.id
-        if not self.has_mod_permissions(interaction.user):
-            return await interaction.followup.send("You do not have permission.", ephemeral=True)
         try:
             uid = int(player)
         except Exception:
@@ -5061,6 +5155,7 @@ class LeaderboardCog(commands.Cog):
         await asyncio.to_thread(self.storage.save_active_fights, gid, payload)
 
     def _schedule_config_save(self) -> None:
+        self._bump_config_gen()
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
@@ -5115,10 +5210,23 @@ class LeaderboardCog(commands.Cog):
 
         task.add_done_callback(functools.partial(_cleanup, guild_id=gid))
 
+    async def _delete_threads(self, due_threads: List[Tuple[str, Any]]) -> None:
+        semaphore = asyncio.Semaphore(THREAD_DELETE_CONCURRENCY)
+
+        async def delete_one(gid_s: str, thread: Any) -> None:
+            async with semaphore:
+                try:
+                    await thread.delete()
+                except Exception:
+                    logger.exception("Failed deleting thread %s for guild %s", thread.id, gid_s)
+
+        await asyncio.gather(*(delete_one(gid_s, thread) for gid_s, thread in due_threads))
+
     async def _deletion_loop(self):
         while True:
             await asyncio.sleep(30)
             now = datetime.now(timezone.utc)
+            due_threads: List[Tuple[str, Any]] = []
             for gid_s, af in list(self.active_fights.items()):
                 gid = int(gid_s)
                 changed = False
@@ -5138,34 +5246,23 @@ class LeaderboardCog(commands.Cog):
                         if delete_at <= now:
                             tid = entry.get("thread_id")
                             if tid:
-                                active_thread = False
-                                for match_entry in cat_map.get("matches", {}).values():
-                                    if match_entry.get("thread_id") != tid:
-                                        continue
-                                    status = match_entry.get("status", "open")
-                                    if status not in {"completed", "cancelled"}:
-                                        active_thread = True
-                                        break
-                                if active_thread:
+                                matches = cat_map.setdefault("matches", {})
+                                thread_index = cat_map.setdefault("thread_to_match", {})
+                                match_key = thread_index.get(tid)
+                                match_entry = matches.get(match_key) if match_key is not None else None
+                                if match_entry is not None and match_entry.get("thread_id") != tid:
+                                    match_entry = None
+                                if match_entry is not None and match_entry.get("status", "open") not in {"completed", "cancelled"}:
                                     deletions.remove(entry)
                                     category_changed = True
                                     changed = True
                                     continue
                                 thread = self.client.get_channel(tid)
                                 if thread:
-                                    try:
-                                        await thread.delete()
-                                    except Exception:
-                                        logger.exception("Failed deleting thread %s for guild %s", tid, gid_s)
-                                for match_key, match_entry in list(cat_map.get("matches", {}).items()):
-                                    if match_entry.get("thread_id") != tid:
-                                        continue
-                                    status = match_entry.get("status", "open")
-                                    if status in {"completed", "cancelled"}:
-                                        cat_map["matches"].pop(match_key, None)
-                                    else:
-                                        match_entry.pop("thread_id", None)
-                                        match_entry.pop("thread_message_id", None)
+                                    due_threads.append((gid_s, thread))
+                                thread_index.pop(tid, None)
+                                if match_entry is not None:
+                                    matches.pop(match_key, None)
                             deletions.remove(entry)
                             category_changed = True
                             changed = True
@@ -5224,6 +5321,8 @@ class LeaderboardCog(commands.Cog):
                                 changed = True
                 if changed:
                     await self.save_active_fights_for(int(gid_s))
+            if due_threads:
+                await self._delete_threads(due_threads)
             run_decay_sweep = False
             if self._last_decay_sweep is None:
                 run_decay_sweep = True
@@ -5340,7 +5439,7 @@ class LeaderboardCog(commands.Cog):
                 self.players_data.setdefault(gid_s, {})[safe_name] = players
                 await self.save_players_for(gid, category_name)
                 restored_categories.append(category_name)
-        for category in set(removed_categories + restored_categories):
+        for category in {*removed_categories, *restored_categories}:
             await self.update_leaderboard_message_for(gid, category)
         if removed_categories:
             logger.info("Member %s removed from %s due to participant role removal in guild %s", before.id, ", ".join(removed_categories), gid)
@@ -5374,6 +5473,8 @@ class LeaderboardCog(commands.Cog):
                     restored_leaderboards += 1
                 except Exception:
                     logger.debug("Failed to restore leaderboard view for guild %s board %s", gid_s, board_name)
+        views_to_add: List[Tuple[ChallengeControlView, int, str, str]] = []
+        restored_matches: List[Dict[str, Any]] = []
         for gid_s, cat_map in list(self.active_fights.items()):
             try:
                 gid = int(gid_s)
@@ -5387,12 +5488,18 @@ class LeaderboardCog(commands.Cog):
                         continue
                     view = self.build_match_view(gid, category, match_id)
                     view.refresh_buttons()
-                    try:
-                        self.client.add_view(view, message_id=message_id)
-                        restored += 1
-                    except Exception:
-                        logger.debug("Failed to restore view for guild %s match %s", gid_s, match_id)
-                    match.pop("thread_message_id", None)
+                    views_to_add.append((view, message_id, gid_s, match_id))
+                    restored_matches.append(match)
+        for index, (view, message_id, gid_s, match_id) in enumerate(views_to_add):
+            try:
+                self.client.add_view(view, message_id=message_id)
+                restored += 1
+            except Exception:
+                logger.debug("Failed to restore view for guild %s match %s", gid_s, match_id)
+            if index % 50 == 49:
+                await asyncio.sleep(0)
+        for match in restored_matches:
+            match.pop("thread_message_id", None)
         if restored_leaderboards:
             logger.info("Restored %s leaderboard controls after reconnect.", restored_leaderboards)
         if restored:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from datetime import timedelta
@@ -30,6 +31,7 @@ MODE_TYPE_CHOICES = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_category(category: str) -> str:
     return category.replace(" ", "_").lower()
 
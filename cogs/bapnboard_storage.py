@@ -1,17 +1,379 @@
 ﻿from __future__ import annotations
 
+import json
+import queue
 import sqlite3
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .bapnboard_shared import DB_FILE, GLOBAL_BAN_SCOPE, GLOBAL_BIO_KEY, normalize_category
+try:
+    import apsw
+except ImportError:
+    apsw = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+from .bapnboard_shared import DB_FILE, GLOBAL_BAN_SCOPE, GLOBAL_BIO_KEY, logger, normalize_category
+
+
+MATCH_WRITE_BATCH_SIZE = 256
+SCHEMA_VERSION = 5
+CHECKPOINT_INTERVAL_SECONDS = 60
+MATCH_INDEXES = {
+    "idx_matches_lookup": "matches (guild_id, category, user_id)",
+    "idx_matches_board_time": "matches (guild_id, category, recorded_at, id)",
+}
+WITHOUT_ROWID_TABLES = ("removed_players", "bios", "active_match_submissions", "active_match_cancel_votes")
+TUNING_PRAGMAS = (
+    "synchronous = NORMAL",
+    "temp_store = MEMORY",
+    "cache_size = -64000",
+    "mmap_size = 268435456",
+    "busy_timeout = 5000",
+)
+
+_Rows = List[Tuple[Any, ...]]
+
+_GUILD_SETTING_COLUMNS = (
+    "participant_role_id",
+    "challenge_channel_id",
+    "outgoing_channel_id",
+    "announce_channel_id",
+    "leaderboard_channel_id",
+    "leaderboard_message_id",
+)
+
+_MATCH_RESULT_COLUMNS = (
+    "winner_id",
+    "loser_id",
+    "winner_value",
+    "loser_value",
+    "override_notes",
+    "completed_at",
+    "winner_elo_change",
+    "loser_elo_change",
+    "winner_new_elo",
+    "loser_new_elo",
+    "winner_old_elo",
+    "loser_old_elo",
+)
+
+_SQL_SELECT_GUILD_SETTINGS = f"SELECT guild_id, {', '.join(_GUILD_SETTING_COLUMNS)}, thread_cleanup_seconds FROM guild_settings"
+
+_SQL_UPSERT_GUILD_SETTINGS = """
+    INSERT INTO guild_settings (
+        guild_id,
+        participant_role_id,
+        challenge_channel_id,
+        outgoing_channel_id,
+        announce_channel_id,
+        leaderboard_channel_id,
+        leaderboard_message_id,
+        thread_cleanup_seconds
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id) DO UPDATE SET
+        participant_role_id=excluded.participant_role_id,
+        challenge_channel_id=excluded.challenge_channel_id,
+        outgoing_channel_id=excluded.outgoing_channel_id,
+        announce_channel_id=excluded.announce_channel_id,
+        leaderboard_channel_id=excluded.leaderboard_channel_id,
+        leaderboard_message_id=excluded.leaderboard_message_id,
+        thread_cleanup_seconds=excluded.thread_cleanup_seconds
+"""
+
+_SQL_UPSERT_LEADERBOARD = """
+    INSERT OR REPLACE INTO leaderboards (
+        guild_id,
+        category,
+        display_name,
+        participant_role_id,
+        challenge_channel_id,
+        outgoing_channel_id,
+        announce_channel_id,
+        leaderboard_channel_id,
+        leaderboard_message_id,
+        pending_timeout_enabled,
+        anti_farm_enabled,
+        inactivity_decay_enabled,
+        inactivity_decay_days,
+        inactivity_decay_amount,
+        inactivity_decay_floor,
+        thread_cleanup_seconds
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_CATEGORY_MODE = """
+    INSERT OR REPLACE INTO category_modes (guild_id, category, mode_key, mode_target)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_PLAYER = """
+    INSERT INTO players (guild_id, category, user_id, elo, wins, losses)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id, category, user_id) DO UPDATE SET
+        elo=excluded.elo,
+        wins=excluded.wins,
+        losses=excluded.losses
+"""
+
+_SQL_INSERT_PLAYER_META = """
+    INSERT INTO player_meta (guild_id, user_id, display_name, avatar_url)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_REMOVED_PLAYER = """
+    INSERT INTO removed_players (guild_id, category, user_id, elo, wins, losses)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_PLAYER_BAN = """
+    INSERT INTO player_bans (guild_id, scope_category, user_id, reason, banned_by, banned_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_PLAYER_DECAY = """
+    INSERT INTO player_decay (guild_id, category, user_id, last_decay_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_BIO = """
+    INSERT INTO bios (guild_id, category, user_id, bio)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(guild_id, category, user_id) DO UPDATE SET
+        bio=excluded.bio
+"""
+
+_SQL_INSERT_BIO = """
+    INSERT INTO bios (guild_id, category, user_id, bio)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_ACTIVE_MATCH = """
+    INSERT INTO active_matches (
+        guild_id,
+        category,
+        match_id,
+        leaderboard,
+        challenger_id,
+        opponent_id,
+        status,
+        channel_id,
+        message_id,
+        thread_id,
+        thread_message_id,
+        created_at,
+        rank_range,
+        mode_key,
+        mode_target,
+        response_deadline,
+        accepted_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id, category, match_id) DO UPDATE SET
+        leaderboard=excluded.leaderboard,
+        challenger_id=excluded.challenger_id,
+        opponent_id=excluded.opponent_id,
+        status=excluded.status,
+        channel_id=excluded.channel_id,
+        message_id=excluded.message_id,
+        thread_id=excluded.thread_id,
+        thread_message_id=excluded.thread_message_id,
+        created_at=excluded.created_at,
+        rank_range=excluded.rank_range,
+        mode_key=excluded.mode_key,
+        mode_target=excluded.mode_target,
+        response_deadline=excluded.response_deadline,
+        accepted_at=excluded.accepted_at
+"""
+
+_SQL_INSERT_ACTIVE_MATCH_RESULT = """
+    INSERT INTO active_match_results (
+        guild_id,
+        category,
+        match_id,
+        winner_id,
+        loser_id,
+        winner_value,
+        loser_value,
+        completed_at,
+        override_notes,
+        winner_elo_change,
+        loser_elo_change,
+        winner_new_elo,
+        loser_new_elo,
+        winner_old_elo,
+        loser_old_elo
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ACTIVE_MATCH_SUBMISSION = """
+    INSERT INTO active_match_submissions (
+        guild_id,
+        category,
+        match_id,
+        user_id,
+        kind,
+        value,
+        metric
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ACTIVE_MATCH_CANCEL_VOTE = """
+    INSERT INTO active_match_cancel_votes (
+        guild_id,
+        category,
+        match_id,
+        user_id
+    )
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ACTIVE_MATCH_DELETION = """
+    INSERT INTO active_match_deletions (guild_id, category, thread_id, delete_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_SELECT_LEADERBOARDS = f"""
+    SELECT
+        guild_id,
+        category,
+        display_name,
+        {', '.join(_GUILD_SETTING_COLUMNS)},
+        pending_timeout_enabled,
+        anti_farm_enabled,
+        inactivity_decay_enabled,
+        inactivity_decay_days,
+        inactivity_decay_amount,
+        inactivity_decay_floor,
+        thread_cleanup_seconds
+    FROM leaderboards
+"""
+
+_SQL_SELECT_ACTIVE_MATCHES = f"""
+    SELECT
+        m.guild_id,
+        m.category,
+        m.match_id,
+        m.leaderboard,
+        m.challenger_id,
+        m.opponent_id,
+        m.status,
+        m.channel_id,
+        m.message_id,
+        m.thread_id,
+        m.thread_message_id,
+        m.created_at,
+        m.rank_range,
+        m.mode_key,
+        m.mode_target,
+        m.response_deadline,
+        m.accepted_at,
+        r.match_id IS NOT NULL,
+        {', '.join(f"r.{column}" for column in _MATCH_RESULT_COLUMNS)},
+        (
+            SELECT json_group_array(json_array(s.user_id, s.kind, s.value, s.metric_text))
+            FROM (
+                SELECT
+                    user_id,
+                    kind,
+                    value,
+                    CASE WHEN metric IS NULL THEN NULL ELSE printf('%!.17g', metric) END AS metric_text
+                FROM active_match_submissions
+                WHERE guild_id=m.guild_id AND category=m.category AND match_id=m.match_id
+                ORDER BY user_id
+            ) AS s
+        ),
+        (
+            SELECT json_group_array(v.user_id)
+            FROM (
+                SELECT user_id
+                FROM active_match_cancel_votes
+                WHERE guild_id=m.guild_id AND category=m.category AND match_id=m.match_id
+                ORDER BY user_id
+            ) AS v
+        )
+    FROM active_matches AS m
+    LEFT JOIN active_match_results AS r
+        ON r.guild_id=m.guild_id AND r.category=m.category AND r.match_id=m.match_id
+    ORDER BY m.rowid
+"""
+
+# Source 0 rows are display names, 1 are safe names, 2 are safe names that may already be display names.
+_SQL_LIST_CATEGORIES = """
+    SELECT 0, display_name FROM leaderboards WHERE guild_id=:guild_id
+    UNION ALL
+    SELECT 0, name FROM legacy_categories WHERE guild_id=:guild_id
+    UNION ALL
+    SELECT DISTINCT 0, category FROM active_matches WHERE guild_id=:guild_id
+    UNION ALL
+    SELECT DISTINCT 1, category FROM players WHERE guild_id=:guild_id
+    UNION ALL
+    SELECT DISTINCT 1, category FROM matches WHERE guild_id=:guild_id
+    UNION ALL
+    SELECT DISTINCT 1, category FROM removed_players WHERE guild_id=:guild_id AND category != :global_bio
+    UNION ALL
+    SELECT DISTINCT 1, scope_category FROM player_bans
+    WHERE guild_id=:guild_id AND scope_category NOT IN (:global_bio, :global_ban)
+    UNION ALL
+    SELECT DISTINCT 1, category FROM player_decay WHERE guild_id=:guild_id AND category != ''
+    UNION ALL
+    SELECT DISTINCT 2, category FROM bios WHERE guild_id=:guild_id AND category != :global_bio
+"""
+
+_SQL_INSERT_MATCH = """
+    INSERT INTO matches (
+        guild_id,
+        category,
+        user_id,
+        recorded_at,
+        opponent_id,
+        challenger,
+        user_value,
+        opponent_value,
+        result,
+        elo_change
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class BoardStorage:
     def __init__(self, db_path: str = DB_FILE):
         self.db_path = db_path
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._last_snapshot: Dict[int, Dict[str, Any]] = {}
+        self._players_snapshot: Dict[Tuple[int, str], Dict[Any, Tuple[float, int, int]]] = {}
+        self._active_snapshot: Dict[int, Tuple[Dict[Tuple[str, str], Tuple[Any, ...]], _Rows]] = {}
+        self._write_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._write_thread: Optional[threading.Thread] = None
+        self._write_thread_lock = threading.Lock()
+        self._writes = 0
+        self._checkpoint_stop = threading.Event()
         self._ensure_schema()
+        self._checkpoint_thread = threading.Thread(
+            target=self._checkpoint_loop,
+            name="bapnboard-wal-checkpoint",
+            daemon=True,
+        )
+        self._checkpoint_thread.start()
 
     @staticmethod
     def _is_player_bans_schema_error(exc: Exception) -> bool:
@@ -35,234 +397,422 @@ class BoardStorage:
         conn.execute(f"PRAGMA schema_version={current_version + 1}")
         conn.commit()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row
         try:
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
+            self._apply_pragmas(conn)
         except sqlite3.DatabaseError as exc:
             if not self._is_player_bans_schema_error(exc):
                 conn.close()
                 raise
             self._repair_player_bans_schema(conn)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
+            self._apply_pragmas(conn)
         return conn
 
-    def _ensure_schema(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS guild_settings (
-                    guild_id INTEGER PRIMARY KEY,
-                    participant_role_id INTEGER,
-                    challenge_channel_id INTEGER,
-                    outgoing_channel_id INTEGER,
-                    announce_channel_id INTEGER,
-                    leaderboard_channel_id INTEGER,
-                    leaderboard_message_id INTEGER,
-                    thread_cleanup_seconds INTEGER DEFAULT 21600
-                );
-                CREATE TABLE IF NOT EXISTS leaderboards (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    display_name TEXT NOT NULL,
-                    participant_role_id INTEGER,
-                    challenge_channel_id INTEGER,
-                    outgoing_channel_id INTEGER,
-                    announce_channel_id INTEGER,
-                    leaderboard_channel_id INTEGER,
-                    leaderboard_message_id INTEGER,
-                    pending_timeout_enabled INTEGER DEFAULT 1,
-                    anti_farm_enabled INTEGER DEFAULT 1,
-                    inactivity_decay_enabled INTEGER DEFAULT 1,
-                    inactivity_decay_days INTEGER DEFAULT 7,
-                    inactivity_decay_amount REAL DEFAULT 10.0,
-                    inactivity_decay_floor REAL DEFAULT 800.0,
-                    thread_cleanup_seconds INTEGER DEFAULT 21600,
-                    PRIMARY KEY (guild_id, category)
-                );
-                CREATE TABLE IF NOT EXISTS category_modes (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    mode_key TEXT NOT NULL,
-                    mode_target INTEGER,
-                    PRIMARY KEY (guild_id, category)
-                );
-                CREATE TABLE IF NOT EXISTS legacy_categories (
-                    guild_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, name)
-                );
-                CREATE TABLE IF NOT EXISTS players (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    elo REAL NOT NULL,
-                    wins INTEGER NOT NULL,
-                    losses INTEGER NOT NULL,
-                    PRIMARY KEY (guild_id, category, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS player_meta (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    display_name TEXT,
-                    avatar_url TEXT,
-                    PRIMARY KEY (guild_id, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS removed_players (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    elo REAL NOT NULL,
-                    wins INTEGER NOT NULL,
-                    losses INTEGER NOT NULL,
-                    PRIMARY KEY (guild_id, category, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS player_bans (
-                    guild_id INTEGER NOT NULL,
-                    scope_category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    reason TEXT,
-                    banned_by INTEGER,
-                    banned_at TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, scope_category, user_id)
-                );
-                CREATE INDEX IF NOT EXISTS idx_player_bans_user ON player_bans (guild_id, user_id);
-                CREATE TABLE IF NOT EXISTS bios (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    bio TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, category, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    recorded_at TEXT NOT NULL,
-                    opponent_id INTEGER NOT NULL,
-                    challenger INTEGER NOT NULL,
-                    user_value TEXT,
-                    opponent_value TEXT,
-                    result TEXT NOT NULL,
-                    elo_change REAL NOT NULL
-                );
-                CREATE INDEX IF NOT EXISTS idx_matches_lookup ON matches (guild_id, category, user_id);
-                CREATE TABLE IF NOT EXISTS match_announcements (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    winner_match_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    message_id INTEGER NOT NULL,
-                    PRIMARY KEY (guild_id, category, winner_match_id)
-                );
-                CREATE TABLE IF NOT EXISTS active_matches (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    match_id TEXT NOT NULL,
-                    leaderboard TEXT NOT NULL,
-                    challenger_id INTEGER NOT NULL,
-                    opponent_id INTEGER,
-                    status TEXT NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    message_id INTEGER,
-                    thread_id INTEGER,
-                    thread_message_id INTEGER,
-                    created_at TEXT NOT NULL,
-                    rank_range INTEGER,
-                    mode_key TEXT NOT NULL,
-                    mode_target INTEGER,
-                    response_deadline TEXT,
-                    accepted_at TEXT,
-                    PRIMARY KEY (guild_id, category, match_id)
-                );
-                CREATE TABLE IF NOT EXISTS active_match_results (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    match_id TEXT NOT NULL,
-                    winner_id INTEGER,
-                    loser_id INTEGER,
-                    winner_value TEXT,
-                    loser_value TEXT,
-                    completed_at TEXT,
-                    override_notes TEXT,
-                    winner_elo_change REAL,
-                    loser_elo_change REAL,
-                    winner_new_elo REAL,
-                    loser_new_elo REAL,
-                    winner_old_elo REAL,
-                    loser_old_elo REAL,
-                    PRIMARY KEY (guild_id, category, match_id)
-                );
-                CREATE TABLE IF NOT EXISTS active_match_submissions (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    match_id TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    kind TEXT NOT NULL,
-                    value TEXT,
-                    metric REAL,
-                    PRIMARY KEY (guild_id, category, match_id, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS active_match_cancel_votes (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    match_id TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    PRIMARY KEY (guild_id, category, match_id, user_id)
-                );
-                CREATE TABLE IF NOT EXISTS active_match_deletions (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    thread_id INTEGER NOT NULL,
-                    delete_at TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, category, thread_id)
-                );
-                CREATE TABLE IF NOT EXISTS player_decay (
-                    guild_id INTEGER NOT NULL,
-                    category TEXT NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    last_decay_at TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, category, user_id)
-                );
-                """
-            )
-            # Best-effort index rebuild for history lookups.
-            try:
-                conn.execute("REINDEX idx_matches_lookup")
-            except sqlite3.DatabaseError:
-                pass
-            try:
-                conn.execute("ALTER TABLE active_matches ADD COLUMN thread_message_id INTEGER")
-            except sqlite3.OperationalError:
-                pass
-            try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN pending_timeout_enabled INTEGER DEFAULT 1")
-            except sqlite3.OperationalError:
-                pass
-            try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN anti_farm_enabled INTEGER DEFAULT 1")
-            except sqlite3.OperationalError:
-                pass
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in TUNING_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 0")
+        for pragma in TUNING_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+
+    def _get_writer(self) -> sqlite3.Connection:
+        # Callers hold self._lock; the single writer connection is shared across worker threads.
+        if self._writer is None:
+            self._writer = self._open_connection()
+        self._writes += 1
+        return self._writer
+
+    def _checkpoint_loop(self) -> None:
+        checkpointed_at = self._writes
+        while not self._checkpoint_stop.wait(CHECKPOINT_INTERVAL_SECONDS):
+            if self._writes == checkpointed_at:
+                continue
+            checkpointed_at = self._writes
             try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_enabled INTEGER DEFAULT 1")
-            except sqlite3.OperationalError:
+                self.checkpoint()
+            except sqlite3.Error:
                 pass
+
+    def checkpoint(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Readers skip self._lock; each thread gets its own read-only connection and WAL snapshots.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_reader()
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def _get_apsw_conn(self) -> Any:
+        conn = getattr(self._local, "apsw_conn", None)
+        if conn is None:
+            conn = apsw.Connection(self.db_path, flags=apsw.SQLITE_OPEN_READONLY)
+            conn.setbusytimeout(5000)
+            self._local.apsw_conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def _ensure_write_thread(self) -> None:
+        with self._write_thread_lock:
+            if self._write_thread is None or not self._write_thread.is_alive():
+                self._write_thread = threading.Thread(
+                    target=self._match_writer_loop,
+                    name="bapnboard-match-writer",
+                    daemon=True,
+                )
+                self._write_thread.start()
+
+    def _match_writer_loop(self) -> None:
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < MATCH_WRITE_BATCH_SIZE:
+                try:
+                    item = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
             try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_days INTEGER DEFAULT 7")
-            except sqlite3.OperationalError:
-                pass
+                self._write_match_batch(batch)
+            except Exception as exc:
+                if len(batch) == 1:
+                    batch[0][1].set_exception(exc)
+                else:
+                    for entry in batch:
+                        try:
+                            self._write_match_batch([entry])
+                        except Exception as entry_exc:
+                            entry[1].set_exception(entry_exc)
+            if stop:
+                return
+
+    def _write_match_batch(self, batch: List[Tuple[Optional[Tuple[Any, ...]], Future]]) -> None:
+        with self._lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row_ids = [
+                    int(conn.execute(_SQL_INSERT_MATCH, params).lastrowid) if params is not None else None
+                    for params, _ in batch
+                ]
+        for (_, future), row_id in zip(batch, row_ids):
+            future.set_result(row_id)
+
+    def flush(self) -> None:
+        if self._write_thread is None or not self._write_thread.is_alive():
+            return
+        future: Future = Future()
+        self._write_q.put((None, future))
+        future.result()
+
+    def close(self) -> None:
+        self._checkpoint_stop.set()
+        with self._write_thread_lock:
+            thread, self._write_thread = self._write_thread, None
+        if thread is not None and thread.is_alive():
+            self._write_q.put(None)
+            thread.join()
+        with self._lock:
+            if self._writer is not None:
+                try:
+                    self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error:
+                    pass
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
             try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_amount REAL DEFAULT 10.0")
-            except sqlite3.OperationalError:
+                conn.close()
+            except Exception:
                 pass
+        self._local = threading.local()
+
+    def _ensure_schema(self) -> None:
+        with self._lock:
+            conn = self._get_writer()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            with conn:
+                if version < SCHEMA_VERSION:
+                    conn.executescript(
+                        """
+                        CREATE TABLE IF NOT EXISTS guild_settings (
+                            guild_id INTEGER PRIMARY KEY,
+                            participant_role_id INTEGER,
+                            challenge_channel_id INTEGER,
+                            outgoing_channel_id INTEGER,
+                            announce_channel_id INTEGER,
+                            leaderboard_channel_id INTEGER,
+                            leaderboard_message_id INTEGER,
+                            thread_cleanup_seconds INTEGER DEFAULT 21600
+                        );
+                        CREATE TABLE IF NOT EXISTS leaderboards (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            display_name TEXT NOT NULL,
+                            participant_role_id INTEGER,
+                            challenge_channel_id INTEGER,
+                            outgoing_channel_id INTEGER,
+                            announce_channel_id INTEGER,
+                            leaderboard_channel_id INTEGER,
+                            leaderboard_message_id INTEGER,
+                            pending_timeout_enabled INTEGER DEFAULT 1,
+                            anti_farm_enabled INTEGER DEFAULT 1,
+                            inactivity_decay_enabled INTEGER DEFAULT 1,
+                            inactivity_decay_days INTEGER DEFAULT 7,
+                            inactivity_decay_amount REAL DEFAULT 10.0,
+                            inactivity_decay_floor REAL DEFAULT 800.0,
+                            thread_cleanup_seconds INTEGER DEFAULT 21600,
+                            PRIMARY KEY (guild_id, category)
+                        );
+                        CREATE TABLE IF NOT EXISTS category_modes (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            mode_key TEXT NOT NULL,
+                            mode_target INTEGER,
+                            PRIMARY KEY (guild_id, category)
+                        );
+                        CREATE TABLE IF NOT EXISTS legacy_categories (
+                            guild_id INTEGER NOT NULL,
+                            name TEXT NOT NULL,
+                            PRIMARY KEY (guild_id, name)
+                        );
+                        CREATE TABLE IF NOT EXISTS players (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            elo REAL NOT NULL,
+                            wins INTEGER NOT NULL,
+                            losses INTEGER NOT NULL,
+                            PRIMARY KEY (guild_id, category, user_id)
+                        );
+                        CREATE INDEX IF NOT EXISTS idx_players_board ON players (guild_id, category, user_id, elo, wins, losses);
+                        CREATE TABLE IF NOT EXISTS player_meta (
+                            guild_id INTEGER NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            display_name TEXT,
+                            avatar_url TEXT,
+                            PRIMARY KEY (guild_id, user_id)
+                        );
+                        CREATE TABLE IF NOT EXISTS removed_players (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            elo REAL NOT NULL,
+                            wins INTEGER NOT NULL,
+                            losses INTEGER NOT NULL,
+                            PRIMARY KEY (guild_id, category, user_id)
+                        ) WITHOUT ROWID;
+                        CREATE TABLE IF NOT EXISTS player_bans (
+                            guild_id INTEGER NOT NULL,
+                            scope_category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            reason TEXT,
+                            banned_by INTEGER,
+                            banned_at TEXT NOT NULL,
+                            PRIMARY KEY (guild_id, scope_category, user_id)
+                        );
+                        CREATE INDEX IF NOT EXISTS idx_player_bans_user ON player_bans (guild_id, user_id);
+                        CREATE TABLE IF NOT EXISTS bios (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            bio TEXT NOT NULL,
+                            PRIMARY KEY (guild_id, category, user_id)
+                        ) WITHOUT ROWID;
+                        CREATE TABLE IF NOT EXISTS matches (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            recorded_at TEXT NOT NULL,
+                            opponent_id INTEGER NOT NULL,
+                            challenger INTEGER NOT NULL,
+                            user_value TEXT,
+                            opponent_value TEXT,
+                            result TEXT NOT NULL,
+                            elo_change REAL NOT NULL
+                        );
+                        CREATE INDEX IF NOT EXISTS idx_matches_lookup ON matches (guild_id, category, user_id);
+                        CREATE INDEX IF NOT EXISTS idx_matches_board_time ON matches (guild_id, category, recorded_at, id);
+                        CREATE TABLE IF NOT EXISTS match_announcements (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            winner_match_id INTEGER NOT NULL,
+                            channel_id INTEGER NOT NULL,
+                            message_id INTEGER NOT NULL,
+                            PRIMARY KEY (guild_id, category, winner_match_id)
+                        );
+                        CREATE TABLE IF NOT EXISTS active_matches (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            match_id TEXT NOT NULL,
+                            leaderboard TEXT NOT NULL,
+                            challenger_id INTEGER NOT NULL,
+                            opponent_id INTEGER,
+                            status TEXT NOT NULL,
+                            channel_id INTEGER NOT NULL,
+                            message_id INTEGER,
+                            thread_id INTEGER,
+                            thread_message_id INTEGER,
+                            created_at TEXT NOT NULL,
+                            rank_range INTEGER,
+                            mode_key TEXT NOT NULL,
+                            mode_target INTEGER,
+                            response_deadline TEXT,
+                            accepted_at TEXT,
+                            PRIMARY KEY (guild_id, category, match_id)
+                        );
+                        CREATE TABLE IF NOT EXISTS active_match_results (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            match_id TEXT NOT NULL,
+                            winner_id INTEGER,
+                            loser_id INTEGER,
+                            winner_value TEXT,
+                            loser_value TEXT,
+                            completed_at TEXT,
+                            override_notes TEXT,
+                            winner_elo_change REAL,
+                            loser_elo_change REAL,
+                            winner_new_elo REAL,
+                            loser_new_elo REAL,
+                            winner_old_elo REAL,
+                            loser_old_elo REAL,
+                            PRIMARY KEY (guild_id, category, match_id)
+                        );
+                        CREATE TABLE IF NOT EXISTS active_match_submissions (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            match_id TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            kind TEXT NOT NULL,
+                            value TEXT,
+                            metric REAL,
+                            PRIMARY KEY (guild_id, category, match_id, user_id)
+                        ) WITHOUT ROWID;
+                        CREATE TABLE IF NOT EXISTS active_match_cancel_votes (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            match_id TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            PRIMARY KEY (guild_id, category, match_id, user_id)
+                        ) WITHOUT ROWID;
+                        CREATE TABLE IF NOT EXISTS active_match_deletions (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            thread_id INTEGER NOT NULL,
+                            delete_at TEXT NOT NULL,
+                            PRIMARY KEY (guild_id, category, thread_id)
+                        );
+                        CREATE TABLE IF NOT EXISTS player_decay (
+                            guild_id INTEGER NOT NULL,
+                            category TEXT NOT NULL,
+                            user_id INTEGER NOT NULL,
+                            last_decay_at TEXT NOT NULL,
+                            PRIMARY KEY (guild_id, category, user_id)
+                        );
+                        """
+                    )
+                    if version < 2:
+                        try:
+                            conn.execute("ALTER TABLE active_matches ADD COLUMN thread_message_id INTEGER")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN pending_timeout_enabled INTEGER DEFAULT 1")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN anti_farm_enabled INTEGER DEFAULT 1")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_enabled INTEGER DEFAULT 1")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_days INTEGER DEFAULT 7")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_amount REAL DEFAULT 10.0")
+                        except sqlite3.OperationalError:
+                            pass
+                        try:
+                            conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_floor REAL DEFAULT 800.0")
+                        except sqlite3.OperationalError:
+                            pass
+                    if version < 4:
+                        # The composite primary key already covers every lookup, so keep rows clustered on it.
+                        conn.execute("DROP INDEX IF EXISTS idx_removed_players_board")
+                        for table in WITHOUT_ROWID_TABLES:
+                            row = conn.execute(
+                                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)
+                            ).fetchone()
+                            if row is None or "WITHOUT ROWID" in row[0].upper():
+                                continue
+                            conn.execute(
+                                row[0].replace(f"CREATE TABLE {table}", f"CREATE TABLE {table}_new", 1) + " WITHOUT ROWID"
+                            )
+                            conn.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+                            conn.execute(f"DROP TABLE {table}")
+                            conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+                    if version < 5:
+                        self._rebuild_match_indexes(conn)
+                        conn.execute("ANALYZE")
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def _rebuild_match_indexes(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("REINDEX matches")
+            for name, target in MATCH_INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            return True
+        except sqlite3.DatabaseError as exc:
+            logger.error("Rebuilding matches indexes failed, dropping them so history reads scan the table: %s", exc)
+        for name in MATCH_INDEXES:
             try:
-                conn.execute("ALTER TABLE leaderboards ADD COLUMN inactivity_decay_floor REAL DEFAULT 800.0")
-            except sqlite3.OperationalError:
-                pass
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            except sqlite3.DatabaseError as exc:
+                logger.error("Dropping matches index %s failed: %s", name, exc)
+        return False
+
+    def repair_match_indexes(self) -> bool:
+        with self._lock:
+            conn = self._get_writer()
+            with conn:
+                return self._rebuild_match_indexes(conn)
+
     def _ensure_guild_entry(self, target: Dict[str, Dict[str, Any]], gid_s: str) -> Dict[str, Any]:
         data = target.get(gid_s)
         if data is None:
@@ -274,190 +824,203 @@ class BoardStorage:
             data.setdefault("categories", [])
         return data
 
-    def _display_from_safe(self, safe: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _display_from_safe(safe: str) -> str:
         text = safe.replace("_", " ").strip()
         return text.title() if text else safe
 
     def load_all(self) -> Dict[str, Any]:
-        with self._lock:
-            with self._connect() as conn:
-                guild_configs: Dict[str, Dict[str, Any]] = {}
-                players: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
-                players_meta: Dict[str, Dict[str, Dict[str, Any]]] = {}
-                removed: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
-                bans: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
-                decay_state: Dict[str, Dict[str, Dict[int, str]]] = {}
-                bios: Dict[str, Dict[str, Dict[str, str]]] = {}
-                active_fights: Dict[str, Dict[str, Dict[str, Any]]] = {}
-                for row in conn.execute("SELECT * FROM guild_settings"):
-                    gid_s = str(row["guild_id"])
-                    data = self._ensure_guild_entry(guild_configs, gid_s)
-                    if row["participant_role_id"] is not None:
-                        data["participant_role_id"] = row["participant_role_id"]
-                    if row["challenge_channel_id"] is not None:
-                        data["challenge_channel_id"] = row["challenge_channel_id"]
-                    if row["outgoing_channel_id"] is not None:
-                        data["outgoing_channel_id"] = row["outgoing_channel_id"]
-                    if row["announce_channel_id"] is not None:
-                        data["announce_channel_id"] = row["announce_channel_id"]
-                    if row["leaderboard_channel_id"] is not None:
-                        data["leaderboard_channel_id"] = row["leaderboard_channel_id"]
-                    if row["leaderboard_message_id"] is not None:
-                        data["leaderboard_message_id"] = row["leaderboard_message_id"]
-                    data["thread_cleanup_seconds"] = row["thread_cleanup_seconds"] or 21600
-                for row in conn.execute("SELECT * FROM leaderboards"):
-                    gid_s = str(row["guild_id"])
-                    safe = row["category"]
-                    data = self._ensure_guild_entry(guild_configs, gid_s)
-                    row_keys = row.keys()
-                    entry = {
-                        "name": row["display_name"],
-                        "participant_role_id": row["participant_role_id"],
-                        "challenge_channel_id": row["challenge_channel_id"],
-                        "outgoing_channel_id": row["outgoing_channel_id"],
-                        "announce_channel_id": row["announce_channel_id"],
-                        "leaderboard_channel_id": row["leaderboard_channel_id"],
-                        "leaderboard_message_id": row["leaderboard_message_id"],
-                        "pending_timeout_enabled": bool(row["pending_timeout_enabled"]) if "pending_timeout_enabled" in row_keys else True,
-                        "anti_farm_enabled": bool(row["anti_farm_enabled"]) if "anti_farm_enabled" in row_keys else True,
-                        "inactivity_decay_enabled": bool(row["inactivity_decay_enabled"]) if "inactivity_decay_enabled" in row_keys else True,
-                        "inactivity_decay_days": int(row["inactivity_decay_days"]) if "inactivity_decay_days" in row_keys and row["inactivity_decay_days"] is not None else 7,
-                        "inactivity_decay_amount": float(row["inactivity_decay_amount"]) if "inactivity_decay_amount" in row_keys and row["inactivity_decay_amount"] is not None else 10.0,
-                        "inactivity_decay_floor": float(row["inactivity_decay_floor"]) if "inactivity_decay_floor" in row_keys and row["inactivity_decay_floor"] is not None else 800.0,
-                        "thread_cleanup_seconds": row["thread_cleanup_seconds"] or data.get("thread_cleanup_seconds", 21600),
-                    }
-                    data["leaderboards"][safe] = entry
-                for row in conn.execute("SELECT * FROM category_modes"):
-                    gid_s = str(row["guild_id"])
-                    safe = row["category"]
-                    data = self._ensure_guild_entry(guild_configs, gid_s)
-                    data["category_modes"][safe] = {"key": row["mode_key"], "target": row["mode_target"]}
-                for row in conn.execute("SELECT * FROM legacy_categories"):
-                    gid_s = str(row["guild_id"])
-                    data = self._ensure_guild_entry(guild_configs, gid_s)
-                    if row["name"] not in data["categories"]:
-                        data["categories"].append(row["name"])
-                for row in conn.execute("SELECT guild_id, category, user_id, elo, wins, losses FROM players"):
-                    gid_s = str(row["guild_id"])
-                    safe = row["category"]
-                    players.setdefault(gid_s, {}).setdefault(safe, {})[row["user_id"]] = {
-                        "elo": row["elo"],
-                        "wins": row["wins"],
-                        "losses": row["losses"],
-                    }
-                for row in conn.execute("SELECT guild_id, user_id, display_name, avatar_url FROM player_meta"):
-                    gid_s = str(row["guild_id"])
-                    players_meta.setdefault(gid_s, {})[str(row["user_id"])] = {
-                        "name": row["display_name"],
-                        "avatar": row["avatar_url"],
-                    }
-                for row in conn.execute("SELECT guild_id, category, user_id, elo, wins, losses FROM removed_players"):
-                    gid_s = str(row["guild_id"])
-                    safe = row["category"]
-                    removed.setdefault(gid_s, {}).setdefault(safe, {})[row["user_id"]] = {
-                        "elo": row["elo"],
-                        "wins": row["wins"],
-                        "losses": row["losses"],
-                    }
-                for row in conn.execute("SELECT guild_id, scope_category, user_id, reason, banned_by, banned_at FROM player_bans"):
-                    gid_s = str(row["guild_id"])
-                    scope = row["scope_category"] or GLOBAL_BAN_SCOPE
-                    bans.setdefault(gid_s, {}).setdefault(scope, {})[row["user_id"]] = {
-                        "reason": row["reason"],
-                        "banned_by": row["banned_by"],
-                        "banned_at": row["banned_at"],
-                    }
-                for row in conn.execute("SELECT guild_id, category, user_id, last_decay_at FROM player_decay"):
-                    gid_s = str(row["guild_id"])
-                    safe = row["category"]
-                    decay_state.setdefault(gid_s, {}).setdefault(safe, {})[row["user_id"]] = row["last_decay_at"]
-                for row in conn.execute("SELECT guild_id, category, user_id, bio FROM bios"):
-                    gid_s = str(row["guild_id"])
-                    bios.setdefault(gid_s, {}).setdefault(row["category"], {})[str(row["user_id"])] = row["bio"]
-                match_index: Dict[Tuple[int, str, str], Dict[str, Any]] = {}
-                for row in conn.execute("SELECT * FROM active_matches"):
-                    gid = row["guild_id"]
-                    gid_s = str(gid)
-                    category = row["category"]
-                    bucket = active_fights.setdefault(gid_s, {}).setdefault(category, {"matches": {}, "deletions": []})
-                    match_data: Dict[str, Any] = {
-                        "id": row["match_id"],
-                        "leaderboard": row["leaderboard"],
-                        "challenger_id": row["challenger_id"],
-                        "opponent_id": row["opponent_id"],
-                        "status": row["status"],
-                        "channel_id": row["channel_id"],
-                        "message_id": row["message_id"],
-                        "thread_id": row["thread_id"],
-                        "thread_message_id": row["thread_message_id"] if "thread_message_id" in row.keys() else None,
-                        "created_at": row["created_at"],
-                        "rank_range": row["rank_range"],
-                        "mode": {"key": row["mode_key"], "target": row["mode_target"]},
-                        "submissions": {},
-                        "cancel_votes": [],
-                    }
-                    if row["response_deadline"]:
-                        match_data["response_deadline"] = row["response_deadline"]
-                    if row["accepted_at"]:
-                        match_data["accepted_at"] = row["accepted_at"]
-                    bucket["matches"][row["match_id"]] = match_data
-                    match_index[(gid, category, row["match_id"])] = match_data
-                for row in conn.execute("SELECT * FROM active_match_results"):
-                    key = (row["guild_id"], row["category"], row["match_id"])
-                    match = match_index.get(key)
-                    if not match:
-                        continue
-                    match["result"] = {
-                        "winner_id": row["winner_id"],
-                        "loser_id": row["loser_id"],
-                        "winner_value": row["winner_value"],
-                        "loser_value": row["loser_value"],
-                        "override_notes": row["override_notes"],
-                        "completed_at": row["completed_at"],
-                        "winner_elo_change": row["winner_elo_change"],
-                        "loser_elo_change": row["loser_elo_change"],
-                        "winner_new_elo": row["winner_new_elo"],
-                        "loser_new_elo": row["loser_new_elo"],
-                        "winner_old_elo": row["winner_old_elo"],
-                        "loser_old_elo": row["loser_old_elo"],
-                    }
-                for row in conn.execute("SELECT guild_id, category, match_id, user_id, kind, value, metric FROM active_match_submissions"):
-                    key = (row["guild_id"], row["category"], row["match_id"])
-                    match = match_index.get(key)
-                    if not match:
-                        continue
-                    match.setdefault("submissions", {})[str(row["user_id"])] = {
-                        "kind": row["kind"],
-                        "value": row["value"],
-                        "metric": row["metric"],
-                    }
-                for row in conn.execute("SELECT guild_id, category, match_id, user_id FROM active_match_cancel_votes"):
-                    key = (row["guild_id"], row["category"], row["match_id"])
-                    match = match_index.get(key)
-                    if not match:
-                        continue
-                    votes = match.setdefault("cancel_votes", [])
-                    if row["user_id"] not in votes:
-                        votes.append(row["user_id"])
-                for row in conn.execute("SELECT guild_id, category, thread_id, delete_at FROM active_match_deletions"):
-                    gid_s = str(row["guild_id"])
-                    bucket = active_fights.setdefault(gid_s, {}).setdefault(row["category"], {"matches": {}, "deletions": []})
-                    bucket["deletions"].append({"thread_id": row["thread_id"], "delete_at": row["delete_at"]})
-                return {
-                    "guild_configs": guild_configs,
-                    "players": players,
-                    "players_meta": players_meta,
-                    "removed": removed,
-                    "bans": bans,
-                    "decay_state": decay_state,
-                    "bios": bios,
-                    "active_fights": active_fights,
+        if apsw is not None:
+            cur = self._get_apsw_conn().cursor()
+            cur.execute("BEGIN")
+            try:
+                return self._load_all_rows(cur)
+            finally:
+                cur.execute("COMMIT")
+        conn = self._get_conn()
+        with conn:
+            conn.execute("BEGIN")
+            cur = conn.cursor()
+            cur.row_factory = None
+            return self._load_all_rows(cur)
+
+    def _load_all_rows(self, cur: Any) -> Dict[str, Any]:
+        guild_configs: Dict[str, Dict[str, Any]] = {}
+        players: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
+        players_meta: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        removed: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
+        bans: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]] = {}
+        decay_state: Dict[str, Dict[str, Dict[int, str]]] = {}
+        bios: Dict[str, Dict[str, Dict[int, str]]] = {}
+        active_fights: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for gid, *values, cleanup_seconds in cur.execute(_SQL_SELECT_GUILD_SETTINGS):
+            data = self._ensure_guild_entry(guild_configs, str(gid))
+            data.update({column: value for column, value in zip(_GUILD_SETTING_COLUMNS, values) if value is not None})
+            data["thread_cleanup_seconds"] = cleanup_seconds or 21600
+        for (
+            gid,
+            safe,
+            display_name,
+            *channel_values,
+            pending_timeout_enabled,
+            anti_farm_enabled,
+            inactivity_decay_enabled,
+            inactivity_decay_days,
+            inactivity_decay_amount,
+            inactivity_decay_floor,
+            cleanup_seconds,
+        ) in cur.execute(_SQL_SELECT_LEADERBOARDS):
+            data = self._ensure_guild_entry(guild_configs, str(gid))
+            entry = {"name": display_name, **dict(zip(_GUILD_SETTING_COLUMNS, channel_values))}
+            entry.update(
+                {
+                    "pending_timeout_enabled": bool(pending_timeout_enabled),
+                    "anti_farm_enabled": bool(anti_farm_enabled),
+                    "inactivity_decay_enabled": bool(inactivity_decay_enabled),
+                    "inactivity_decay_days": int(inactivity_decay_days) if inactivity_decay_days is not None else 7,
+                    "inactivity_decay_amount": float(inactivity_decay_amount) if inactivity_decay_amount is not None else 10.0,
+                    "inactivity_decay_floor": float(inactivity_decay_floor) if inactivity_decay_floor is not None else 800.0,
+                    "thread_cleanup_seconds": cleanup_seconds or data.get("thread_cleanup_seconds", 21600),
                 }
+            )
+            data["leaderboards"][safe] = entry
+        for gid, safe, mode_key, mode_target in cur.execute(
+            "SELECT guild_id, category, mode_key, mode_target FROM category_modes"
+        ):
+            data = self._ensure_guild_entry(guild_configs, str(gid))
+            data["category_modes"][safe] = {"key": mode_key, "target": mode_target}
+        for gid, name in cur.execute("SELECT guild_id, name FROM legacy_categories"):
+            data = self._ensure_guild_entry(guild_configs, str(gid))
+            if name not in data["categories"]:
+                data["categories"].append(name)
+        by_board = itemgetter(0, 1)
+        rows = cur.execute(
+            "SELECT guild_id, category, user_id, elo, wins, losses FROM players ORDER BY guild_id, category, rowid"
+        ).fetchall()
+        for (gid, safe), group in groupby(rows, key=by_board):
+            players.setdefault(str(gid), {})[safe] = {
+                uid: {"elo": elo, "wins": wins, "losses": losses}
+                for _, _, uid, elo, wins, losses in group
+            }
+        rows = cur.execute(
+            "SELECT guild_id, user_id, display_name, avatar_url FROM player_meta ORDER BY guild_id, rowid"
+        ).fetchall()
+        for gid, group in groupby(rows, key=itemgetter(0)):
+            players_meta[str(gid)] = {
+                uid: {"name": name, "avatar": avatar}
+                for _, uid, name, avatar in group
+            }
+        rows = cur.execute(
+            "SELECT guild_id, category, user_id, elo, wins, losses FROM removed_players ORDER BY guild_id, category, user_id"
+        ).fetchall()
+        for (gid, safe), group in groupby(rows, key=by_board):
+            removed.setdefault(str(gid), {})[safe] = {
+                uid: {"elo": elo, "wins": wins, "losses": losses}
+                for _, _, uid, elo, wins, losses in group
+            }
+        rows = cur.execute(
+            "SELECT guild_id, scope_category, user_id, reason, banned_by, banned_at FROM player_bans ORDER BY guild_id, rowid"
+        ).fetchall()
+        for gid, group in groupby(rows, key=itemgetter(0)):
+            scopes = bans.setdefault(str(gid), {})
+            for _, scope, uid, reason, banned_by, banned_at in group:
+                scopes.setdefault(scope or GLOBAL_BAN_SCOPE, {})[uid] = {
+                    "reason": reason,
+                    "banned_by": banned_by,
+                    "banned_at": banned_at,
+                }
+        rows = cur.execute(
+            "SELECT guild_id, category, user_id, last_decay_at FROM player_decay ORDER BY guild_id, category, rowid"
+        ).fetchall()
+        for (gid, safe), group in groupby(rows, key=by_board):
+            decay_state.setdefault(str(gid), {})[safe] = {uid: marker for _, _, uid, marker in group}
+        rows = cur.execute(
+            "SELECT guild_id, category, user_id, bio FROM bios ORDER BY guild_id, category, user_id"
+        ).fetchall()
+        for (gid, safe), group in groupby(rows, key=by_board):
+            bios.setdefault(str(gid), {})[safe] = {uid: bio for _, _, uid, bio in group}
+        for (
+            gid,
+            category,
+            match_id,
+            leaderboard,
+            challenger_id,
+            opponent_id,
+            status,
+            channel_id,
+            message_id,
+            thread_id,
+            thread_message_id,
+            created_at,
+            rank_range,
+            mode_key,
+            mode_target,
+            response_deadline,
+            accepted_at,
+            has_result,
+            *result_values,
+            submissions_json,
+            cancel_votes_json,
+        ) in cur.execute(_SQL_SELECT_ACTIVE_MATCHES):
+            bucket = active_fights.setdefault(str(gid), {}).setdefault(category, {"matches": {}, "deletions": []})
+            match_data: Dict[str, Any] = {
+                "id": match_id,
+                "leaderboard": leaderboard,
+                "challenger_id": challenger_id,
+                "opponent_id": opponent_id,
+                "status": status,
+                "channel_id": channel_id,
+                "message_id": message_id,
+                "thread_id": thread_id,
+                "thread_message_id": thread_message_id,
+                "created_at": created_at,
+                "rank_range": rank_range,
+                "mode": {"key": mode_key, "target": mode_target},
+                # Metrics travel as %.17g text because SQLite's JSON encoder rounds REALs to 15 digits.
+                "submissions": {
+                    str(uid): {
+                        "kind": kind,
+                        "value": value,
+                        "metric": float(metric) if metric is not None else None,
+                    }
+                    for uid, kind, value, metric in _json_loads(submissions_json)
+                },
+                "cancel_votes": _json_loads(cancel_votes_json),
+            }
+            if response_deadline:
+                match_data["response_deadline"] = response_deadline
+            if accepted_at:
+                match_data["accepted_at"] = accepted_at
+            if has_result:
+                match_data["result"] = dict(zip(_MATCH_RESULT_COLUMNS, result_values))
+            bucket["matches"][match_id] = match_data
+        for gid, category, thread_id, delete_at in cur.execute(
+            "SELECT guild_id, category, thread_id, delete_at FROM active_match_deletions"
+        ):
+            bucket = active_fights.setdefault(str(gid), {}).setdefault(category, {"matches": {}, "deletions": []})
+            bucket["deletions"].append({"thread_id": thread_id, "delete_at": delete_at})
+        return {
+            "guild_configs": guild_configs,
+            "players": players,
+            "players_meta": players_meta,
+            "removed": removed,
+            "bans": bans,
+            "decay_state": decay_state,
+            "bios": bios,
+            "active_fights": active_fights,
+        }
     def save_guild_configs(self, configs: Dict[str, Dict[str, Any]]) -> None:
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
                 cur = conn.cursor()
                 seen: List[int] = []
+                board_rows: List[Tuple[Any, ...]] = []
+                mode_rows: List[Tuple[Any, ...]] = []
+                legacy_rows: List[Tuple[int, str]] = []
+                snapshots: Dict[int, Dict[str, Any]] = {}
                 for gid_s, payload in configs.items():
                     try:
                         gid = int(gid_s)
@@ -465,27 +1028,7 @@ class BoardStorage:
                         continue
                     seen.append(gid)
                     cur.execute(
-                        """
-                        INSERT INTO guild_settings (
-                            guild_id,
-                            participant_role_id,
-                            challenge_channel_id,
-                            outgoing_channel_id,
-                            announce_channel_id,
-                            leaderboard_channel_id,
-                            leaderboard_message_id,
-                            thread_cleanup_seconds
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(guild_id) DO UPDATE SET
-                            participant_role_id=excluded.participant_role_id,
-                            challenge_channel_id=excluded.challenge_channel_id,
-                            outgoing_channel_id=excluded.outgoing_channel_id,
-                            announce_channel_id=excluded.announce_channel_id,
-                            leaderboard_channel_id=excluded.leaderboard_channel_id,
-                            leaderboard_message_id=excluded.leaderboard_message_id,
-                            thread_cleanup_seconds=excluded.thread_cleanup_seconds
-                        """,
+                        _SQL_UPSERT_GUILD_SETTINGS,
                         (
                             gid,
                             payload.get("participant_role_id"),
@@ -497,10 +1040,8 @@ class BoardStorage:
                             payload.get("thread_cleanup_seconds", 21600),
                         ),
                     )
-                    cur.execute("DELETE FROM leaderboards WHERE guild_id=?", (gid,))
-                    cur.execute("DELETE FROM category_modes WHERE guild_id=?", (gid,))
-                    cur.execute("DELETE FROM legacy_categories WHERE guild_id=?", (gid,))
                     boards = payload.get("leaderboards", {})
+                    board_map: Dict[str, Tuple[Any, ...]] = {}
                     modes_map: Dict[str, Tuple[str, Optional[int]]] = {}
                     for safe_key, data in payload.get("category_modes", {}).items():
                         if isinstance(data, dict):
@@ -508,46 +1049,23 @@ class BoardStorage:
                             modes_map[normalize_category(safe_key)] = (key, data.get("target"))
                     for safe_key, board in boards.items():
                         safe = normalize_category(safe_key)
-                        cur.execute(
-                            """
-                            INSERT INTO leaderboards (
-                                guild_id,
-                                category,
-                                display_name,
-                                participant_role_id,
-                                challenge_channel_id,
-                                outgoing_channel_id,
-                                announce_channel_id,
-                                leaderboard_channel_id,
-                                leaderboard_message_id,
-                                pending_timeout_enabled,
-                                anti_farm_enabled,
-                                inactivity_decay_enabled,
-                                inactivity_decay_days,
-                                inactivity_decay_amount,
-                                inactivity_decay_floor,
-                                thread_cleanup_seconds
-                            )
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                gid,
-                                safe,
-                                board.get("name", self._display_from_safe(safe)),
-                                board.get("participant_role_id"),
-                                board.get("challenge_channel_id"),
-                                board.get("outgoing_channel_id"),
-                                board.get("announce_channel_id"),
-                                board.get("leaderboard_channel_id"),
-                                board.get("leaderboard_message_id"),
-                                1 if board.get("pending_timeout_enabled", True) else 0,
-                                1 if board.get("anti_farm_enabled", True) else 0,
-                                1 if board.get("inactivity_decay_enabled", True) else 0,
-                                max(1, int(board.get("inactivity_decay_days", 7))),
-                                max(0.0, float(board.get("inactivity_decay_amount", 10.0))),
-                                max(0.0, float(board.get("inactivity_decay_floor", 800.0))),
-                                board.get("thread_cleanup_seconds", payload.get("thread_cleanup_seconds", 21600)),
-                            ),
+                        board_map[safe] = (
+                            gid,
+                            safe,
+                            board.get("name", self._display_from_safe(safe)),
+                            board.get("participant_role_id"),
+                            board.get("challenge_channel_id"),
+                            board.get("outgoing_channel_id"),
+                            board.get("announce_channel_id"),
+                            board.get("leaderboard_channel_id"),
+                            board.get("leaderboard_message_id"),
+                            1 if board.get("pending_timeout_enabled", True) else 0,
+                            1 if board.get("anti_farm_enabled", True) else 0,
+                            1 if board.get("inactivity_decay_enabled", True) else 0,
+                            max(1, int(board.get("inactivity_decay_days", 7))),
+                            max(0.0, float(board.get("inactivity_decay_amount", 10.0))),
+                            max(0.0, float(board.get("inactivity_decay_floor", 800.0))),
+                            board.get("thread_cleanup_seconds", payload.get("thread_cleanup_seconds", 21600)),
                         )
                         mode = board.get("mode")
                         if isinstance(mode, dict):
@@ -555,98 +1073,129 @@ class BoardStorage:
                             modes_map[safe] = (key, mode.get("target"))
                         elif safe not in modes_map:
                             modes_map[safe] = ("speedrun", None)
-                    for safe, (mode_key, mode_target) in modes_map.items():
-                        cur.execute(
-                            """
-                            INSERT INTO category_modes (guild_id, category, mode_key, mode_target)
-                            VALUES (?, ?, ?, ?)
-                            """,
-                            (gid, safe, mode_key, mode_target),
-                        )
-                    for name in payload.get("categories", []):
+                    mode_map = {
+                        safe: (gid, safe, mode_key, mode_target)
+                        for safe, (mode_key, mode_target) in modes_map.items()
+                    }
+                    legacy_names = list(dict.fromkeys(payload.get("categories", [])))
+                    snapshots[gid] = {"leaderboards": board_map, "category_modes": mode_map, "categories": legacy_names}
+                    previous = self._last_snapshot.get(gid)
+                    if previous is None:
+                        cur.execute("DELETE FROM leaderboards WHERE guild_id=?", (gid,))
+                        cur.execute("DELETE FROM category_modes WHERE guild_id=?", (gid,))
+                        cur.execute("DELETE FROM legacy_categories WHERE guild_id=?", (gid,))
+                        previous = {"leaderboards": {}, "category_modes": {}, "categories": []}
+                    for table, current in (("leaderboards", board_map), ("category_modes", mode_map)):
+                        stale = [safe for safe in previous[table] if safe not in current]
+                        if stale:
+                            placeholders = ",".join("?" for _ in stale)
+                            cur.execute(
+                                f"DELETE FROM {table} WHERE guild_id=? AND category IN ({placeholders})",
+                                (gid, *stale),
+                            )
+                    stale_names = [name for name in previous["categories"] if name not in legacy_names]
+                    if stale_names:
+                        placeholders = ",".join("?" for _ in stale_names)
                         cur.execute(
-                            "INSERT INTO legacy_categories (guild_id, name) VALUES (?, ?)",
-                            (gid, name),
+                            f"DELETE FROM legacy_categories WHERE guild_id=? AND name IN ({placeholders})",
+                            (gid, *stale_names),
                         )
+                    board_rows.extend(
+                        row for safe, row in board_map.items() if previous["leaderboards"].get(safe) != row
+                    )
+                    mode_rows.extend(
+                        row for safe, row in mode_map.items() if previous["category_modes"].get(safe) != row
+                    )
+                    legacy_rows.extend((gid, name) for name in legacy_names if name not in previous["categories"])
+                cur.executemany(_SQL_UPSERT_LEADERBOARD, board_rows)
+                cur.executemany(_SQL_UPSERT_CATEGORY_MODE, mode_rows)
+                cur.executemany("INSERT OR IGNORE INTO legacy_categories (guild_id, name) VALUES (?, ?)", legacy_rows)
                 if seen:
-                    placeholders = ",".join("?" for _ in seen)
-                    cur.execute(f"DELETE FROM guild_settings WHERE guild_id NOT IN ({placeholders})", seen)
-                    cur.execute(f"DELETE FROM leaderboards WHERE guild_id NOT IN ({placeholders})", seen)
-                    cur.execute(f"DELETE FROM category_modes WHERE guild_id NOT IN ({placeholders})", seen)
-                    cur.execute(f"DELETE FROM legacy_categories WHERE guild_id NOT IN ({placeholders})", seen)
+                    cur.execute("CREATE TEMP TABLE IF NOT EXISTS _seen_guilds (guild_id INTEGER PRIMARY KEY)")
+                    cur.execute("DELETE FROM _seen_guilds")
+                    cur.executemany("INSERT OR IGNORE INTO _seen_guilds (guild_id) VALUES (?)", [(gid,) for gid in seen])
+                    cur.execute("DELETE FROM guild_settings WHERE guild_id NOT IN (SELECT guild_id FROM _seen_guilds)")
+                    cur.execute("DELETE FROM leaderboards WHERE guild_id NOT IN (SELECT guild_id FROM _seen_guilds)")
+                    cur.execute("DELETE FROM category_modes WHERE guild_id NOT IN (SELECT guild_id FROM _seen_guilds)")
+                    cur.execute("DELETE FROM legacy_categories WHERE guild_id NOT IN (SELECT guild_id FROM _seen_guilds)")
+            if seen:
+                self._last_snapshot = snapshots
+            else:
+                self._last_snapshot.update(snapshots)
     def load_players(self, guild_id: int, category: str) -> Dict[int, Dict[str, Any]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                result: Dict[int, Dict[str, Any]] = {}
-                for row in conn.execute(
-                    "SELECT user_id, elo, wins, losses FROM players WHERE guild_id=? AND category=?",
-                    (guild_id, safe),
-                ):
-                    result[row["user_id"]] = {
-                        "elo": row["elo"],
-                        "wins": row["wins"],
-                        "losses": row["losses"],
-                    }
-                return result
+        conn = self._get_conn()
+        with conn:
+            result: Dict[int, Dict[str, Any]] = {}
+            for row in conn.execute(
+                "SELECT user_id, elo, wins, losses FROM players WHERE guild_id=? AND category=?",
+                (guild_id, safe),
+            ):
+                result[row["user_id"]] = {
+                    "elo": row["elo"],
+                    "wins": row["wins"],
+                    "losses": row["losses"],
+                }
+            return result
 
     def save_players(self, guild_id: int, category: str, players: Dict[int, Dict[str, Any]]) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
-                cur.execute("DELETE FROM players WHERE guild_id=? AND category=?", (guild_id, safe))
-                for user_id, payload in players.items():
-                    cur.execute(
-                        """
-                        INSERT INTO players (guild_id, category, user_id, elo, wins, losses)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            guild_id,
-                            safe,
-                            user_id,
-                            float(payload.get("elo", 0.0)),
-                            int(payload.get("wins", 0)),
-                            int(payload.get("losses", 0)),
-                        ),
+                current = {
+                    user_id: (
+                        float(payload.get("elo", 0.0)),
+                        int(payload.get("wins", 0)),
+                        int(payload.get("losses", 0)),
+                    )
+                    for user_id, payload in players.items()
+                }
+                previous = self._players_snapshot.get((guild_id, safe))
+                if previous is None:
+                    cur.execute("DELETE FROM players WHERE guild_id=? AND category=?", (guild_id, safe))
+                    previous = {}
+                stale = [user_id for user_id in previous if user_id not in current]
+                if stale:
+                    cur.executemany(
+                        "DELETE FROM players WHERE guild_id=? AND category=? AND user_id=?",
+                        [(guild_id, safe, user_id) for user_id in stale],
                     )
+                cur.executemany(
+                    _SQL_UPSERT_PLAYER,
+                    [
+                        (guild_id, safe, user_id, *values)
+                        for user_id, values in current.items()
+                        if previous.get(user_id) != values
+                    ],
+                )
+            self._players_snapshot[(guild_id, safe)] = current
 
-    def save_player_meta(self, guild_id: int, meta: Dict[str, Dict[str, Any]]) -> None:
+    def save_player_meta(self, guild_id: int, meta: Dict[int, Dict[str, Any]]) -> None:
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 cur.execute("DELETE FROM player_meta WHERE guild_id=?", (guild_id,))
-                for uid_str, payload in meta.items():
-                    try:
-                        user_id = int(uid_str)
-                    except ValueError:
-                        continue
-                    cur.execute(
-                        """
-                        INSERT INTO player_meta (guild_id, user_id, display_name, avatar_url)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (
-                            guild_id,
-                            user_id,
-                            payload.get("name"),
-                            payload.get("avatar"),
-                        ),
-                    )
+                cur.executemany(
+                    _SQL_INSERT_PLAYER_META,
+                    [
+                        (guild_id, user_id, payload.get("name"), payload.get("avatar"))
+                        for user_id, payload in meta.items()
+                    ],
+                )
 
     def save_removed(self, guild_id: int, category: str, removed_map: Dict[int, Dict[str, Any]]) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 cur.execute("DELETE FROM removed_players WHERE guild_id=? AND category=?", (guild_id, safe))
-                for user_id, payload in removed_map.items():
-                    cur.execute(
-                        """
-                        INSERT INTO removed_players (guild_id, category, user_id, elo, wins, losses)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
+                cur.executemany(
+                    _SQL_INSERT_REMOVED_PLAYER,
+                    [
                         (
                             guild_id,
                             safe,
@@ -654,14 +1203,18 @@ class BoardStorage:
                             float(payload.get("elo", 0.0)),
                             int(payload.get("wins", 0)),
                             int(payload.get("losses", 0)),
-                        ),
-                    )
+                        )
+                        for user_id, payload in removed_map.items()
+                    ],
+                )
 
     def save_bans(self, guild_id: int, bans_map: Dict[str, Dict[int, Dict[str, Any]]]) -> None:
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 cur.execute("DELETE FROM player_bans WHERE guild_id=?", (guild_id,))
+                rows = []
                 for raw_scope, users in bans_map.items():
                     if not isinstance(users, dict):
                         continue
@@ -685,11 +1238,7 @@ class BoardStorage:
                             banned_by_value = int(banned_by) if banned_by is not None else None
                         except Exception:
                             banned_by_value = None
-                        cur.execute(
-                            """
-                            INSERT INTO player_bans (guild_id, scope_category, user_id, reason, banned_by, banned_at)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                            """,
+                        rows.append(
                             (
                                 guild_id,
                                 scope,
@@ -697,15 +1246,18 @@ class BoardStorage:
                                 payload.get("reason"),
                                 banned_by_value,
                                 str(banned_at),
-                            ),
+                            )
                         )
+                cur.executemany(_SQL_INSERT_PLAYER_BAN, rows)
 
     def save_decay_state(self, guild_id: int, category: str, decay_map: Dict[int, str]) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 cur.execute("DELETE FROM player_decay WHERE guild_id=? AND category=?", (guild_id, safe))
+                rows = []
                 for raw_user_id, raw_marker in decay_map.items():
                     try:
                         user_id = int(raw_user_id)
@@ -714,32 +1266,24 @@ class BoardStorage:
                     marker = str(raw_marker or "").strip()
                     if not marker:
                         continue
-                    cur.execute(
-                        """
-                        INSERT INTO player_decay (guild_id, category, user_id, last_decay_at)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (guild_id, safe, user_id, marker),
-                    )
+                    rows.append((guild_id, safe, user_id, marker))
+                cur.executemany(_SQL_INSERT_PLAYER_DECAY, rows)
 
-    def save_bios(self, guild_id: int, category: str, bios_map: Dict[str, str]) -> None:
+    def save_bios(self, guild_id: int, category: str, bios_map: Dict[int, str]) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 cur.execute("DELETE FROM bios WHERE guild_id=? AND category=?", (guild_id, safe))
-                for uid_str, value in bios_map.items():
-                    try:
-                        user_id = int(uid_str)
-                    except ValueError:
-                        continue
-                    cur.execute(
-                        """
-                        INSERT INTO bios (guild_id, category, user_id, bio)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (guild_id, safe, user_id, value),
-                    )
+                cur.executemany(_SQL_INSERT_BIO, [(guild_id, safe, user_id, value) for user_id, value in bios_map.items()])
+
+    def save_bio(self, guild_id: int, category: str, user_id: int, bio: str) -> None:
+        safe = normalize_category(category)
+        with self._lock:
+            conn = self._get_writer()
+            with conn:
+                conn.execute(_SQL_UPSERT_BIO, (guild_id, safe, int(user_id), bio))
 
     def append_match(
         self,
@@ -755,38 +1299,22 @@ class BoardStorage:
         elo_change: float,
     ) -> int:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                cur = conn.execute(
-                    """
-                    INSERT INTO matches (
-                        guild_id,
-                        category,
-                        user_id,
-                        recorded_at,
-                        opponent_id,
-                        challenger,
-                        user_value,
-                        opponent_value,
-                        result,
-                        elo_change
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        guild_id,
-                        safe,
-                        user_id,
-                        recorded_at,
-                        opponent_id,
-                        1 if challenger else 0,
-                        user_value,
-                        opponent_value,
-                        result,
-                        float(elo_change),
-                    ),
-                )
-                return int(cur.lastrowid)
+        params = (
+            guild_id,
+            safe,
+            user_id,
+            recorded_at,
+            opponent_id,
+            1 if challenger else 0,
+            user_value,
+            opponent_value,
+            result,
+            float(elo_change),
+        )
+        future: Future = Future()
+        self._ensure_write_thread()
+        self._write_q.put((params, future))
+        return future.result()
 
     def audit_completed_history_integrity(
         self,
@@ -796,89 +1324,45 @@ class BoardStorage:
     ) -> Dict[str, Any]:
         safe = normalize_category(category)
         limit = max(1, int(sample_limit))
-        with self._lock:
-            with self._connect() as conn:
-                win_count = int(
-                    conn.execute(
-                        """
-                        SELECT COUNT(*) AS c
-                        FROM matches NOT INDEXED
-                        WHERE guild_id=?
-                          AND category=?
-                          AND result IN ('Win', 'DeclineWin')
-                        """,
-                        (guild_id, safe),
-                    ).fetchone()["c"]
-                )
-                loss_count = int(
-                    conn.execute(
-                        """
-                        SELECT COUNT(*) AS c
-                        FROM matches NOT INDEXED
-                        WHERE guild_id=?
-                          AND category=?
-                          AND result='Loss'
-                        """,
-                        (guild_id, safe),
-                    ).fetchone()["c"]
-                )
-
-                missing_loss_count = int(
-                    conn.execute(
-                        """
-                        SELECT COUNT(*) AS c
-                        FROM matches w NOT INDEXED
-                        WHERE w.guild_id=?
-                          AND w.category=?
-                          AND w.result IN ('Win', 'DeclineWin')
-                          AND NOT EXISTS (
-                                SELECT 1
-                                FROM matches l NOT INDEXED
-                                WHERE l.guild_id=w.guild_id
-                                  AND l.category=w.category
-                                  AND l.recorded_at=w.recorded_at
-                                  AND l.user_id=w.opponent_id
-                                  AND l.opponent_id=w.user_id
-                                  AND l.result='Loss'
-                          )
-                        """,
-                        (guild_id, safe),
-                    ).fetchone()["c"]
-                )
-                missing_win_count = int(
-                    conn.execute(
-                        """
-                        SELECT COUNT(*) AS c
-                        FROM matches l NOT INDEXED
-                        WHERE l.guild_id=?
-                          AND l.category=?
-                          AND l.result='Loss'
-                          AND NOT EXISTS (
-                                SELECT 1
-                                FROM matches w NOT INDEXED
-                                WHERE w.guild_id=l.guild_id
-                                  AND w.category=l.category
-                                  AND w.recorded_at=l.recorded_at
-                                  AND w.user_id=l.opponent_id
-                                  AND w.opponent_id=l.user_id
-                                  AND w.result IN ('Win', 'DeclineWin')
-                          )
-                        """,
-                        (guild_id, safe),
-                    ).fetchone()["c"]
-                )
+        conn = self._get_conn()
+        with conn:
+            conn.execute("BEGIN")
+            win_count = int(
+                conn.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM matches
+                    WHERE guild_id=?
+                      AND category=?
+                      AND result IN ('Win', 'DeclineWin')
+                    """,
+                    (guild_id, safe),
+                ).fetchone()[0]
+            )
+            loss_count = int(
+                conn.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM matches
+                    WHERE guild_id=?
+                      AND category=?
+                      AND result='Loss'
+                    """,
+                    (guild_id, safe),
+                ).fetchone()[0]
+            )
 
-                missing_loss_samples: List[Dict[str, Any]] = []
-                for row in conn.execute(
+            missing_loss_count = int(
+                conn.execute(
                     """
-                    SELECT id, recorded_at, user_id, opponent_id, user_value, opponent_value, result
-                    FROM matches w NOT INDEXED
+                    SELECT COUNT(*)
+                    FROM matches w
                     WHERE w.guild_id=?
                       AND w.category=?
                       AND w.result IN ('Win', 'DeclineWin')
                       AND NOT EXISTS (
                             SELECT 1
-                            FROM matches l NOT INDEXED
+                            FROM matches l
                             WHERE l.guild_id=w.guild_id
                               AND l.category=w.category
                               AND l.recorded_at=w.recorded_at
@@ -886,34 +1370,21 @@ class BoardStorage:
                               AND l.opponent_id=w.user_id
                               AND l.result='Loss'
                       )
-                    ORDER BY w.recorded_at DESC, w.id DESC
-                    LIMIT ?
                     """,
-                    (guild_id, safe, limit),
-                ):
-                    missing_loss_samples.append(
-                        {
-                            "id": int(row["id"]),
-                            "recorded_at": row["recorded_at"],
-                            "user_id": int(row["user_id"]),
-                            "opponent_id": int(row["opponent_id"]),
-                            "user_value": row["user_value"],
-                            "opponent_value": row["opponent_value"],
-                            "result": row["result"],
-                        }
-                    )
-
-                missing_win_samples: List[Dict[str, Any]] = []
-                for row in conn.execute(
+                    (guild_id, safe),
+                ).fetchone()[0]
+            )
+            missing_win_count = int(
+                conn.execute(
                     """
-                    SELECT id, recorded_at, user_id, opponent_id, user_value, opponent_value, result
-                    FROM matches l NOT INDEXED
+                    SELECT COUNT(*)
+                    FROM matches l
                     WHERE l.guild_id=?
                       AND l.category=?
                       AND l.result='Loss'
                       AND NOT EXISTS (
                             SELECT 1
-                            FROM matches w NOT INDEXED
+                            FROM matches w
                             WHERE w.guild_id=l.guild_id
                               AND w.category=l.category
                               AND w.recorded_at=l.recorded_at
@@ -921,46 +1392,88 @@ class BoardStorage:
                               AND w.opponent_id=l.user_id
                               AND w.result IN ('Win', 'DeclineWin')
                       )
-                    ORDER BY l.recorded_at DESC, l.id DESC
-                    LIMIT ?
                     """,
-                    (guild_id, safe, limit),
-                ):
-                    missing_win_samples.append(
-                        {
-                            "id": int(row["id"]),
-                            "recorded_at": row["recorded_at"],
-                            "user_id": int(row["user_id"]),
-                            "opponent_id": int(row["opponent_id"]),
-                            "user_value": row["user_value"],
-                            "opponent_value": row["opponent_value"],
-                            "result": row["result"],
-                        }
-                    )
+                    (guild_id, safe),
+                ).fetchone()[0]
+            )
 
-                orphan_announcement_count = 0
-                orphan_announcement_samples: List[int] = []
-                try:
-                    orphan_announcement_count = int(
-                        conn.execute(
-                            """
-                            SELECT COUNT(*) AS c
-                            FROM match_announcements a
-                            LEFT JOIN matches w
-                              ON w.guild_id=a.guild_id
-                             AND w.category=a.category
-                             AND w.id=a.winner_match_id
-                             AND w.result IN ('Win', 'DeclineWin')
-                            WHERE a.guild_id=?
-                              AND a.category=?
-                              AND w.id IS NULL
-                            """,
-                            (guild_id, safe),
-                        ).fetchone()["c"]
-                    )
-                    for row in conn.execute(
+            missing_loss_samples: List[Dict[str, Any]] = []
+            for row in conn.execute(
+                """
+                SELECT id, recorded_at, user_id, opponent_id, user_value, opponent_value, result
+                FROM matches w
+                WHERE w.guild_id=?
+                  AND w.category=?
+                  AND w.result IN ('Win', 'DeclineWin')
+                  AND NOT EXISTS (
+                        SELECT 1
+                        FROM matches l
+                        WHERE l.guild_id=w.guild_id
+                          AND l.category=w.category
+                          AND l.recorded_at=w.recorded_at
+                          AND l.user_id=w.opponent_id
+                          AND l.opponent_id=w.user_id
+                          AND l.result='Loss'
+                  )
+                ORDER BY w.recorded_at DESC, w.id DESC
+                LIMIT ?
+                """,
+                (guild_id, safe, limit),
+            ):
+                missing_loss_samples.append(
+                    {
+                        "id": int(row["id"]),
+                        "recorded_at": row["recorded_at"],
+                        "user_id": int(row["user_id"]),
+                        "opponent_id": int(row["opponent_id"]),
+                        "user_value": row["user_value"],
+                        "opponent_value": row["opponent_value"],
+                        "result": row["result"],
+                    }
+                )
+
+            missing_win_samples: List[Dict[str, Any]] = []
+            for row in conn.execute(
+                """
+                SELECT id, recorded_at, user_id, opponent_id, user_value, opponent_value, result
+                FROM matches l
+                WHERE l.guild_id=?
+                  AND l.category=?
+                  AND l.result='Loss'
+                  AND NOT EXISTS (
+                        SELECT 1
+                        FROM matches w
+                        WHERE w.guild_id=l.guild_id
+                          AND w.category=l.category
+                          AND w.recorded_at=l.recorded_at
+                          AND w.user_id=l.opponent_id
+                          AND w.opponent_id=l.user_id
+                          AND w.result IN ('Win', 'DeclineWin')
+                  )
+                ORDER BY l.recorded_at DESC, l.id DESC
+                LIMIT ?
+                """,
+                (guild_id, safe, limit),
+            ):
+                missing_win_samples.append(
+                    {
+                        "id": int(row["id"]),
+                        "recorded_at": row["recorded_at"],
+                        "user_id": int(row["user_id"]),
+                        "opponent_id": int(row["opponent_id"]),
+                        "user_value": row["user_value"],
+                        "opponent_value": row["opponent_value"],
+                        "result": row["result"],
+                    }
+                )
+
+            orphan_announcement_count = 0
+            orphan_announcement_samples: List[int] = []
+            try:
+                orphan_announcement_count = int(
+                    conn.execute(
                         """
-                        SELECT a.winner_match_id
+                        SELECT COUNT(*)
                         FROM match_announcements a
                         LEFT JOIN matches w
                           ON w.guild_id=a.guild_id
@@ -970,62 +1483,78 @@ class BoardStorage:
                         WHERE a.guild_id=?
                           AND a.category=?
                           AND w.id IS NULL
-                        ORDER BY a.winner_match_id DESC
-                        LIMIT ?
                         """,
-                        (guild_id, safe, limit),
-                    ):
-                        orphan_announcement_samples.append(int(row["winner_match_id"]))
-                except sqlite3.OperationalError:
-                    orphan_announcement_count = 0
-                    orphan_announcement_samples = []
-
-                has_issues = (
-                    missing_loss_count > 0
-                    or missing_win_count > 0
-                    or orphan_announcement_count > 0
+                        (guild_id, safe),
+                    ).fetchone()[0]
                 )
-                return {
-                    "has_issues": has_issues,
-                    "wins": win_count,
-                    "losses": loss_count,
-                    "missing_loss_count": missing_loss_count,
-                    "missing_win_count": missing_win_count,
-                    "orphan_announcement_count": orphan_announcement_count,
-                    "missing_loss_samples": missing_loss_samples,
-                    "missing_win_samples": missing_win_samples,
-                    "orphan_announcement_samples": orphan_announcement_samples,
-                }
+                for row in conn.execute(
+                    """
+                    SELECT a.winner_match_id
+                    FROM match_announcements a
+                    LEFT JOIN matches w
+                      ON w.guild_id=a.guild_id
+                     AND w.category=a.category
+                     AND w.id=a.winner_match_id
+                     AND w.result IN ('Win', 'DeclineWin')
+                    WHERE a.guild_id=?
+                      AND a.category=?
+                      AND w.id IS NULL
+                    ORDER BY a.winner_match_id DESC
+                    LIMIT ?
+                    """,
+                    (guild_id, safe, limit),
+                ):
+                    orphan_announcement_samples.append(int(row["winner_match_id"]))
+            except sqlite3.OperationalError:
+                orphan_announcement_count = 0
+                orphan_announcement_samples = []
+
+            has_issues = (
+                missing_loss_count > 0
+                or missing_win_count > 0
+                or orphan_announcement_count > 0
+            )
+            return {
+                "has_issues": has_issues,
+                "wins": win_count,
+                "losses": loss_count,
+                "missing_loss_count": missing_loss_count,
+                "missing_win_count": missing_win_count,
+                "orphan_announcement_count": orphan_announcement_count,
+                "missing_loss_samples": missing_loss_samples,
+                "missing_win_samples": missing_win_samples,
+                "orphan_announcement_samples": orphan_announcement_samples,
+            }
 
     def load_raw_match_rows(self, guild_id: int, category: str) -> List[Dict[str, Any]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
-                    WHERE guild_id=? AND category=?
-                    ORDER BY recorded_at ASC, id ASC
-                    """,
-                    (guild_id, safe),
+        conn = self._get_conn()
+        with conn:
+            rows = conn.execute(
+                """
+                SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
+                FROM matches
+                WHERE guild_id=? AND category=?
+                ORDER BY recorded_at ASC, id ASC
+                """,
+                (guild_id, safe),
+            )
+            output: List[Dict[str, Any]] = []
+            for row in rows:
+                output.append(
+                    {
+                        "id": int(row["id"]),
+                        "user_id": int(row["user_id"]),
+                        "recorded_at": row["recorded_at"],
+                        "opponent_id": int(row["opponent_id"]),
+                        "challenger": bool(row["challenger"]),
+                        "user_value": row["user_value"],
+                        "opponent_value": row["opponent_value"],
+                        "result": row["result"],
+                        "elo_change": float(row["elo_change"]),
+                    }
                 )
-                output: List[Dict[str, Any]] = []
-                for row in rows:
-                    output.append(
-                        {
-                            "id": int(row["id"]),
-                            "user_id": int(row["user_id"]),
-                            "recorded_at": row["recorded_at"],
-                            "opponent_id": int(row["opponent_id"]),
-                            "challenger": bool(row["challenger"]),
-                            "user_value": row["user_value"],
-                            "opponent_value": row["opponent_value"],
-                            "result": row["result"],
-                            "elo_change": float(row["elo_change"]),
-                        }
-                    )
-                return output
+            return output
 
     def load_recent_completed_matches(
         self,
@@ -1034,48 +1563,48 @@ class BoardStorage:
         limit: int = 25,
     ) -> List[Dict[str, Any]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT
-                        w.id AS winner_match_id,
-                        l.id AS loser_match_id,
-                        w.recorded_at AS recorded_at,
-                        w.user_id AS winner_id,
-                        w.opponent_id AS loser_id,
-                        w.user_value AS winner_value,
-                        w.opponent_value AS loser_value
-                    FROM matches w NOT INDEXED
-                    JOIN matches l NOT INDEXED
-                      ON l.guild_id = w.guild_id
-                     AND l.category = w.category
-                     AND l.recorded_at = w.recorded_at
-                     AND l.user_id = w.opponent_id
-                     AND l.opponent_id = w.user_id
-                     AND l.result = 'Loss'
-                    WHERE w.guild_id=?
-                      AND w.category=?
-                      AND w.result IN ('Win', 'DeclineWin')
-                    ORDER BY w.recorded_at DESC, w.id DESC
-                    LIMIT ?
-                    """,
-                    (guild_id, safe, max(1, int(limit))),
+        conn = self._get_conn()
+        with conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    w.id AS winner_match_id,
+                    l.id AS loser_match_id,
+                    w.recorded_at AS recorded_at,
+                    w.user_id AS winner_id,
+                    w.opponent_id AS loser_id,
+                    w.user_value AS winner_value,
+                    w.opponent_value AS loser_value
+                FROM matches w
+                JOIN matches l
+                  ON l.guild_id = w.guild_id
+                 AND l.category = w.category
+                 AND l.recorded_at = w.recorded_at
+                 AND l.user_id = w.opponent_id
+                 AND l.opponent_id = w.user_id
+                 AND l.result = 'Loss'
+                WHERE w.guild_id=?
+                  AND w.category=?
+                  AND w.result IN ('Win', 'DeclineWin')
+                ORDER BY w.recorded_at DESC, w.id DESC
+                LIMIT ?
+                """,
+                (guild_id, safe, max(1, int(limit))),
+            )
+            output: List[Dict[str, Any]] = []
+            for row in rows:
+                output.append(
+                    {
+                        "winner_match_id": int(row["winner_match_id"]),
+                        "loser_match_id": int(row["loser_match_id"]),
+                        "recorded_at": row["recorded_at"],
+                        "winner_id": int(row["winner_id"]),
+                        "loser_id": int(row["loser_id"]),
+                        "winner_value": row["winner_value"],
+                        "loser_value": row["loser_value"],
+                    }
                 )
-                output: List[Dict[str, Any]] = []
-                for row in rows:
-                    output.append(
-                        {
-                            "winner_match_id": int(row["winner_match_id"]),
-                            "loser_match_id": int(row["loser_match_id"]),
-                            "recorded_at": row["recorded_at"],
-                            "winner_id": int(row["winner_id"]),
-                            "loser_id": int(row["loser_id"]),
-                            "winner_value": row["winner_value"],
-                            "loser_value": row["loser_value"],
-                        }
-                    )
-                return output
+            return output
 
     def load_recent_challenger_opponents(
         self,
@@ -1085,26 +1614,26 @@ class BoardStorage:
         limit: int = 4,
     ) -> List[int]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT opponent_id
-                    FROM matches NOT INDEXED
-                    WHERE guild_id=?
-                      AND category=?
-                      AND user_id=?
-                      AND challenger=1
-                      AND result IN ('Win', 'DeclineWin', 'Loss')
-                    ORDER BY recorded_at DESC, id DESC
-                    LIMIT ?
-                    """,
-                    (guild_id, safe, int(challenger_id), max(1, int(limit))),
-                )
-                output: List[int] = []
-                for row in rows:
-                    output.append(int(row["opponent_id"]))
-                return output
+        conn = self._get_conn()
+        with conn:
+            rows = conn.execute(
+                """
+                SELECT opponent_id
+                FROM matches
+                WHERE guild_id=?
+                  AND category=?
+                  AND user_id=?
+                  AND challenger=1
+                  AND result IN ('Win', 'DeclineWin', 'Loss')
+                ORDER BY recorded_at DESC, id DESC
+                LIMIT ?
+                """,
+                (guild_id, safe, int(challenger_id), max(1, int(limit))),
+            )
+            output: List[int] = []
+            for row in rows:
+                output.append(int(row["opponent_id"]))
+            return output
 
     def load_recent_pair_matches(
         self,
@@ -1115,15 +1644,34 @@ class BoardStorage:
         limit: int = 25,
     ) -> List[Dict[str, Any]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
-                    """
-                    SELECT
-                        w.id AS winner_match_id,
+        conn = self._get_conn()
+        with conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    w.id AS winner_match_id,
+                    (
+                        SELECT l.id
+                        FROM matches l
+                        WHERE l.guild_id = w.guild_id
+                          AND l.category = w.category
+                          AND l.recorded_at = w.recorded_at
+                          AND l.user_id = w.opponent_id
+                          AND l.opponent_id = w.user_id
+                          AND l.result = 'Loss'
+                        ORDER BY l.id ASC
+                        LIMIT 1
+                    ) AS loser_match_id,
+                    w.recorded_at AS recorded_at,
+                    w.user_id AS winner_id,
+                    w.opponent_id AS loser_id,
+                    w.user_value AS winner_value,
+                    w.opponent_value AS loser_value,
+                    w.elo_change AS winner_elo_change,
+                    COALESCE(
                         (
-                            SELECT l.id
-                            FROM matches l NOT INDEXED
+                            SELECT l.elo_change
+                            FROM matches l
                             WHERE l.guild_id = w.guild_id
                               AND l.category = w.category
                               AND l.recorded_at = w.recorded_at
@@ -1132,59 +1680,40 @@ class BoardStorage:
                               AND l.result = 'Loss'
                             ORDER BY l.id ASC
                             LIMIT 1
-                        ) AS loser_match_id,
-                        w.recorded_at AS recorded_at,
-                        w.user_id AS winner_id,
-                        w.opponent_id AS loser_id,
-                        w.user_value AS winner_value,
-                        w.opponent_value AS loser_value,
-                        w.elo_change AS winner_elo_change,
-                        COALESCE(
-                            (
-                                SELECT l.elo_change
-                                FROM matches l NOT INDEXED
-                                WHERE l.guild_id = w.guild_id
-                                  AND l.category = w.category
-                                  AND l.recorded_at = w.recorded_at
-                                  AND l.user_id = w.opponent_id
-                                  AND l.opponent_id = w.user_id
-                                  AND l.result = 'Loss'
-                                ORDER BY l.id ASC
-                                LIMIT 1
-                            ),
-                            -w.elo_change
-                        ) AS loser_elo_change
-                    FROM matches w NOT INDEXED
-                    WHERE w.guild_id=?
-                      AND w.category=?
-                      AND w.result IN ('Win', 'DeclineWin')
-                      AND (
-                            (w.user_id=? AND w.opponent_id=?)
-                            OR
-                            (w.user_id=? AND w.opponent_id=?)
-                          )
-                    ORDER BY w.recorded_at DESC, w.id DESC
-                    LIMIT ?
-                    """,
-                    (guild_id, safe, player_a, player_b, player_b, player_a, max(1, int(limit))),
+                        ),
+                        -w.elo_change
+                    ) AS loser_elo_change
+                FROM matches w
+                WHERE w.guild_id=?
+                  AND w.category=?
+                  AND w.result IN ('Win', 'DeclineWin')
+                  AND (
+                        (w.user_id=? AND w.opponent_id=?)
+                        OR
+                        (w.user_id=? AND w.opponent_id=?)
+                      )
+                ORDER BY w.recorded_at DESC, w.id DESC
+                LIMIT ?
+                """,
+                (guild_id, safe, player_a, player_b, player_b, player_a, max(1, int(limit))),
+            )
+            output: List[Dict[str, Any]] = []
+            for row in rows:
+                loser_match_id = row["loser_match_id"]
+                output.append(
+                    {
+                        "winner_match_id": int(row["winner_match_id"]),
+                        "loser_match_id": int(loser_match_id) if loser_match_id is not None else None,
+                        "recorded_at": row["recorded_at"],
+                        "winner_id": int(row["winner_id"]),
+                        "loser_id": int(row["loser_id"]),
+                        "winner_value": row["winner_value"],
+                        "loser_value": row["loser_value"],
+                        "winner_elo_change": float(row["winner_elo_change"]),
+                        "loser_elo_change": float(row["loser_elo_change"]),
+                    }
                 )
-                output: List[Dict[str, Any]] = []
-                for row in rows:
-                    loser_match_id = row["loser_match_id"]
-                    output.append(
-                        {
-                            "winner_match_id": int(row["winner_match_id"]),
-                            "loser_match_id": int(loser_match_id) if loser_match_id is not None else None,
-                            "recorded_at": row["recorded_at"],
-                            "winner_id": int(row["winner_id"]),
-                            "loser_id": int(row["loser_id"]),
-                            "winner_value": row["winner_value"],
-                            "loser_value": row["loser_value"],
-                            "winner_elo_change": float(row["winner_elo_change"]),
-                            "loser_elo_change": float(row["loser_elo_change"]),
-                        }
-                    )
-                return output
+            return output
 
     def load_match_pair_by_winner_row_id(
         self,
@@ -1193,65 +1722,65 @@ class BoardStorage:
         winner_row_id: int,
     ) -> Optional[Dict[str, Dict[str, Any]]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                winner_row = conn.execute(
-                    """
-                    SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
-                    WHERE guild_id=? AND category=? AND id=? AND result='Win'
-                    """,
-                    (guild_id, safe, int(winner_row_id)),
-                ).fetchone()
-                if winner_row is None:
-                    return None
-                loser_row = conn.execute(
-                    """
-                    SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
-                    WHERE guild_id=?
-                      AND category=?
-                      AND recorded_at=?
-                      AND user_id=?
-                      AND opponent_id=?
-                      AND result='Loss'
-                    ORDER BY id ASC
-                    LIMIT 1
-                    """,
-                    (
-                        guild_id,
-                        safe,
-                        winner_row["recorded_at"],
-                        int(winner_row["opponent_id"]),
-                        int(winner_row["user_id"]),
-                    ),
-                ).fetchone()
-                if loser_row is None:
-                    return None
-                return {
-                    "winner": {
-                        "id": int(winner_row["id"]),
-                        "user_id": int(winner_row["user_id"]),
-                        "recorded_at": winner_row["recorded_at"],
-                        "opponent_id": int(winner_row["opponent_id"]),
-                        "challenger": bool(winner_row["challenger"]),
-                        "user_value": winner_row["user_value"],
-                        "opponent_value": winner_row["opponent_value"],
-                        "result": winner_row["result"],
-                        "elo_change": float(winner_row["elo_change"]),
-                    },
-                    "loser": {
-                        "id": int(loser_row["id"]),
-                        "user_id": int(loser_row["user_id"]),
-                        "recorded_at": loser_row["recorded_at"],
-                        "opponent_id": int(loser_row["opponent_id"]),
-                        "challenger": bool(loser_row["challenger"]),
-                        "user_value": loser_row["user_value"],
-                        "opponent_value": loser_row["opponent_value"],
-                        "result": loser_row["result"],
-                        "elo_change": float(loser_row["elo_change"]),
-                    },
-                }
+        conn = self._get_conn()
+        with conn:
+            winner_row = conn.execute(
+                """
+                SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
+                FROM matches
+                WHERE guild_id=? AND category=? AND id=? AND result='Win'
+                """,
+                (guild_id, safe, int(winner_row_id)),
+            ).fetchone()
+            if winner_row is None:
+                return None
+            loser_row = conn.execute(
+                """
+                SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
+                FROM matches
+                WHERE guild_id=?
+                  AND category=?
+                  AND recorded_at=?
+                  AND user_id=?
+                  AND opponent_id=?
+                  AND result='Loss'
+                ORDER BY id ASC
+                LIMIT 1
+                """,
+                (
+                    guild_id,
+                    safe,
+                    winner_row["recorded_at"],
+                    int(winner_row["opponent_id"]),
+                    int(winner_row["user_id"]),
+                ),
+            ).fetchone()
+            if loser_row is None:
+                return None
+            return {
+                "winner": {
+                    "id": int(winner_row["id"]),
+                    "user_id": int(winner_row["user_id"]),
+                    "recorded_at": winner_row["recorded_at"],
+                    "opponent_id": int(winner_row["opponent_id"]),
+                    "challenger": bool(winner_row["challenger"]),
+                    "user_value": winner_row["user_value"],
+                    "opponent_value": winner_row["opponent_value"],
+                    "result": winner_row["result"],
+                    "elo_change": float(winner_row["elo_change"]),
+                },
+                "loser": {
+                    "id": int(loser_row["id"]),
+                    "user_id": int(loser_row["user_id"]),
+                    "recorded_at": loser_row["recorded_at"],
+                    "opponent_id": int(loser_row["opponent_id"]),
+                    "challenger": bool(loser_row["challenger"]),
+                    "user_value": loser_row["user_value"],
+                    "opponent_value": loser_row["opponent_value"],
+                    "result": loser_row["result"],
+                    "elo_change": float(loser_row["elo_change"]),
+                },
+            }
 
     def delete_match_pair_by_winner_row_id(
         self,
@@ -1261,11 +1790,12 @@ class BoardStorage:
     ) -> Optional[Dict[str, Dict[str, Any]]]:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 winner_row = conn.execute(
                     """
                     SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
+                    FROM matches
                     WHERE guild_id=? AND category=? AND id=? AND result='Win'
                     """,
                     (guild_id, safe, int(winner_row_id)),
@@ -1275,7 +1805,7 @@ class BoardStorage:
                 loser_row = conn.execute(
                     """
                     SELECT id, user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
+                    FROM matches
                     WHERE guild_id=?
                       AND category=?
                       AND recorded_at=?
@@ -1331,7 +1861,8 @@ class BoardStorage:
             return
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 cur = conn.cursor()
                 for payload in rows:
                     try:
@@ -1370,7 +1901,8 @@ class BoardStorage:
     def save_match_announcement(self, guild_id: int, category: str, winner_match_id: int, channel_id: int, message_id: int) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 conn.execute(
                     """
                     INSERT INTO match_announcements (guild_id, category, winner_match_id, channel_id, message_id)
@@ -1384,239 +1916,281 @@ class BoardStorage:
 
     def get_match_announcement(self, guild_id: int, category: str, winner_match_id: int) -> Optional[Dict[str, int]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute(
-                    """
-                    SELECT channel_id, message_id
-                    FROM match_announcements
-                    WHERE guild_id=? AND category=? AND winner_match_id=?
-                    """,
-                    (guild_id, safe, int(winner_match_id)),
-                ).fetchone()
-                if row is None:
-                    return None
-                return {"channel_id": int(row["channel_id"]), "message_id": int(row["message_id"])}
+        conn = self._get_conn()
+        with conn:
+            row = conn.execute(
+                """
+                SELECT channel_id, message_id
+                FROM match_announcements
+                WHERE guild_id=? AND category=? AND winner_match_id=?
+                """,
+                (guild_id, safe, int(winner_match_id)),
+            ).fetchone()
+            if row is None:
+                return None
+            return {"channel_id": int(row["channel_id"]), "message_id": int(row["message_id"])}
 
     def delete_match_announcement(self, guild_id: int, category: str, winner_match_id: int) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            conn = self._get_writer()
+            with conn:
                 conn.execute(
                     "DELETE FROM match_announcements WHERE guild_id=? AND category=? AND winner_match_id=?",
                     (guild_id, safe, int(winner_match_id)),
                 )
 
-    def load_match_history(self, guild_id: int, category: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _history_rows(rows: Iterable[Tuple[Any, ...]]) -> Iterator[Dict[str, Any]]:
+        for user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change in rows:
+            yield {
+                "user_id": str(user_id),
+                "date": recorded_at,
+                "opponent_id": str(opponent_id),
+                "challenger": bool(challenger),
+                "time": user_value,
+                "opponent_time": opponent_value,
+                "result": result,
+                "elo_change": str(elo_change),
+            }
+
+    def iter_match_history(self, guild_id: int, category: str) -> Iterator[Dict[str, Any]]:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(
+        conn = self._get_conn()
+        with conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            yield from self._history_rows(
+                cur.execute(
                     """
                     SELECT user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
-                    FROM matches NOT INDEXED
+                    FROM matches
                     WHERE guild_id=? AND category=?
                     ORDER BY recorded_at ASC, id ASC
                     """,
                     (guild_id, safe),
                 )
-                output: List[Dict[str, Any]] = []
-                for row in rows:
-                    output.append(
-                        {
-                            "user_id": str(row["user_id"]),
-                            "date": row["recorded_at"],
-                            "opponent_id": str(row["opponent_id"]),
-                            "challenger": bool(row["challenger"]),
-                            "time": row["user_value"],
-                            "opponent_time": row["opponent_value"],
-                            "result": row["result"],
-                            "elo_change": str(row["elo_change"]),
-                        }
+            )
+
+    def load_match_history(self, guild_id: int, category: str) -> List[Dict[str, Any]]:
+        return list(self.iter_match_history(guild_id, category))
+
+    def load_member_match_page(
+        self,
+        guild_id: int,
+        category: str,
+        member_id: int,
+        limit: int,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        safe = normalize_category(category)
+        conn = self._get_conn()
+        with conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            return list(
+                self._history_rows(
+                    cur.execute(
+                        """
+                        SELECT user_id, recorded_at, opponent_id, challenger, user_value, opponent_value, result, elo_change
+                        FROM matches
+                        WHERE guild_id=? AND category=? AND user_id=?
+                        ORDER BY recorded_at DESC, id ASC
+                        LIMIT ? OFFSET ?
+                        """,
+                        (guild_id, safe, member_id, max(0, int(limit)), max(0, int(offset))),
                     )
-                return output
+                )
+            )
 
     def count_member_matches(self, guild_id: int, category: str, member_id: int) -> int:
         safe = normalize_category(category)
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute(
-                    "SELECT COUNT(*) AS c FROM matches NOT INDEXED WHERE guild_id=? AND category=? AND user_id=?",
-                    (guild_id, safe, member_id),
-                ).fetchone()
-                return int(row["c"] if row else 0)
-    def save_active_fights(self, guild_id: int, payload: Dict[str, Any]) -> None:
-        with self._lock:
-            with self._connect() as conn:
-                cur = conn.cursor()
-                cur.execute("DELETE FROM active_matches WHERE guild_id=?", (guild_id,))
-                cur.execute("DELETE FROM active_match_results WHERE guild_id=?", (guild_id,))
-                cur.execute("DELETE FROM active_match_submissions WHERE guild_id=?", (guild_id,))
-                cur.execute("DELETE FROM active_match_cancel_votes WHERE guild_id=?", (guild_id,))
-                cur.execute("DELETE FROM active_match_deletions WHERE guild_id=?", (guild_id,))
-                for category, data in payload.items():
-                    if not isinstance(data, dict):
-                        continue
-                    matches = data.get("matches", {})
-                    deletions = data.get("deletions", [])
-                    if not isinstance(matches, dict):
-                        matches = {}
-                    if not isinstance(deletions, list):
-                        deletions = []
-                    for match_id, match in matches.items():
-                        if not isinstance(match, dict):
+        conn = self._get_conn()
+        with conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM matches WHERE guild_id=? AND category=? AND user_id=?",
+                (guild_id, safe, member_id),
+            ).fetchone()
+            return int(row[0] if row else 0)
+
+    @staticmethod
+    def _normalize_active_payload(
+        guild_id: int, payload: Dict[str, Any]
+    ) -> Tuple[_Rows, _Rows, _Rows, _Rows, _Rows]:
+        match_rows: _Rows = []
+        result_rows: _Rows = []
+        submission_rows: _Rows = []
+        cancel_rows: _Rows = []
+        deletion_rows: _Rows = []
+        for category, data in payload.items():
+            if not isinstance(data, dict):
+                continue
+            matches = data.get("matches", {})
+            deletions = data.get("deletions", [])
+            if not isinstance(matches, dict):
+                matches = {}
+            if not isinstance(deletions, list):
+                deletions = []
+            for match_id, match in matches.items():
+                if not isinstance(match, dict):
+                    continue
+                mode = match.get("mode") or {}
+                match_rows.append(
+                    (
+                        guild_id,
+                        category,
+                        match_id,
+                        match.get("leaderboard") or normalize_category(category),
+                        match.get("challenger_id"),
+                        match.get("opponent_id"),
+                        match.get("status", "open"),
+                        match.get("channel_id"),
+                        match.get("message_id"),
+                        match.get("thread_id"),
+                        match.get("thread_message_id"),
+                        match.get("created_at"),
+                        match.get("rank_range"),
+                        mode.get("key") or "speedrun",
+                        mode.get("target"),
+                        match.get("response_deadline"),
+                        match.get("accepted_at"),
+                    )
+                )
+                result = match.get("result") if isinstance(match.get("result"), dict) else None
+                if result:
+                    result_rows.append(
+                        (
+                            guild_id,
+                            category,
+                            match_id,
+                            result.get("winner_id"),
+                            result.get("loser_id"),
+                            result.get("winner_value"),
+                            result.get("loser_value"),
+                            result.get("completed_at"),
+                            result.get("override_notes"),
+                            result.get("winner_elo_change"),
+                            result.get("loser_elo_change"),
+                            result.get("winner_new_elo"),
+                            result.get("loser_new_elo"),
+                            result.get("winner_old_elo"),
+                            result.get("loser_old_elo"),
+                        )
+                    )
+                submissions = match.get("submissions", {})
+                if isinstance(submissions, dict):
+                    for uid_str, record in submissions.items():
+                        if not isinstance(record, dict):
                             continue
-                        mode = match.get("mode") or {}
-                        cur.execute(
-                            """
-                            INSERT INTO active_matches (
-                                guild_id,
-                                category,
-                                match_id,
-                                leaderboard,
-                                challenger_id,
-                                opponent_id,
-                                status,
-                                channel_id,
-                                message_id,
-                                thread_id,
-                                thread_message_id,
-                                created_at,
-                                rank_range,
-                                mode_key,
-                                mode_target,
-                                response_deadline,
-                                accepted_at
-                            )
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
+                        try:
+                            user_id = int(uid_str)
+                        except ValueError:
+                            continue
+                        submission_rows.append(
                             (
                                 guild_id,
                                 category,
                                 match_id,
-                                match.get("leaderboard") or normalize_category(category),
-                                match.get("challenger_id"),
-                                match.get("opponent_id"),
-                                match.get("status", "open"),
-                                match.get("channel_id"),
-                                match.get("message_id"),
-                                match.get("thread_id"),
-                                match.get("thread_message_id"),
-                                match.get("created_at"),
-                                match.get("rank_range"),
-                                mode.get("key") or "speedrun",
-                                mode.get("target"),
-                                match.get("response_deadline"),
-                                match.get("accepted_at"),
-                            ),
-                        )
-                        result = match.get("result") if isinstance(match.get("result"), dict) else None
-                        if result:
-                            cur.execute(
-                                """
-                                INSERT INTO active_match_results (
-                                    guild_id,
-                                    category,
-                                    match_id,
-                                    winner_id,
-                                    loser_id,
-                                    winner_value,
-                                    loser_value,
-                                    completed_at,
-                                    override_notes,
-                                    winner_elo_change,
-                                    loser_elo_change,
-                                    winner_new_elo,
-                                    loser_new_elo,
-                                    winner_old_elo,
-                                    loser_old_elo
-                                )
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """,
-                                (
-                                    guild_id,
-                                    category,
-                                    match_id,
-                                    result.get("winner_id"),
-                                    result.get("loser_id"),
-                                    result.get("winner_value"),
-                                    result.get("loser_value"),
-                                    result.get("completed_at"),
-                                    result.get("override_notes"),
-                                    result.get("winner_elo_change"),
-                                    result.get("loser_elo_change"),
-                                    result.get("winner_new_elo"),
-                                    result.get("loser_new_elo"),
-                                    result.get("winner_old_elo"),
-                                    result.get("loser_old_elo"),
-                                ),
-                            )
-                        submissions = match.get("submissions", {})
-                        if isinstance(submissions, dict):
-                            for uid_str, record in submissions.items():
-                                if not isinstance(record, dict):
-                                    continue
-                                try:
-                                    user_id = int(uid_str)
-                                except ValueError:
-                                    continue
-                                cur.execute(
-                                    """
-                                    INSERT INTO active_match_submissions (
-                                        guild_id,
-                                        category,
-                                        match_id,
-                                        user_id,
-                                        kind,
-                                        value,
-                                        metric
-                                    )
-                                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                                    """,
-                                    (
-                                        guild_id,
-                                        category,
-                                        match_id,
-                                        user_id,
-                                        record.get("kind"),
-                                        record.get("value"),
-                                        record.get("metric"),
-                                    ),
-                                )
-                        cancel_votes = match.get("cancel_votes", [])
-                        if isinstance(cancel_votes, list):
-                            for user_id in cancel_votes:
-                                cur.execute(
-                                    """
-                                    INSERT INTO active_match_cancel_votes (
-                                        guild_id,
-                                        category,
-                                        match_id,
-                                        user_id
-                                    )
-                                    VALUES (?, ?, ?, ?)
-                                    """,
-                                    (guild_id, category, match_id, user_id),
-                                )
-                    for entry in deletions:
-                        if not isinstance(entry, dict):
-                            continue
-                        thread_id = entry.get("thread_id")
-                        delete_at = entry.get("delete_at")
-                        if thread_id and delete_at:
-                            cur.execute(
-                                """
-                                INSERT INTO active_match_deletions (guild_id, category, thread_id, delete_at)
-                                VALUES (?, ?, ?, ?)
-                                """,
-                                (guild_id, category, thread_id, delete_at),
+                                user_id,
+                                record.get("kind"),
+                                record.get("value"),
+                                record.get("metric"),
                             )
+                        )
+                cancel_votes = match.get("cancel_votes", [])
+                if isinstance(cancel_votes, list):
+                    cancel_rows.extend((guild_id, category, match_id, user_id) for user_id in cancel_votes)
+            for entry in deletions:
+                if not isinstance(entry, dict):
+                    continue
+                thread_id = entry.get("thread_id")
+                delete_at = entry.get("delete_at")
+                if thread_id and delete_at:
+                    deletion_rows.append((guild_id, category, thread_id, delete_at))
+        return match_rows, result_rows, submission_rows, cancel_rows, deletion_rows
+
+    def save_active_fights(self, guild_id: int, payload: Dict[str, Any]) -> None:
+        match_rows, result_rows, submission_rows, cancel_rows, deletion_rows = self._normalize_active_payload(
+            guild_id, payload
+        )
+        results = {(row[1], row[2]): row for row in result_rows}
+        submissions: Dict[Tuple[str, str], _Rows] = {}
+        for row in submission_rows:
+            submissions.setdefault((row[1], row[2]), []).append(row)
+        cancels: Dict[Tuple[str, str], _Rows] = {}
+        for row in cancel_rows:
+            cancels.setdefault((row[1], row[2]), []).append(row)
+        current: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+        for row in match_rows:
+            key = (row[1], row[2])
+            current[key] = (row, results.get(key), submissions.get(key, []), cancels.get(key, []))
+        with self._lock:
+            previous = self._active_snapshot.get(guild_id)
+            conn = self._get_writer()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cur = conn.cursor()
+                if previous is None:
+                    cur.execute("DELETE FROM active_matches WHERE guild_id=?", (guild_id,))
+                    cur.execute("DELETE FROM active_match_results WHERE guild_id=?", (guild_id,))
+                    cur.execute("DELETE FROM active_match_submissions WHERE guild_id=?", (guild_id,))
+                    cur.execute("DELETE FROM active_match_cancel_votes WHERE guild_id=?", (guild_id,))
+                    cur.execute("DELETE FROM active_match_deletions WHERE guild_id=?", (guild_id,))
+                    previous_matches: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+                    previous_deletions: _Rows = []
+                else:
+                    previous_matches, previous_deletions = previous
+                stale = [(guild_id, *key) for key in previous_matches if key not in current]
+                changed = [key for key, entry in current.items() if previous_matches.get(key) != entry]
+                # Matches keep their rowid across updates so load order stays stable; child rows are rewritten.
+                touched = stale + [(guild_id, *key) for key in changed if key in previous_matches]
+                if stale:
+                    cur.executemany(
+                        "DELETE FROM active_matches WHERE guild_id=? AND category=? AND match_id=?",
+                        stale,
+                    )
+                if touched:
+                    cur.executemany(
+                        "DELETE FROM active_match_results WHERE guild_id=? AND category=? AND match_id=?",
+                        touched,
+                    )
+                    cur.executemany(
+                        "DELETE FROM active_match_submissions WHERE guild_id=? AND category=? AND match_id=?",
+                        touched,
+                    )
+                    cur.executemany(
+                        "DELETE FROM active_match_cancel_votes WHERE guild_id=? AND category=? AND match_id=?",
+                        touched,
+                    )
+                cur.executemany(_SQL_UPSERT_ACTIVE_MATCH, [current[key][0] for key in changed])
+                cur.executemany(
+                    _SQL_INSERT_ACTIVE_MATCH_RESULT,
+                    [current[key][1] for key in changed if current[key][1] is not None],
+                )
+                cur.executemany(
+                    _SQL_INSERT_ACTIVE_MATCH_SUBMISSION,
+                    [row for key in changed for row in current[key][2]],
+                )
+                cur.executemany(
+                    _SQL_INSERT_ACTIVE_MATCH_CANCEL_VOTE,
+                    [row for key in changed for row in current[key][3]],
+                )
+                if deletion_rows != previous_deletions:
+                    if previous is not None:
+                        cur.execute("DELETE FROM active_match_deletions WHERE guild_id=?", (guild_id,))
+                    cur.executemany(_SQL_INSERT_ACTIVE_MATCH_DELETION, deletion_rows)
+            self._active_snapshot[guild_id] = (current, deletion_rows)
 
     def rename_category(self, guild_id: int, old_category: str, new_category: str) -> None:
         old_safe = normalize_category(old_category)
         new_safe = normalize_category(new_category)
         with self._lock:
-            with self._connect() as conn:
+            self._players_snapshot.pop((guild_id, old_safe), None)
+            self._players_snapshot.pop((guild_id, new_safe), None)
+            self._active_snapshot.pop(guild_id, None)
+            conn = self._get_writer()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
                 cur = conn.cursor()
                 cur.execute(
                     "UPDATE players SET category=? WHERE guild_id=? AND category=?",
@@ -1670,7 +2244,11 @@ class BoardStorage:
     def delete_category(self, guild_id: int, category: str) -> None:
         safe = normalize_category(category)
         with self._lock:
-            with self._connect() as conn:
+            self._players_snapshot.pop((guild_id, safe), None)
+            self._active_snapshot.pop(guild_id, None)
+            conn = self._get_writer()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
                 cur = conn.cursor()
                 cur.execute(
                     "DELETE FROM players WHERE guild_id=? AND category=?",
@@ -1722,49 +2300,19 @@ class BoardStorage:
                 )
 
     def list_categories(self, guild_id: int) -> List[str]:
-        with self._lock:
-            with self._connect() as conn:
-                names: Dict[str, str] = {}
-                for row in conn.execute("SELECT display_name FROM leaderboards WHERE guild_id=?", (guild_id,)):
-                    value = row["display_name"]
-                    if value:
-                        names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT name FROM legacy_categories WHERE guild_id=?", (guild_id,)):
-                    value = row["name"]
-                    if value:
-                        names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM active_matches WHERE guild_id=?", (guild_id,)):
-                    value = row["category"]
-                    if value:
-                        names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM players WHERE guild_id=?", (guild_id,)):
-                    value = self._display_from_safe(row["category"])
-                    names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM matches NOT INDEXED WHERE guild_id=?", (guild_id,)):
-                    value = self._display_from_safe(row["category"])
-                    names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM removed_players WHERE guild_id=?", (guild_id,)):
-                    safe = row["category"]
-                    if safe == GLOBAL_BIO_KEY:
-                        continue
-                    value = self._display_from_safe(safe)
-                    names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT scope_category FROM player_bans WHERE guild_id=?", (guild_id,)):
-                    safe = row["scope_category"]
-                    if safe in {GLOBAL_BIO_KEY, GLOBAL_BAN_SCOPE}:
-                        continue
-                    value = self._display_from_safe(safe)
-                    names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM player_decay WHERE guild_id=?", (guild_id,)):
-                    safe = row["category"]
-                    if not safe:
-                        continue
-                    value = self._display_from_safe(safe)
-                    names.setdefault(value.lower(), value)
-                for row in conn.execute("SELECT DISTINCT category FROM bios WHERE guild_id=?", (guild_id,)):
-                    safe = row["category"]
-                    if safe == GLOBAL_BIO_KEY:
+        conn = self._get_conn()
+        with conn:
+            names: Dict[str, str] = {}
+            for source, value in conn.execute(
+                _SQL_LIST_CATEGORIES,
+                {"guild_id": guild_id, "global_bio": GLOBAL_BIO_KEY, "global_ban": GLOBAL_BAN_SCOPE},
+            ):
+                if source == 0:
+                    if not value:
                         continue
-                    value = safe if " " in safe else self._display_from_safe(safe)
-                    names.setdefault(value.lower(), value)
-                return [names[key] for key in sorted(names)]
+                elif source == 1:
+                    value = self._display_from_safe(value)
+                elif " " not in value:
+                    value = self._display_from_safe(value)
+                names.setdefault(value.lower(), value)
+            return [names[key] for key in sorted(names)]
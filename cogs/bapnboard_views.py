@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 import discord
 
@@ -50,9 +50,25 @@ class PagedListView(discord.ui.View):
         self.owner_id = owner_id
         self.current = 0
         self.total_pages = max(1, len(self.pages))
+        self._embed_cache: Dict[int, discord.Embed] = {}
+        self._back_button: Optional[discord.ui.Button] = None
+        self._jump_button: Optional[discord.ui.Button] = None
+        self._next_button: Optional[discord.ui.Button] = None
+        for child in self.children:
+            if not isinstance(child, discord.ui.Button):
+                continue
+            if child.custom_id == "bapn_lb_back":
+                self._back_button = child
+            elif child.custom_id == "bapn_lb_jump":
+                self._jump_button = child
+            elif child.custom_id == "bapn_lb_next":
+                self._next_button = child
         self._sync_buttons()
 
     def create_embed(self) -> discord.Embed:
+        cached = self._embed_cache.get(self.current)
+        if cached is not None:
+            return cached
         embed = discord.Embed(title=self.title, color=self.color)
         body = "\n".join(self.pages[self.current])
         if self.header:
@@ -65,27 +81,16 @@ class PagedListView(discord.ui.View):
         embed.set_footer(text=footer)
         if self.thumbnail:
             embed.set_thumbnail(url=self.thumbnail)
+        self._embed_cache[self.current] = embed
         return embed
 
     def _sync_buttons(self) -> None:
-        back_button = None
-        jump_button = None
-        next_button = None
-        for child in self.children:
-            if not isinstance(child, discord.ui.Button):
-                continue
-            if child.custom_id == "bapn_lb_back":
-                back_button = child
-            elif child.custom_id == "bapn_lb_jump":
-                jump_button = child
-            elif child.custom_id == "bapn_lb_next":
-                next_button = child
-        if back_button:
-            back_button.disabled = self.current == 0
-        if next_button:
-            next_button.disabled = self.current >= self.total_pages - 1
-        if jump_button:
-            jump_button.disabled = self.total_pages <= 1
+        if self._back_button is not None:
+            self._back_button.disabled = self.current == 0
+        if self._next_button is not None:
+            self._next_button.disabled = self.current >= self.total_pages - 1
+        if self._jump_button is not None:
+            self._jump_button.disabled = self.total_pages <= 1
 
     async def _send_private_pager(self, interaction: discord.Interaction, index: int) -> None:
         private_view = PagedListView(
@@ -157,7 +162,8 @@ class ProfileView(discord.ui.View):
         self.boards = boards
         self.current_board = initial_board
         self.page_index = 0
-        self.pages: List[List[str]] = []
+        self.page_lines: List[str] = []
+        self.total_pages = 0
         self.select = ProfileBoardSelect(self, boards)
         self.select.row = 0
         self.add_item(self.select)
@@ -173,22 +179,19 @@ class ProfileView(discord.ui.View):
             option.default = option.value == self.current_board
 
     def _sync_buttons(self) -> None:
-        total_pages = len(self.pages)
+        total_pages = self.total_pages
         if self.back_button:
             self.back_button.disabled = self.page_index <= 0 or total_pages <= 1
         if self.next_button:
             self.next_button.disabled = self.page_index >= total_pages - 1 or total_pages <= 1
 
     async def refresh(self, interaction: discord.Interaction) -> None:
-        embed, pages = await self.cog.build_profile_content(self.guild_id, self.current_board, self.member)
-        self.pages = pages
-        if not self.pages:
-            self.page_index = 0
-        else:
-            self.page_index = max(0, min(self.page_index, len(self.pages) - 1))
-        history = "\n".join(self.pages[self.page_index]) if self.pages else "No matches recorded."
+        embed, self.page_lines, self.page_index, self.total_pages = await self.cog.build_profile_content(
+            self.guild_id, self.current_board, self.member, self.page_index
+        )
+        history = "\n".join(self.page_lines) if self.page_lines else "No matches recorded."
         embed.description = history
-        embed.set_footer(text=f"Page {self.page_index + 1}/{max(len(self.pages), 1)}")
+        embed.set_footer(text=f"Page {self.page_index + 1}/{max(self.total_pages, 1)}")
         self.update_select_defaults()
         self._sync_buttons()
         await interaction.response.edit_message(embed=embed, view=self)
@@ -199,7 +202,7 @@ class ProfileView(discord.ui.View):
         await self.refresh(interaction)
 
     async def _on_next(self, interaction: discord.Interaction) -> None:
-        if self.page_index < len(self.pages) - 1:
+        if self.page_index < self.total_pages - 1:
             self.page_index += 1
         await self.refresh(interaction)
 
@@ -1,58 +1,168 @@
 import asyncio
+import functools
 import json
 import sqlite3
+import sys
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Literal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Literal
 
 import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 API_BASE = "https://www.speedrun.com/api/v1"
+USER_AGENT = "grassguy/1.0"
+SRC_MAX_ATTEMPTS = 4
+SRC_MAX_RETRY_DELAY = 30.0
+SRC_AUTOCOMPLETE_TIMEOUT = 2.0
 DB_FILE = "data/src_watchers.sqlite3"
 ALL_CATEGORIES_VALUE = "__all__"
-
-
-def ensure_db():
+REJECTED_PAGE_SIZE = 200
+REJECTED_MAX_OFFSET = 10000
+REJECTED_FETCH_WAVE = 8
+SEEN_IDS_LIMIT = 500
+WATCH_INTERVAL_SECONDS = 30
+WATCH_MAX_IDLE_MULTIPLIER = 4
+ANNOUNCE_EMBEDS_PER_MESSAGE = 10
+_EPOCH_MIN = datetime.min.replace(tzinfo=timezone.utc)
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def ensure_db() -> sqlite3.Connection:
     import os
     os.makedirs("data", exist_ok=True)
-    con = sqlite3.connect(DB_FILE)
+    con = sqlite3.connect(DB_FILE, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    with con:
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS watchers (\n"
+            "  guild_id INTEGER NOT NULL,\n"
+            "  channel_id INTEGER NOT NULL,\n"
+            "  role_id INTEGER NOT NULL,\n"
+            "  game_id TEXT NOT NULL,\n"
+            "  category_id TEXT NOT NULL,\n"
+            "  last_checked TEXT NOT NULL,\n"
+            "  last_seen_ids TEXT NOT NULL,\n"
+            "  PRIMARY KEY (guild_id, channel_id, game_id, category_id)\n"
+            ")"
+        )
+        con.execute(
+            "CREATE INDEX IF NOT EXISTS idx_watchers_channel ON watchers(channel_id)"
+        )
+        con.execute(
+            "CREATE INDEX IF NOT EXISTS idx_watchers_game ON watchers(game_id, category_id)"
+        )
+    return con
+
+
+def _decode_seen_ids(raw: Optional[str]) -> Set[str]:
+    if not raw:
+        return set()
+    if raw.startswith("["):
+        return set(_json_loads(raw))
+    return set(raw.split("\n"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> datetime:
+    processed = value
+    if not _FROMISOFORMAT_ACCEPTS_Z and processed.endswith("Z"):
+        processed = processed[:-1] + "+00:00"
     try:
-        with con:
-            con.execute(
-                "CREATE TABLE IF NOT EXISTS watchers (\n"
-                "  guild_id INTEGER NOT NULL,\n"
-                "  channel_id INTEGER NOT NULL,\n"
-                "  role_id INTEGER NOT NULL,\n"
-                "  game_id TEXT NOT NULL,\n"
-                "  category_id TEXT NOT NULL,\n"
-                "  last_checked TEXT NOT NULL,\n"
-                "  last_seen_ids TEXT NOT NULL,\n"
-                "  PRIMARY KEY (guild_id, channel_id, game_id, category_id)\n"
-                ")"
-            )
-            con.execute(
-                "CREATE INDEX IF NOT EXISTS idx_watchers_channel ON watchers(channel_id)"
-            )
-    finally:
-        con.close()
+        dt = datetime.fromisoformat(processed)
+    except Exception:
+        try:
+            dt = datetime.strptime(value, "%Y-%m-%d")
+        except Exception:
+            return _EPOCH_MIN
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(raw: str) -> str:
+    dt = _parse_iso_timestamp(raw)
+    if dt == _EPOCH_MIN:
+        return raw
+    month_name = dt.strftime("%B")
+    display = f"{month_name} {dt.day}, {dt.year}"
+    unix = int(dt.timestamp())
+    return f"{display} • <t:{unix}:t>"
+
+
+def _ttl_cached(attr: str, *, limit: int = 64, key: Callable[[Any], str] = str):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, arg, **kwargs):
+            cache_key = key(arg)
+            cache = getattr(self, attr)
+            now = time.monotonic()
+            cached = cache.get(cache_key)
+            if cached and now - cached[0] < self._cache_ttl:
+                cache.move_to_end(cache_key)
+                return cached[1]
+            flight_key = (attr, cache_key, *sorted(kwargs.items()))
+            task = self._inflight.get(flight_key)
+            if task is None:
+
+                async def load():
+                    try:
+                        value = await func(self, arg, **kwargs)
+                        if value is not None:
+                            cache[cache_key] = (now, value)
+                            cache.move_to_end(cache_key)
+                            while len(cache) > limit:
+                                cache.popitem(last=False)
+                        return value
+                    finally:
+                        self._inflight.pop(flight_key, None)
+
+                task = asyncio.create_task(load())
+                self._inflight[flight_key] = task
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True)
+class RunSummary:
+    time_str: str
+    players_str: str
+    video_uri: Optional[str]
+    category_name: Optional[str]
 
 
 def format_duration(seconds: float) -> str:
     if seconds is None:
         return "?"
-    seconds = float(seconds)
-    ms = int(round((seconds - int(seconds)) * 1000))
-    total = int(seconds)
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
-    if h > 0:
-        return f"{h:d}:{m:02d}:{s:02d}.{ms:03d}"
-    return f"{m:d}:{s:02d}.{ms:03d}"
+    total, ms = divmod(int(float(seconds) * 1000 + 0.5), 1000)
+    m, s = divmod(total, 60)
+    h, m = divmod(m, 60)
+    if h:
+        return f"{h}:{m:02d}:{s:02d}.{ms:03d}"
+    return f"{m}:{s:02d}.{ms:03d}"
 
 
 async def game_autocomplete(interaction: discord.Interaction, current: str):
@@ -63,7 +173,7 @@ async def game_autocomplete(interaction: discord.Interaction, current: str):
     if not term:
         term = "minecraft"
     try:
-        games = await cog.src_search_games_cached(term)
+        games = await asyncio.wait_for(cog.src_search_games_cached(term, max_attempts=1), SRC_AUTOCOMPLETE_TIMEOUT)
     except Exception:
         return []
     choices = []
@@ -88,7 +198,7 @@ async def category_autocomplete(interaction: discord.Interaction, current: str):
     if not game_id:
         return []
     try:
-        cats = await cog.src_get_game_categories_cached(game_id)
+        cats = await asyncio.wait_for(cog.src_get_game_categories_cached(game_id, max_attempts=1), SRC_AUTOCOMPLETE_TIMEOUT)
     except Exception:
         return []
     lowered = (current or "").lower()
@@ -100,7 +210,7 @@ async def category_autocomplete(interaction: discord.Interaction, current: str):
         name = c.get("name")
         if not name:
             continue
-        if lowered and lowered not in name.lower():
+        if lowered and lowered not in c["_name_lower"]:
             continue
         choices.append(app_commands.Choice(name=name, value=str(cat_id)))
         if len(choices) >= 25:
@@ -108,6 +218,29 @@ async def category_autocomplete(interaction: discord.Interaction, current: str):
     return choices
 
 
+class JumpModal(discord.ui.Modal):
+    def __init__(self, parent_view: "LeaderboardView"):
+        super().__init__(title="Jump to page")
+        self.parent_view = parent_view
+        self.page_input = discord.ui.TextInput(label="Page", placeholder="1", required=True)
+        self.add_item(self.page_input)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        view = self.parent_view
+        try:
+            val = int(str(self.page_input.value).strip())
+        except Exception:
+            await interaction.response.send_message("Invalid page.", ephemeral=True)
+            return
+        if val < 1 or val > view.total_pages:
+            await interaction.response.send_message("Out of range.", ephemeral=True)
+            return
+        view.page = val
+        embed, total = await view.make_embed(view.page)
+        view.total_pages = total
+        await interaction.response.edit_message(embed=embed, view=view)
+
+
 class LeaderboardView(discord.ui.View):
     def __init__(self, user_id: int, make_embed, on_category_change, categories: List[Dict[str, Any]], page_count: int, current_category_id: Optional[str], *, timeout: int = 180):
         super().__init__(timeout=timeout)
@@ -202,25 +335,7 @@ class LeaderboardView(discord.ui.View):
             if interaction.user.id != self.user_id:
                 await interaction.response.send_message("This menu isn't yours.", ephemeral=True)
                 return
-
-            class JumpModal(discord.ui.Modal, title="Jump to page"):
-                page_input = discord.ui.TextInput(label="Page", placeholder="1", required=True)
-
-                async def on_submit(self_inner, modal_interaction: discord.Interaction):
-                    try:
-                        val = int(str(self_inner.page_input.value).strip())
-                    except Exception:
-                        await modal_interaction.response.send_message("Invalid page.", ephemeral=True)
-                        return
-                    if val < 1 or val > self.total_pages:
-                        await modal_interaction.response.send_message("Out of range.", ephemeral=True)
-                        return
-                    self.page = val
-                    embed, total = await self.make_embed(self.page)
-                    self.total_pages = total
-                    await modal_interaction.response.edit_message(embed=embed, view=self)
-
-            await interaction.response.send_modal(JumpModal())
+            await interaction.response.send_modal(JumpModal(self))
 
         button.callback = cb
         return button
@@ -238,16 +353,27 @@ class SRCLeaderboardCog(commands.Cog):
         self.session: Optional[aiohttp.ClientSession] = None
         self._watch_task: Optional[asyncio.Task] = None
         self._watchers: List[Dict[str, Any]] = []
-        self._game_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
-        self._category_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
-        self._user_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-        self._game_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._watchers_index: Dict[Tuple[int, int, str, Optional[str]], int] = {}
+        self._game_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._category_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._user_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._game_info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._categories_payload_cache: "OrderedDict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]" = OrderedDict()
+        self._pending_runs_cache: Dict[Tuple[str, Optional[str]], Tuple[str, List[Dict[str, Any]]]] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
         self._cache_ttl = 300.0
-        ensure_db()
+        self._con = ensure_db()
+        self._save_lock = asyncio.Lock()
         self._load_watchers()
 
     async def cog_load(self):
-        self.session = aiohttp.ClientSession()
+        resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75, resolver=resolver)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
         if self._watch_task is None:
             self._watch_task = asyncio.create_task(self._watch_loop())
 
@@ -257,6 +383,7 @@ class SRCLeaderboardCog(commands.Cog):
             self._watch_task = None
         if self.session and not self.session.closed:
             asyncio.create_task(self.session.close())
+        self._con.close()
 
     def _normalize_cat(self, cat: Optional[str]) -> str:
         return cat or ""
@@ -264,186 +391,211 @@ class SRCLeaderboardCog(commands.Cog):
     def _denorm_cat(self, cat: str) -> Optional[str]:
         return cat or None
 
+    def _watcher_key(self, w: Dict[str, Any]) -> Tuple[int, int, str, Optional[str]]:
+        return (w.get("guild_id"), w.get("channel_id"), w.get("game_id"), w.get("category_id"))
+
     def _load_watchers(self):
-        con = sqlite3.connect(DB_FILE)
-        try:
-            cur = con.execute(
-                "SELECT guild_id, channel_id, role_id, game_id, category_id, last_checked, last_seen_ids FROM watchers"
+        rows = self._con.execute(
+            "SELECT guild_id, channel_id, role_id, game_id, category_id, last_checked, last_seen_ids FROM watchers"
+        ).fetchall()
+        out: List[Dict[str, Any]] = []
+        for r in rows:
+            out.append(
+                {
+                    "guild_id": r[0],
+                    "channel_id": r[1],
+                    "role_id": r[2],
+                    "game_id": r[3],
+                    "category_id": self._denorm_cat(r[4]),
+                    "last_checked": r[5],
+                    "last_seen_ids": _decode_seen_ids(r[6]),
+                }
             )
-            rows = cur.fetchall()
-            out: List[Dict[str, Any]] = []
-            for r in rows:
-                out.append(
-                    {
-                        "guild_id": r[0],
-                        "channel_id": r[1],
-                        "role_id": r[2],
-                        "game_id": r[3],
-                        "category_id": self._denorm_cat(r[4]),
-                        "last_checked": r[5],
-                        "last_seen_ids": json.loads(r[6]) if r[6] else [],
-                    }
-                )
-            self._watchers = out
-        finally:
-            con.close()
-
-    def _save_watchers(self):
-        con = sqlite3.connect(DB_FILE)
-        try:
-            with con:
-                for w in self._watchers:
-                    guild_id = int(w.get("guild_id"))
-                    channel_id = int(w.get("channel_id"))
-                    role_id = int(w.get("role_id"))
-                    game_id = str(w.get("game_id"))
-                    category_id = self._normalize_cat(w.get("category_id"))
-                    last_checked = str(w.get("last_checked"))
-                    last_seen_ids = json.dumps(w.get("last_seen_ids") or [])
-                    cur = con.execute(
-                        "UPDATE watchers SET role_id=?, last_checked=?, last_seen_ids=? WHERE guild_id=? AND channel_id=? AND game_id=? AND category_id=?",
-                        (
-                            role_id,
-                            last_checked,
-                            last_seen_ids,
-                            guild_id,
-                            channel_id,
-                            game_id,
-                            category_id,
-                        ),
-                    )
-                    if cur.rowcount == 0:
-                        con.execute(
-                            "INSERT INTO watchers (guild_id, channel_id, role_id, game_id, category_id, last_checked, last_seen_ids) VALUES (?,?,?,?,?,?,?)",
-                            (
-                                guild_id,
-                                channel_id,
-                                role_id,
-                                game_id,
-                                category_id,
-                                last_checked,
-                                last_seen_ids,
-                            ),
-                        )
-        finally:
-            con.close()
+        self._watchers = out
+        self._watchers_index = {self._watcher_key(w): i for i, w in enumerate(out)}
+
+    def _is_current_watcher(self, watcher: Dict[str, Any]) -> bool:
+        idx = self._watchers_index.get(self._watcher_key(watcher))
+        return idx is not None and self._watchers[idx] is watcher
+
+    def _watcher_rows(self, watchers: Iterable[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        return [
+            (
+                int(w.get("guild_id")),
+                int(w.get("channel_id")),
+                int(w.get("role_id")),
+                str(w.get("game_id")),
+                self._normalize_cat(w.get("category_id")),
+                str(w.get("last_checked")),
+                "\n".join(sorted(w.get("last_seen_ids") or ())),
+            )
+            for w in watchers
+        ]
+
+    def _save_watchers_sync(self, rows: List[Tuple[Any, ...]]):
+        with self._con:
+            self._con.executemany(
+                "INSERT INTO watchers (guild_id, channel_id, role_id, game_id, category_id, last_checked, last_seen_ids) VALUES (?,?,?,?,?,?,?) "
+                "ON CONFLICT(guild_id, channel_id, game_id, category_id) DO UPDATE SET "
+                "role_id=excluded.role_id, last_checked=excluded.last_checked, last_seen_ids=excluded.last_seen_ids",
+                rows,
+            )
+
+    async def _save_watchers(self, watchers: Optional[Iterable[Dict[str, Any]]] = None):
+        rows = self._watcher_rows(self._watchers if watchers is None else watchers)
+        async with self._save_lock:
+            await asyncio.to_thread(self._save_watchers_sync, rows)
 
-    async def src_get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def src_get(self, path: str, params: Optional[Dict[str, Any]] = None, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> Dict[str, Any]:
+        data, _ = await self._src_request(path, params, max_attempts=max_attempts)
+        return data
+
+    async def _src_request(self, path: str, params: Optional[Dict[str, Any]] = None, etag: Optional[str] = None, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         url = f"{API_BASE}/{path.lstrip('/')}"
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        async with self.session.get(url, params=params) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        headers = {"If-None-Match": etag} if etag else None
+        for attempt in range(max_attempts):
+            async with self.session.get(url, params=params, headers=headers) as resp:
+                if resp.status == 304:
+                    return None, etag
+                retryable = resp.status == 429 or 500 <= resp.status < 600
+                if not retryable or attempt == max_attempts - 1:
+                    resp.raise_for_status()
+                    return _json_loads(await resp.read()), resp.headers.get("ETag")
+                delay = float(2 ** attempt)
+                if resp.status == 429:
+                    try:
+                        delay = float(resp.headers.get("Retry-After", delay))
+                    except ValueError:
+                        pass
+            await asyncio.sleep(min(delay, SRC_MAX_RETRY_DELAY))
 
-    async def src_search_games(self, term: str) -> List[Dict[str, Any]]:
+    async def src_search_games(self, term: str, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> List[Dict[str, Any]]:
         params = {"name": term, "max": 25}
-        data = await self.src_get("games", params=params)
+        data = await self.src_get("games", params=params, max_attempts=max_attempts)
         return data.get("data", [])
 
-    async def src_get_game_categories(self, game_id: str) -> List[Dict[str, Any]]:
-        data = await self.src_get(f"games/{game_id}/categories")
-        items = data.get("data", [])
-        return [c for c in items if c.get("type") == "per-game"]
+    async def src_get_game_categories(self, game_id: str, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> List[Dict[str, Any]]:
+        data = await self.src_get(f"games/{game_id}/categories", max_attempts=max_attempts)
+        items = [c for c in data.get("data", []) if c.get("type") == "per-game"]
+        for c in items:
+            c["_name_lower"] = (c.get("name") or "").lower()
+        return items
 
-    def _trim_cache(self, cache: Dict[str, Tuple[float, Any]], limit: int = 64):
-        if len(cache) <= limit:
-            return
-        oldest_key = min(cache.items(), key=lambda item: item[1][0])[0]
-        cache.pop(oldest_key, None)
-
-    async def src_search_games_cached(self, term: str) -> List[Dict[str, Any]]:
-        key = term.lower().strip()
-        now = time.monotonic()
-        cached = self._game_cache.get(key)
-        if cached and now - cached[0] < self._cache_ttl:
-            return cached[1]
-        data = await self.src_search_games(term)
-        self._game_cache[key] = (now, data)
-        self._trim_cache(self._game_cache)
-        return data
+    @_ttl_cached("_game_cache", key=lambda term: term.lower().strip())
+    async def src_search_games_cached(self, term: str, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> List[Dict[str, Any]]:
+        return await self.src_search_games(term, max_attempts=max_attempts)
 
-    async def src_get_game_categories_cached(self, game_id: str) -> List[Dict[str, Any]]:
-        key = str(game_id)
-        now = time.monotonic()
-        cached = self._category_cache.get(key)
-        if cached and now - cached[0] < self._cache_ttl:
-            return cached[1]
-        data = await self.src_get_game_categories(game_id)
-        self._category_cache[key] = (now, data)
-        self._trim_cache(self._category_cache)
-        return data
+    @_ttl_cached("_category_cache")
+    async def src_get_game_categories_cached(self, game_id: str, *, max_attempts: int = SRC_MAX_ATTEMPTS) -> List[Dict[str, Any]]:
+        return await self.src_get_game_categories(game_id, max_attempts=max_attempts)
 
+    @_ttl_cached("_user_cache", limit=128)
     async def src_get_user_cached(self, user_id: str) -> Optional[Dict[str, Any]]:
-        key = str(user_id)
-        now = time.monotonic()
-        cached = self._user_cache.get(key)
-        if cached and now - cached[0] < self._cache_ttl:
-            return cached[1]
         try:
             data = await self.src_get(f"users/{user_id}")
         except aiohttp.ClientResponseError:
             return None
         user = data.get("data") if isinstance(data, dict) else None
-        if user:
-            self._user_cache[key] = (now, user)
-            self._trim_cache(self._user_cache, limit=128)
-        return user
+        return user or None
 
+    @_ttl_cached("_game_info_cache")
     async def src_get_game_cached(self, game_id: str) -> Optional[Dict[str, Any]]:
-        key = str(game_id)
-        now = time.monotonic()
-        cached = self._game_info_cache.get(key)
-        if cached and now - cached[0] < self._cache_ttl:
-            return cached[1]
         try:
             data = await self.src_get(f"games/{game_id}")
         except aiohttp.ClientResponseError:
             return None
         game_info = data.get("data") if isinstance(data, dict) else None
-        if game_info:
-            self._game_info_cache[key] = (now, game_info)
-            self._trim_cache(self._game_info_cache, limit=64)
-        return game_info
+        return game_info or None
+
+    def _categories_payload(self, game_id: str, cats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        cached = self._categories_payload_cache.get(game_id)
+        if cached is not None and cached[0] is cats:
+            self._categories_payload_cache.move_to_end(game_id)
+            return cached[1]
+        payload = [{"id": str(c["id"]), "name": c.get("name")} for c in cats if c.get("id")]
+        self._categories_payload_cache[game_id] = (cats, payload)
+        self._categories_payload_cache.move_to_end(game_id)
+        while len(self._categories_payload_cache) > 64:
+            self._categories_payload_cache.popitem(last=False)
+        return payload
 
     async def src_get_leaderboard(self, game_id: str, category_id: str) -> Dict[str, Any]:
         params = {"embed": "players,category,game,variables"}
         return await self.src_get(f"leaderboards/{game_id}/category/{category_id}", params=params)
 
+    async def _rejected_runs_page(self, params: Dict[str, Any], offset: int) -> Optional[List[Dict[str, Any]]]:
+        try:
+            page = await self.src_get("runs", params={**params, "offset": offset})
+        except aiohttp.ClientResponseError as exc:
+            if exc.status == 400:
+                return None
+            raise
+        return page.get("data", [])
+
     async def src_get_rejected_runs(self, game_id: str, category_id: Optional[str], *, sort_order: str, max_runs: Optional[int] = None) -> List[Dict[str, Any]]:
         order = sort_order if sort_order in {"newest", "oldest"} else "newest"
+        limit = max_runs if order != "oldest" else None
+        p = {
+            "game": game_id,
+            "status": "rejected",
+            "max": REJECTED_PAGE_SIZE,
+            "embed": "players,category,examiner",
+        }
+        if category_id:
+            p["category"] = category_id
         out: List[Dict[str, Any]] = []
         offset = 0
-        while True:
-            if offset >= 10000:
+        wave = 1
+        while offset < REJECTED_MAX_OFFSET:
+            end = REJECTED_MAX_OFFSET
+            if limit is not None:
+                end = min(end, limit)
+            offsets = list(range(offset, end, REJECTED_PAGE_SIZE))[:wave]
+            if not offsets:
                 break
-            p = {
-                "game": game_id,
-                "status": "rejected",
-                "max": 200,
-                "offset": offset,
-                "embed": "players,category,examiner",
-            }
-            if category_id:
-                p["category"] = category_id
-            try:
-                page = await self.src_get("runs", params=p)
-            except aiohttp.ClientResponseError as exc:
-                if exc.status == 400:
+            pages = await asyncio.gather(*(self._rejected_runs_page(p, off) for off in offsets))
+            done = False
+            for runs in pages:
+                if not runs:
+                    done = True
                     break
-                raise
-            runs = page.get("data", [])
-            if not runs:
-                break
-            out.extend(runs)
-            if order != "oldest" and max_runs is not None and len(out) >= max_runs:
-                out = out[:max_runs]
-                break
-            offset += len(runs)
-            if len(runs) < 200:
+                out.extend(runs)
+                if len(runs) < REJECTED_PAGE_SIZE:
+                    done = True
+                    break
+            if done or (limit is not None and len(out) >= limit):
                 break
+            offset = offsets[-1] + REJECTED_PAGE_SIZE
+            wave = REJECTED_FETCH_WAVE
+        if limit is not None:
+            out = out[:limit]
         return out
 
+    def _run_summary(self, run: Dict[str, Any], lookup: Optional[Dict[str, str]] = None, cat_map: Optional[Dict[str, Dict[str, Any]]] = None) -> RunSummary:
+        summary = run.get("_summary")
+        if summary is not None:
+            return summary
+        times = run.get("times")
+        videos = run.get("videos")
+        links = videos.get("links") if isinstance(videos, dict) else None
+        summary = RunSummary(
+            time_str=format_duration(times.get("primary_t") if isinstance(times, dict) else None),
+            players_str=", ".join(self._players_from_run(run, lookup)),
+            video_uri=links[0].get("uri") if links else None,
+            category_name=self._extract_category_name(run.get("category"), cat_map),
+        )
+        run["_summary"] = summary
+        return summary
+
+    def _extract_category_name(self, payload: Any, cat_map: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+        if isinstance(payload, dict):
+            data = payload.get("data")
+            return (data.get("name") if isinstance(data, dict) else None) or payload.get("name")
+        if isinstance(payload, str) and cat_map:
+            cat = cat_map.get(payload)
+            return cat.get("name") if cat else None
+        return None
+
     def _players_from_run(self, run: Dict[str, Any], lookup: Optional[Dict[str, str]] = None) -> List[str]:
         names: List[str] = []
         entries: List[Any] = []
@@ -475,51 +627,43 @@ class SRCLeaderboardCog(commands.Cog):
                         names.append(lookup[pid])
         return names or ["Unknown"]
 
-    async def _leaderboard_pages(self, game_id: str, category_id: str, page_size: int) -> Tuple[List[List[Dict[str, Any]]], Dict[str, str]]:
-        data = await self.src_get_leaderboard(game_id, category_id)
-        payload = data.get("data", {})
-        runs = payload.get("runs", [])
-        slots = [r.get("run") or r for r in runs]
-        pages: List[List[Dict[str, Any]]] = []
-        for i in range(0, len(slots), page_size):
-            pages.append(slots[i : i + page_size])
-        lookup: Dict[str, str] = {}
-        player_container = payload.get("players") or {}
-        player_data = player_container.get("data") if isinstance(player_container, dict) else []
+    def _build_player_lookup(self, container: Any, lookup: Dict[str, str]) -> Dict[str, str]:
+        player_data = container.get("data") if isinstance(container, dict) else []
+        if isinstance(player_data, dict):
+            player_data = [player_data]
         if isinstance(player_data, list):
             for p in player_data:
                 if not isinstance(p, dict):
                     continue
                 display = p.get("names", {}).get("international") or p.get("name") or p.get("id")
-                keys: List[str] = []
+                if not display:
+                    continue
                 pid = p.get("id")
                 if pid:
-                    keys.append(str(pid))
+                    lookup[str(pid)] = display
                 pname = p.get("name")
                 if pname:
-                    keys.append(str(pname))
-                for key in keys:
-                    if display:
-                        lookup[key] = display
+                    lookup[str(pname)] = display
+        return lookup
+
+    async def _leaderboard_pages(self, game_id: str, category_id: str, page_size: int) -> Tuple[List[List[Dict[str, Any]]], Dict[str, str]]:
+        data = await self.src_get_leaderboard(game_id, category_id)
+        payload = data.get("data", {})
+        runs = payload.get("runs", [])
+        slots = [r.get("run") or r for r in runs]
+        pages: List[List[Dict[str, Any]]] = []
+        for i in range(0, len(slots), page_size):
+            pages.append(slots[i : i + page_size])
+        lookup: Dict[str, str] = {}
+        self._build_player_lookup(payload.get("players"), lookup)
+        for slot in slots:
+            self._run_summary(slot, lookup)
         return pages, lookup
 
     def _parse_timestamp(self, value: Optional[str]) -> datetime:
         if not value:
-            return datetime.min.replace(tzinfo=timezone.utc)
-        try:
-            processed = value
-            if processed.endswith("Z"):
-                processed = processed[:-1] + "+00:00"
-            dt = datetime.fromisoformat(processed)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            try:
-                dt = datetime.strptime(value, "%Y-%m-%d")
-                return dt.replace(tzinfo=timezone.utc)
-            except Exception:
-                return datetime.min.replace(tzinfo=timezone.utc)
+            return _EPOCH_MIN
+        return _parse_iso_timestamp(value)
 
     def _run_timestamp(self, run: Dict[str, Any]) -> datetime:
         submitted = run.get("submitted")
@@ -532,30 +676,28 @@ class SRCLeaderboardCog(commands.Cog):
         date_only = run.get("date")
         if date_only:
             return self._parse_timestamp(date_only)
-        return datetime.min.replace(tzinfo=timezone.utc)
+        return _EPOCH_MIN
 
     def _format_timestamp_field(self, raw: Optional[str]) -> Optional[str]:
         if not raw:
             return None
-        dt = self._parse_timestamp(raw)
-        if dt == datetime.min.replace(tzinfo=timezone.utc):
-            return raw
-        month_name = dt.strftime("%B")
-        display = f"{month_name} {dt.day}, {dt.year}"
-        unix = int(dt.timestamp())
-        return f"{display} • <t:{unix}:t>"
-
-    async def _rejected_pages(self, game_id: str, category_id: Optional[str], page_size: int, max_pages: Optional[int], sort_order: str) -> Tuple[List[List[Dict[str, Any]]], int]:
+        return _format_timestamp(raw)
+
+    async def _rejected_pages(self, game_id: str, category_id: Optional[str], page_size: int, max_pages: Optional[int], sort_order: str) -> Tuple[List[List[Dict[str, Any]]], int, Dict[str, str]]:
         max_runs = None if sort_order == "oldest" else (page_size * max_pages if max_pages is not None else None)
         runs = await self.src_get_rejected_runs(game_id, category_id, sort_order=sort_order, max_runs=max_runs)
         reverse = sort_order != "oldest"
         runs.sort(key=self._run_timestamp, reverse=reverse)
         if max_pages is not None:
             runs = runs[: page_size * max_pages]
+        lookup: Dict[str, str] = {}
+        for run in runs:
+            self._build_player_lookup(run.get("players"), lookup)
+            self._build_player_lookup(run.get("examiner"), lookup)
         pages: List[List[Dict[str, Any]]] = []
         for i in range(0, len(runs), page_size):
             pages.append(runs[i : i + page_size])
-        return pages, len(pages)
+        return pages, len(pages), lookup
 
     @leaderboard_group.command(name="view")
     @app_commands.describe(game="Game", category="Category", pages="How many pages to include (all if omitted)")
@@ -606,19 +748,11 @@ class SRCLeaderboardCog(commands.Cog):
             base_index = (page_index - 1) * items_per_page
             for idx, run in enumerate(entries, start=1):
                 pos = base_index + idx
-                t = run.get("times", {}).get("primary_t")
-                time_s = format_duration(t)
+                summary = run["_summary"]
                 date = run.get("date") or run.get("submitted") or "?"
-                vs = run.get("videos", {})
-                link = None
-                if isinstance(vs, dict):
-                    links = vs.get("links") or []
-                    if links:
-                        link = links[0].get("uri")
-                players = ", ".join(self._players_from_run(run, lookup))
-                parts = [f"#{pos}", time_s, players, date]
-                if link:
-                    parts.insert(3, f"[Video]({link})")
+                parts = [f"#{pos}", summary.time_str, summary.players_str, date]
+                if summary.video_uri:
+                    parts.insert(3, f"[Video]({summary.video_uri})")
                 lines.append(" | ".join(parts))
             if not lines:
                 lines = ["No runs found."]
@@ -626,8 +760,7 @@ class SRCLeaderboardCog(commands.Cog):
             embed.set_footer(text=f"Page {page_index}/{total_pages}")
             return embed, total_pages
 
-        categories_payload = [{"id": cat_id, "name": cat_map[cat_id].get("name")} for cat_id in ordered_ids]
-        categories_payload.sort(key=lambda item: (item.get("id") != current_category))
+        categories_payload = sorted(self._categories_payload(game, cats), key=lambda item: (item.get("id") != current_category))
         embed, total_pages = await make_embed(1)
         view = LeaderboardView(
             interaction.user.id,
@@ -654,20 +787,17 @@ class SRCLeaderboardCog(commands.Cog):
         )
         cats = await self.src_get_game_categories_cached(game)
         cat_map: Dict[str, Dict[str, Any]] = {}
-        ordered_ids: List[str] = []
         for c in cats:
             cat_id = c.get("id")
             if not cat_id:
                 continue
-            cat_id = str(cat_id)
-            cat_map[cat_id] = c
-            ordered_ids.append(cat_id)
+            cat_map[str(cat_id)] = c
         current_category = category if category in cat_map else None
 
         sort_order = sort or "newest"
-        cache: Dict[str, Tuple[List[List[Dict[str, Any]]], int]] = {}
+        cache: Dict[str, Tuple[List[List[Dict[str, Any]]], int, Dict[str, str]]] = {}
 
-        async def fetch_pages(cat_id: Optional[str]) -> Tuple[List[List[Dict[str, Any]]], int]:
+        async def fetch_pages(cat_id: Optional[str]) -> Tuple[List[List[Dict[str, Any]]], int, Dict[str, str]]:
             key = f"{cat_id or ALL_CATEGORIES_VALUE}:{sort_order}:{page_limit or 'all'}"
             if key not in cache:
                 cache[key] = await self._rejected_pages(game, cat_id, items_per_page, page_limit, sort_order)
@@ -681,7 +811,7 @@ class SRCLeaderboardCog(commands.Cog):
                 current_category = new_cid
 
         async def make_embed(page_index: int):
-            pages_data, cached_total = await fetch_pages(current_category)
+            pages_data, cached_total, lookup = await fetch_pages(current_category)
             total_pages = cached_total or len(pages_data) or 1
             page_index = max(1, min(page_index, total_pages))
             entries = pages_data[page_index - 1] if pages_data else []
@@ -694,8 +824,7 @@ class SRCLeaderboardCog(commands.Cog):
                 embed.description = "No rejected runs found."
             else:
                 run = entries[0]
-                t = format_duration(run.get("times", {}).get("primary_t"))
-                pl = ", ".join(self._players_from_run(run))
+                summary = self._run_summary(run, lookup, cat_map)
                 st = run.get("status", {})
                 reason = st.get("reason") or "No reason provided"
                 examiner_name = "?"
@@ -721,6 +850,8 @@ class SRCLeaderboardCog(commands.Cog):
                 examiner_id = None
                 if isinstance(st, dict):
                     examiner_id = st.get("examiner")
+                if examiner_name == "?" and examiner_id:
+                    examiner_name = lookup.get(str(examiner_id), examiner_name)
                 if examiner_name == "?" and examiner_id:
                     cached_user = await self.src_get_user_cached(examiner_id)
                     if cached_user:
@@ -731,45 +862,25 @@ class SRCLeaderboardCog(commands.Cog):
                         )
                 if examiner_name == "?" and examiner_id:
                     examiner_name = str(examiner_id)
-                vs = run.get("videos", {})
-                v = None
-                if isinstance(vs, dict):
-                    links = vs.get("links") or []
-                    if links:
-                        v = links[0].get("uri")
                 submitted_raw = run.get("submitted") or run.get("date")
                 submitted_value = self._format_timestamp_field(submitted_raw) or "?"
                 rejected_raw = st.get("verify-date") if isinstance(st, dict) else None
                 rejected_value = self._format_timestamp_field(rejected_raw)
                 embed.add_field(name="Rejection Reason", value=reason, inline=False)
-                embed.add_field(name="Time", value=t, inline=True)
-                embed.add_field(name="Players", value=pl, inline=True)
+                embed.add_field(name="Time", value=summary.time_str, inline=True)
+                embed.add_field(name="Players", value=summary.players_str, inline=True)
                 embed.add_field(name="Examiner", value=examiner_name, inline=True)
                 embed.add_field(name="Submitted", value=submitted_value, inline=True)
                 if rejected_value:
                     embed.add_field(name="Rejected", value=rejected_value, inline=True)
-                if v:
-                    embed.add_field(name="Videos", value=v, inline=False)
-                category_name = None
-                cat_payload = run.get("category")
-                if isinstance(cat_payload, dict):
-                    category_name = (
-                        cat_payload.get("data", {}).get("name")
-                        or cat_payload.get("name")
-                    )
-                if not category_name:
-                    cat_id = run.get("category")
-                    if isinstance(cat_id, dict):
-                        category_name = cat_id.get("name")
-                    elif isinstance(cat_id, str):
-                        category_name = cat_map.get(cat_id, {}).get("name")
-                if category_name:
-                    embed.add_field(name="Category", value=category_name, inline=True)
+                if summary.video_uri:
+                    embed.add_field(name="Videos", value=summary.video_uri, inline=False)
+                if summary.category_name:
+                    embed.add_field(name="Category", value=summary.category_name, inline=True)
             embed.set_footer(text=f"Page {page_index}/{total_pages}")
             return embed, total_pages
 
-        actual_categories = [{"id": cat_id, "name": cat_map[cat_id].get("name")} for cat_id in ordered_ids]
-        actual_categories.sort(key=lambda item: (item.get("id") != current_category))
+        actual_categories = sorted(self._categories_payload(game, cats), key=lambda item: (item.get("id") != current_category))
         categories_payload = [{"id": ALL_CATEGORIES_VALUE, "name": "All Categories"}] + actual_categories
         embed, total_pages = await make_embed(1)
         view = LeaderboardView(
@@ -794,9 +905,10 @@ class SRCLeaderboardCog(commands.Cog):
         if not isinstance(target_channel, discord.abc.GuildChannel) or target_channel.guild != interaction.guild:
             await interaction.followup.send("Select a channel from this server.", ephemeral=True)
             return
-        cats = await self.src_get_game_categories_cached(game)
-        if category is not None and category not in {c.get("id") for c in cats}:
-            category = None
+        if category is not None:
+            cats = await self.src_get_game_categories_cached(game)
+            if not any(c.get("id") == category for c in cats):
+                category = None
         watcher = {
             "guild_id": interaction.guild.id,
             "channel_id": target_channel.id,
@@ -804,17 +916,16 @@ class SRCLeaderboardCog(commands.Cog):
             "game_id": game,
             "category_id": category,
             "last_checked": datetime.now(timezone.utc).isoformat(),
-            "last_seen_ids": [],
+            "last_seen_ids": set(),
         }
-        replaced = False
-        for i, w in enumerate(self._watchers):
-            if w.get("guild_id") == watcher["guild_id"] and w.get("channel_id") == watcher["channel_id"] and w.get("game_id") == watcher["game_id"] and w.get("category_id") == watcher["category_id"]:
-                self._watchers[i] = watcher
-                replaced = True
-                break
-        if not replaced:
+        key = self._watcher_key(watcher)
+        idx = self._watchers_index.get(key)
+        if idx is not None:
+            self._watchers[idx] = watcher
+        else:
+            self._watchers_index[key] = len(self._watchers)
             self._watchers.append(watcher)
-        self._save_watchers()
+        await self._save_watchers()
         await interaction.followup.send("Notifications configured.", ephemeral=True)
 
     @leaderboard_group.command(name="utils-edit")
@@ -829,88 +940,117 @@ class SRCLeaderboardCog(commands.Cog):
         if not isinstance(target_channel, discord.abc.GuildChannel) or target_channel.guild != interaction.guild:
             await interaction.followup.send("Select a channel from this server.", ephemeral=True)
             return
-        found = False
-        for w in self._watchers:
-            if w.get("guild_id") == interaction.guild.id and w.get("channel_id") == target_channel.id and w.get("game_id") == game and w.get("category_id") == category:
-                w["role_id"] = role.id
-                found = True
-                break
-        if not found:
+        idx = self._watchers_index.get((interaction.guild.id, target_channel.id, game, category))
+        if idx is None:
             await interaction.followup.send("No existing watcher to edit for this channel/game/category.", ephemeral=True)
             return
-        self._save_watchers()
+        self._watchers[idx]["role_id"] = role.id
+        await self._save_watchers()
         await interaction.followup.send("Updated.", ephemeral=True)
 
     async def _watch_loop(self):
         await self.client.wait_until_ready()
+        idle_multiplier = 1
         while not self.client.is_closed():
             try:
-                await self._tick_watchers()
+                announced = await self._tick_watchers()
             except asyncio.CancelledError:
                 break
             except Exception:
-                pass
-            await asyncio.sleep(30)
-
-    async def _tick_watchers(self):
+                announced = False
+            if announced:
+                idle_multiplier = 1
+            await asyncio.sleep(WATCH_INTERVAL_SECONDS * idle_multiplier)
+            if not announced:
+                idle_multiplier = min(idle_multiplier * 2, WATCH_MAX_IDLE_MULTIPLIER)
+
+    async def _tick_watchers(self) -> bool:
         if not self._watchers:
-            return
-        for w in list(self._watchers):
+            return False
+        groups: Dict[Tuple[str, Optional[str]], List[Tuple[Dict[str, Any], Any]]] = {}
+        for w in self._watchers:
             guild = self.client.get_guild(int(w.get("guild_id")))
             if not guild:
                 continue
             channel = guild.get_channel(int(w.get("channel_id")))
             if channel is None:
                 continue
-            role_id = w.get("role_id")
-            game_id = w.get("game_id")
-            category_id = w.get("category_id")
-            new_runs = await self._fetch_new_runs(game_id, category_id, w.get("last_seen_ids") or [])
+            groups.setdefault((w.get("game_id"), w.get("category_id")), []).append((w, channel))
+        for key in set(self._pending_runs_cache) - set(groups):
+            del self._pending_runs_cache[key]
+        results = await asyncio.gather(
+            *(self._collect_new_runs(game_id, category_id, members) for (game_id, category_id), members in groups.items()),
+            return_exceptions=True,
+        )
+        pending = [item for result in results if not isinstance(result, BaseException) for item in result]
+        if not pending:
+            return False
+        await self._save_watchers(w for w, _, _ in pending if self._is_current_watcher(w))
+        batches: Dict[Tuple[int, Optional[str]], Tuple[Any, List[Dict[str, Any]]]] = {}
+        for w, channel, new_runs in pending:
+            content = self._role_content(w.get("role_id"))
+            batches.setdefault((channel.id, content), (channel, []))[1].extend(new_runs)
+        await asyncio.gather(
+            *(self._announce_new_runs(channel, content, runs) for (_, content), (channel, runs) in batches.items()),
+            return_exceptions=True,
+        )
+        return True
+
+    async def _collect_new_runs(self, game_id: str, category_id: Optional[str], members: List[Tuple[Dict[str, Any], Any]]) -> List[Tuple[Dict[str, Any], Any, List[Dict[str, Any]]]]:
+        runs = await self._fetch_pending_runs(game_id, category_id)
+        out = []
+        for w, channel in members:
+            seen_ids = w.get("last_seen_ids") or set()
+            new_runs = self._new_runs(runs, seen_ids)
             if not new_runs:
                 continue
-            w["last_seen_ids"] = [r.get("id") for r in new_runs[:50]]
-            self._save_watchers()
-            role_mention = f"<@&{role_id}>" if role_id else ""
-            for run in new_runs:
-                await self._announce_new_run(channel, role_mention, run)
+            seen_ids = seen_ids | {r.get("id") for r in new_runs}
+            if len(seen_ids) > SEEN_IDS_LIMIT:
+                seen_ids &= {r.get("id") for r in runs}
+            w["last_seen_ids"] = seen_ids
+            out.append((w, channel, new_runs))
+        return out
 
-    async def _fetch_new_runs(self, game_id: str, category_id: Optional[str], seen_ids: List[str]) -> List[Dict[str, Any]]:
+    async def _fetch_pending_runs(self, game_id: str, category_id: Optional[str]) -> List[Dict[str, Any]]:
         p = {"game": game_id, "status": "new", "max": 100, "embed": "players,category"}
         if category_id:
             p["category"] = category_id
-        data = await self.src_get("runs", params=p)
-        runs = data.get("data", [])
-        fresh = []
-        for r in runs:
-            rid = r.get("id")
-            if not rid or rid in seen_ids:
-                continue
-            fresh.append(r)
-        return list(reversed(fresh))
-
-    async def _announce_new_run(self, channel: discord.abc.Messageable, role_mention: str, run: Dict[str, Any]):
-        t = format_duration(run.get("times", {}).get("primary_t"))
-        pl = ", ".join(self._players_from_run(run))
-        cat = None
-        cat_data = run.get("category")
-        if isinstance(cat_data, dict):
-            cat = cat_data.get("data", {}).get("name")
-        if not cat:
-            cat = "Unknown Category"
-        vs = run.get("videos", {})
-        v = None
-        if isinstance(vs, dict):
-            links = vs.get("links") or []
-            if links:
-                v = links[0].get("uri")
+        key = (game_id, category_id)
+        cached = self._pending_runs_cache.get(key)
+        data, etag = await self._src_request("runs", params=p, etag=cached[0] if cached else None)
+        if data is None and cached:
+            return cached[1]
+        runs = (data or {}).get("data", [])
+        if etag:
+            self._pending_runs_cache[key] = (etag, runs)
+        else:
+            self._pending_runs_cache.pop(key, None)
+        return runs
+
+    def _new_runs(self, runs: List[Dict[str, Any]], seen_ids: Set[str]) -> List[Dict[str, Any]]:
+        fresh = [r for r in runs if (rid := r.get("id")) and rid not in seen_ids]
+        return fresh[::-1]
+
+    def _build_run_embed(self, run: Dict[str, Any]) -> discord.Embed:
+        summary = self._run_summary(run)
+        cat = summary.category_name or "Unknown Category"
         embed = discord.Embed(title=f"New Run Submitted - {cat}", colour=discord.Colour.green())
-        embed.add_field(name="Players", value=pl, inline=False)
-        embed.add_field(name="Time", value=t, inline=True)
-        if v:
-            embed.add_field(name="Videos", value=v, inline=False)
+        embed.add_field(name="Players", value=summary.players_str, inline=False)
+        embed.add_field(name="Time", value=summary.time_str, inline=True)
+        if summary.video_uri:
+            embed.add_field(name="Videos", value=summary.video_uri, inline=False)
         embed.timestamp = datetime.now(timezone.utc)
-        content = role_mention if role_mention else None
-        await channel.send(content=content, embed=embed)
+        return embed
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _role_content(role_id: Optional[int]) -> Optional[str]:
+        return f"<@&{role_id}>" if role_id else None
+
+    async def _announce_new_runs(self, channel: discord.abc.Messageable, content: Optional[str], runs: List[Dict[str, Any]]):
+        for i in range(0, len(runs), ANNOUNCE_EMBEDS_PER_MESSAGE):
+            embeds = [self._build_run_embed(run) for run in runs[i : i + ANNOUNCE_EMBEDS_PER_MESSAGE]]
+            await channel.send(content=content, embeds=embeds)
 
 
 async def setup(client: commands.Bot) -> None:
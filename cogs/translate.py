@@ -4,6 +4,27 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+
+class _CipherTable(dict):
+    def __init__(self, cipher_map):
+        super().__init__()
+        self.cipher_map = cipher_map
+        for char, cipher in cipher_map.items():
+            self[ord(char)] = cipher
+            self[ord(char.upper())] = cipher
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char.isalpha():
+            value = self.cipher_map.get(char.lower())
+        elif char.isspace():
+            value = char
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
 class TranslateCog(commands.Cog):
     translate_group = app_commands.Group(name="translate", description="Translate between machine cipher and plain text.")
     app_commands.allowed_installs(guilds=True, users=True)(translate_group)
@@ -35,6 +56,9 @@ class TranslateCog(commands.Cog):
 
     cipher_map = {chr(i): f":MachineCipher{chr(i).upper()}:" for i in range(97, 123)}
     reverse_cipher_map = {v: k for k, v in cipher_map.items()}
+    _cipher_letters = frozenset(cipher_map)
+    _TRANSLATE_TABLE = _CipherTable(cipher_map)
+    _EMOTE_RE = re.compile(r'<a?:MachineCipher([A-Z]):\d+>')
 
     async def cog_load(self):
         self.client.tree.add_command(self.translate_to_english_context, override=True)
@@ -50,22 +74,16 @@ class TranslateCog(commands.Cog):
             type=self.translate_to_cipher_context.type,
         )
 
+    @staticmethod
+    def _as_discord_file(text, filename="translation.txt"):
+        return discord.File(fp=io.BytesIO(text.encode("utf-8")), filename=filename)
+
     def to_plain_text(self, cipher_message):
-        emote_pattern = r'<a?:MachineCipher([A-Z]):\d+>'
-        translated_message = re.sub(emote_pattern, lambda m: self.reverse_cipher_map[f":MachineCipher{m.group(1)}:"], cipher_message)
-        return translated_message
+        return self._EMOTE_RE.sub(lambda m: self.reverse_cipher_map[f":MachineCipher{m.group(1)}:"], cipher_message)
 
     def to_machine_cipher(self, plain_text):
-        translated_chars = []
-        for char in plain_text:
-            if char.isalpha():
-                lower_char = char.lower()
-                if lower_char in self.cipher_map:
-                    translated_chars.append(self.cipher_map[lower_char])
-            elif char.isspace():
-                translated_chars.append(char)
-        return ''.join(translated_chars)
-    
+        return plain_text.translate(self._TRANSLATE_TABLE)
+
     @translate_group.command(name="to-english", description="Translates machine cipher text to plain text.")
     async def translate_to_english(self, interaction: discord.Interaction, cipher_text: str, ephemeral: bool = False):
         if not cipher_text:
@@ -75,10 +93,7 @@ class TranslateCog(commands.Cog):
         translated_message = self.to_plain_text(cipher_text)
         if len(translated_message) > 2000:
             await interaction.response.send_message(
-                file=discord.File(
-                    fp=io.BytesIO(translated_message.encode("utf-8")),
-                    filename="translation.txt",
-                ),
+                file=self._as_discord_file(translated_message),
                 ephemeral=ephemeral,
             )
             return
@@ -94,10 +109,7 @@ class TranslateCog(commands.Cog):
         translated_message = self.to_machine_cipher(plain_text)
         if len(translated_message) > 2000:
             await interaction.response.send_message(
-                file=discord.File(
-                    fp=io.BytesIO(translated_message.encode("utf-8")),
-                    filename="translation.txt",
-                ),
+                file=self._as_discord_file(translated_message),
                 ephemeral=ephemeral,
             )
             return
@@ -109,17 +121,14 @@ class TranslateCog(commands.Cog):
             await interaction.response.send_message("That message doesn't have any text to translate.", ephemeral=True)
             return
 
-        if not re.search(r"<a?:MachineCipher([A-Z]):\d+>", message.content):
+        if not self._EMOTE_RE.search(message.content):
             await interaction.response.send_message("I couldn't find any machine cipher text in that message.", ephemeral=True)
             return
 
         translated_message = self.to_plain_text(message.content)
         if len(translated_message) > 2000:
             await interaction.response.send_message(
-                file=discord.File(
-                    fp=io.BytesIO(translated_message.encode("utf-8")),
-                    filename="translation.txt",
-                ),
+                file=self._as_discord_file(translated_message),
                 ephemeral=True,
             )
             return
@@ -131,7 +140,7 @@ class TranslateCog(commands.Cog):
             await interaction.response.send_message("That message doesn't have any text to translate.", ephemeral=True)
             return
 
-        if not any(char.lower() in self.cipher_map for char in message.content):
+        if set(message.content.lower()).isdisjoint(self._cipher_letters):
             await interaction.response.send_message("I couldn't find any characters to convert to machine cipher.", ephemeral=True)
             return
 
@@ -142,10 +151,7 @@ class TranslateCog(commands.Cog):
 
         if len(translated_message) > 2000:
             await interaction.response.send_message(
-                file=discord.File(
-                    fp=io.BytesIO(translated_message.encode("utf-8")),
-                    filename="translation.txt",
-                ),
+                file=self._as_discord_file(translated_message),
                 ephemeral=True,
             )
             return
@@ -4,8 +4,6 @@ from discord.ext import commands, tasks
 from discord import app_commands
 from dotenv import load_dotenv
 import os
-import random
-import datetime
 import time
 import platform
 import csv
@@ -13,11 +11,11 @@ import csv
 load_dotenv()
 
 TOKEN = os.getenv('TOKEN')
+STATUS_PHRASE = "keep being strange.... but dont be a stranger"
 
 class Client(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix=commands.when_mentioned_or('.'), intents=discord.Intents().all())
-        self.token_expiry = datetime.datetime.utcnow()
         self.cogslist = [
             "cogs.bapnboard",
             "cogs.translate",
@@ -38,9 +36,7 @@ class Client(commands.Bot):
 
     @tasks.loop(seconds=60)
     async def status_task(self):
-        phrases = ["keep being strange.... but dont be a stranger"]
-        new_status = random.choice(phrases)
-        await self.change_presence(activity=discord.Game(name=new_status))
+        await self.change_presence(activity=discord.Game(name=STATUS_PHRASE))
 
 client = Client()
 